@@ -4,21 +4,44 @@ import argparse
 import os
 import re
 import sys
+import time
 from dataclasses import replace
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 
-from . import __version__
-from .config import Config, ConfigError
+from . import __version__, http
+from .config import VALID_SOURCES, Config, ConfigError, Topic
 from .db import Database, Paper
+from .fetch import FetchJob, group_by_topic, run_fetch_jobs
 from .notifier import create_notifier
 from .rank import rank_papers
 from .report import generate_report
 from .sources import fetch_arxiv, fetch_biorxiv, fetch_medrxiv, fetch_pubmed
+from .sources.arxiv_oai import ArxivOAIStore, fetch_arxiv_oai
 from .sources.collect_podcasts import PodcastEpisode, collect_podcasts
 from .sources.collect_trials import ClinicalTrial, collect_trials
 from .sources.collect_youtube import YouTubeVideo, collect_youtube
-from .summarize import load_prompt_template, summarize_paper, summarize_trial
+from .sources.query import QueryRouter, matches_query, parse_query_groups
+from .sources.rxiv_mirror import RxivMirror
+from .summarize import (
+    PAPER_MAX_TOKENS,
+    TRIAL_MAX_TOKENS,
+    batch_ended,
+    batch_request,
+    batch_results,
+    cache_summary,
+    cached_summary,
+    load_prompt_template,
+    load_trial_prompt_template,
+    format_usage,
+    paper_context,
+    submit_batch,
+    summarize_papers,
+    summarize_trials,
+    trial_context,
+)
+from .summary_cache import request_key
 
 # Map source names to fetcher functions
 SOURCE_FETCHERS = {
@@ -266,6 +289,13 @@ def cmd_doctor(args: argparse.Namespace) -> int:
     else:
         log.info("[--] YOUTUBE_API_KEY not set (optional, for YouTube collection)")
 
+    # Check NCBI API key (optional, raises PubMed rate limit)
+    ncbi_key = os.environ.get("NCBI_API_KEY")
+    if ncbi_key:
+        log.info(f"[OK] NCBI_API_KEY set ({len(ncbi_key)} chars)")
+    else:
+        log.info("[--] NCBI_API_KEY not set (optional, raises PubMed rate limit)")
+
     # Check config file
     config_path = get_config_path(args.config)
     if config_path and Path(config_path).exists():
@@ -318,6 +348,289 @@ def cmd_doctor(args: argparse.Namespace) -> int:
         return 0
 
 
+def backfill_topic(db: Database, topic: Topic, since: datetime) -> list[Paper]:
+    """
+    Attach stored papers matching a new topic's query and exclusions.
+
+    Papers fetched earlier for other topics (from this topic's sources and
+    published since ``since``) are linked to the topic and returned with any
+    existing summary, so they are neither fetched nor summarized again.
+    """
+    # Field tags such as [tiab] only mean something to PubMed
+    query_groups = parse_query_groups(re.sub(r"\[\w+\]", "", topic.query))
+    matches = [
+        replace(paper, topic=topic.name)
+        for paper in db.papers_published_since(since, topic.sources)
+        if matches_query(f"{paper.title} {paper.abstract}", query_groups)
+        and not any(term.lower() in paper.title.lower() for term in topic.exclude)
+    ]
+    return db.add_papers(matches)
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    """Search the local paper corpus."""
+    log = Logger(NORMAL)
+
+    config_path = get_config_path(args.config)
+    if not config_path:
+        log.error("No config file specified. Use --config or set LITSCOUT_CONFIG.")
+        return 1
+
+    db_path = Path(config_path).parent / "litscout.db"
+    if not db_path.exists():
+        log.error(f"Database not found: {db_path} (run 'litscout run' first)")
+        return 1
+
+    db = Database(db_path)
+    start = time.perf_counter()
+    try:
+        papers = db.search(
+            args.query,
+            topic=args.topic,
+            source=args.source,
+            since=args.since,
+            until=args.until,
+            limit=args.limit,
+        )
+    except ValueError as e:
+        log.error(str(e))
+        return 1
+    finally:
+        db.close()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for i, paper in enumerate(papers, 1):
+        log.info(f"{i}. {paper.title}")
+        details = [paper.source, paper.published_date or "n.d.", f"seen {paper.first_seen[:10]}"]
+        log.info(f"   {' | '.join(details)}")
+        if paper.url:
+            log.info(f"   {paper.url}")
+    log.info(f"{len(papers)} result(s) in {elapsed_ms:.0f} ms")
+    return 0
+
+
+def cmd_summarize(args: argparse.Namespace) -> int:
+    """Retry summaries that failed in earlier runs."""
+    log = Logger(NORMAL)
+
+    config_path = get_config_path(args.config)
+    if not config_path:
+        log.error("No config file specified. Use --config or set LITSCOUT_CONFIG.")
+        return 1
+
+    try:
+        config = Config.from_yaml(config_path)
+    except ConfigError as e:
+        log.error(f"Configuration error: {e}")
+        return 1
+
+    db_path = Path(config_path).parent / "litscout.db"
+    if not db_path.exists():
+        log.error(f"Database not found: {db_path} (run 'litscout run' first)")
+        return 1
+
+    db = Database(db_path)
+    try:
+        # A manual retry ignores backoff deadlines
+        papers = db.pending_summary_papers(due_only=False)
+        if not papers:
+            log.info("No failed summaries to retry")
+            return 0
+        if not os.environ.get("ANTHROPIC_API_KEY"):
+            log.error("ANTHROPIC_API_KEY not set")
+            return 1
+        prompt_template = load_prompt_template(Path(config_path).parent.parent / "prompts" / "summary.md")
+        summarize_all(db, papers, [], prompt_template, config.summarize.max_workers, log)
+    finally:
+        db.close()
+
+    summarized = sum(1 for paper in papers if paper.summary)
+    log.info(f"Summarized {summarized} of {len(papers)} papers")
+    return 0 if summarized == len(papers) else 1
+
+
+def group_unsummarized(
+    db: Database, papers: list[Paper], trials: list[ClinicalTrial]
+) -> tuple[dict[str, list[Paper]], dict[str, list[ClinicalTrial]]]:
+    """
+    Group papers by ID and trials by NCT ID, so an item selected by several
+    topics is summarized once. Trials with a stored summary get it here and
+    are left out.
+    """
+    papers_by_id: dict[str, list[Paper]] = {}
+    for paper in papers:
+        papers_by_id.setdefault(paper.id, []).append(paper)
+
+    stored = db.trial_summaries(t.nct_id for t in trials)
+    trials_by_id: dict[str, list[ClinicalTrial]] = {}
+    for trial in trials:
+        if trial.nct_id in stored:
+            trial.relevance_summary = stored[trial.nct_id]
+        else:
+            trials_by_id.setdefault(trial.nct_id, []).append(trial)
+    return papers_by_id, trials_by_id
+
+
+def summarize_all(
+    db: Database,
+    papers: list[Paper],
+    trials: list[ClinicalTrial],
+    prompt_template: str,
+    max_workers: int,
+    log: Logger,
+) -> None:
+    """
+    Summarize papers and trials over one worker pool, storing each summary
+    as soon as it completes. Papers that fail are queued for a retry; trials
+    are summarized again whenever they are next collected.
+    """
+    papers_by_id, trials_by_id = group_unsummarized(db, papers, trials)
+
+    def paper_failed(paper: Paper, e: Exception) -> None:
+        log.warning(f"Error summarizing {paper.title[:50]}: {e}")
+        if not db.queue_summary_retry(paper.id, str(e)):
+            log.warning(f"Giving up on summarizing {paper.title[:50]} after repeated failures")
+
+    log.info(f"Summarizing {len(papers_by_id)} papers and {len(trials_by_id)} trials...")
+    unique_papers = [same[0] for same in papers_by_id.values()]
+    for done, (paper, summary) in enumerate(
+        summarize_papers(
+            unique_papers,
+            prompt_template,
+            max_workers,
+            on_error=paper_failed,
+        ),
+        start=1,
+    ):
+        log.verbose(f"[{done}/{len(unique_papers)}] Summarized: {paper.title[:50]}...")
+        for same in papers_by_id[paper.id]:
+            same.summary = summary
+        try:
+            db.update_summary(paper.id, summary)
+        except Exception as e:
+            log.warning(f"Error saving summary: {e}")
+
+    unique_trials = [same[0] for same in trials_by_id.values()]
+    for trial, summary in summarize_trials(
+        unique_trials,
+        max_workers=max_workers,
+        on_error=lambda trial, e: log.warning(f"Error summarizing trial {trial.nct_id}: {e}"),
+    ):
+        log.verbose(f"Summarized trial: {trial.nct_id}")
+        for same in trials_by_id[trial.nct_id]:
+            same.relevance_summary = summary
+        try:
+            db.update_trial_summary(trial.nct_id, summary)
+        except Exception as e:
+            log.warning(f"Error saving trial summary: {e}")
+    log.info("")
+
+
+def batch_summarize_all(
+    db: Database,
+    papers: list[Paper],
+    trials: list[ClinicalTrial],
+    prompt_template: str,
+    log: Logger,
+    client=None,
+) -> None:
+    """
+    Submit every pending paper and trial summary as one Message Batch.
+    Cached summaries are applied at once; the batch ID is stored, and a
+    later run writes its results back once it has ended. Items already in
+    a stored batch are not submitted again.
+    """
+    papers_by_id, trials_by_id = group_unsummarized(db, papers, trials)
+    in_flight = db.pending_batch_items()
+
+    requests: list[dict] = []
+    items: list[tuple[str, str, str, str]] = []
+    reused = 0
+
+    def add_request(kind: str, item_id: str, template: str, context: str, max_tokens: int) -> None:
+        nonlocal reused
+        if (kind, item_id) in in_flight:
+            return
+        request = batch_request(f"{kind}-{len(items)}", template, context, max_tokens)
+        key = request_key(request["params"])
+        summary = cached_summary(key)
+        if summary is not None:
+            apply_summary(db, kind, item_id, summary, papers_by_id, trials_by_id)
+            reused += 1
+            return
+        requests.append(request)
+        items.append((request["custom_id"], kind, item_id, key))
+
+    for paper_id, same in papers_by_id.items():
+        add_request("paper", paper_id, prompt_template, paper_context(same[0]), PAPER_MAX_TOKENS)
+    trial_template = load_trial_prompt_template()
+    for nct_id, same in trials_by_id.items():
+        add_request("trial", nct_id, trial_template, trial_context(same[0]), TRIAL_MAX_TOKENS)
+
+    if reused:
+        log.info(f"Reused {reused} cached summaries")
+    if requests:
+        batch_id = submit_batch(requests, client)
+        db.add_summary_batch(batch_id, items)
+        log.info(f"Submitted summary batch {batch_id} ({len(requests)} requests)")
+    log.info("")
+
+
+def apply_summary(
+    db: Database,
+    kind: str,
+    item_id: str,
+    summary: str,
+    papers_by_id: dict[str, list[Paper]],
+    trials_by_id: dict[str, list[ClinicalTrial]],
+) -> None:
+    """Store a paper or trial summary and set it on this run's copies."""
+    if kind == "paper":
+        db.update_summary(item_id, summary)
+        for paper in papers_by_id.get(item_id, []):
+            paper.summary = summary
+    else:
+        db.update_trial_summary(item_id, summary)
+        for trial in trials_by_id.get(item_id, []):
+            trial.relevance_summary = summary
+
+
+def collect_summary_batches(
+    db: Database,
+    log: Logger,
+    papers_by_id: dict[str, list[Paper]] | None = None,
+    trials_by_id: dict[str, list[ClinicalTrial]] | None = None,
+    client=None,
+) -> None:
+    """
+    Write back the results of stored summary batches that have ended.
+    Batches still processing are left for the next run.
+    """
+    papers_by_id = papers_by_id or {}
+    trials_by_id = trials_by_id or {}
+    for batch_id in db.pending_summary_batches():
+        if not batch_ended(batch_id, client):
+            log.info(f"Summary batch {batch_id} still processing; collecting next run")
+            continue
+
+        items = db.summary_batch_items(batch_id)
+        collected = 0
+        for custom_id, summary in batch_results(batch_id, client):
+            if custom_id not in items:
+                continue
+            kind, item_id, key = items[custom_id]
+            if summary is None:
+                if kind == "paper" and not db.queue_summary_retry(item_id, "batch request failed"):
+                    log.warning(f"Giving up on summarizing {item_id} after repeated failures")
+                continue
+            if key:
+                cache_summary(key, summary)
+            apply_summary(db, kind, item_id, summary, papers_by_id, trials_by_id)
+            collected += 1
+        db.finish_summary_batch(batch_id)
+        log.info(f"Collected {collected} summaries from batch {batch_id}")
+
+
 def cmd_run(
     config_path: str,
     dry_run: bool = False,
@@ -326,6 +639,7 @@ def cmd_run(
     email_to: str | None = None,
     email_attach: bool | None = None,
     verbosity: int = NORMAL,
+    batch_summarize: bool = False,
 ) -> int:
     """Run the literature search pipeline."""
     log = Logger(verbosity)
@@ -364,6 +678,57 @@ def cmd_run(
     db_path = config_dir / "litscout.db"
     db = Database(db_path)
 
+    # Write back summary batches from earlier runs that have since ended, so
+    # their papers are stored with summaries before this run fetches
+    if db.pending_summary_batches():
+        try:
+            collect_summary_batches(db, log)
+        except Exception as e:
+            log.warning(f"Collecting summary batches failed: {e}")
+
+    # Shared bioRxiv/medRxiv mirror: each preprint is downloaded once per run,
+    # and the router matches each record against all topics in one scan
+    mirror = RxivMirror(config_dir / "rxiv_mirror.db")
+    router = QueryRouter(
+        {
+            t.name: t.query
+            for t in config.topics
+            if {"biorxiv", "medrxiv"} & set(t.sources)
+        }
+    )
+    fetchers = dict(SOURCE_FETCHERS)
+    fetchers["pubmed"] = partial(fetch_pubmed, known_papers=db.papers_by_pmid)
+    if config.fetch.pubmed_two_phase:
+        topic_excludes = {t.name: t.exclude for t in config.topics}
+
+        def fetch_pubmed_two_phase(query, topic, since):
+            return fetch_pubmed(
+                query,
+                topic,
+                since,
+                known_papers=db.papers_by_pmid,
+                two_phase_top_k=config.top_k_per_topic,
+                exclude=topic_excludes.get(topic, []),
+            )
+
+        fetchers["pubmed"] = fetch_pubmed_two_phase
+
+    # Category-scoped topics harvest arXiv via OAI-PMH into a local store
+    topic_categories = {t.name: t.arxiv_categories for t in config.topics if t.arxiv_categories}
+    if topic_categories:
+        oai_store = ArxivOAIStore(config_dir / "arxiv_oai.db")
+
+        def fetch_arxiv_for_topic(query, topic, since):
+            if topic in topic_categories:
+                return fetch_arxiv_oai(
+                    query, topic, since, categories=topic_categories[topic], store=oai_store
+                )
+            return fetch_arxiv(query, topic, since)
+
+        fetchers["arxiv"] = fetch_arxiv_for_topic
+    fetchers["biorxiv"] = partial(fetch_biorxiv, mirror=mirror, router=router)
+    fetchers["medrxiv"] = partial(fetch_medrxiv, mirror=mirror, router=router)
+
     # Load prompt template
     prompt_path = config_dir.parent / "prompts" / "summary.md"
     prompt_template = load_prompt_template(prompt_path)
@@ -372,6 +737,8 @@ def cmd_run(
     podcasts_by_topic: dict[str, list[PodcastEpisode]] = {}
     videos_by_topic: dict[str, list[YouTubeVideo]] = {}
     trials_by_topic: dict[str, list[ClinicalTrial]] = {}
+    unsummarized: list[Paper] = []
+    unsummarized_trials: list[ClinicalTrial] = []
     now = datetime.now()
 
     # Check for last report timestamp (for lookback on manual runs)
@@ -385,13 +752,14 @@ def cmd_run(
     log.info(f"Topics: {len(config.topics)}")
     log.info("")
 
+    # Plan one fetch job per (topic, source) pair
+    jobs: list[FetchJob] = []
+    new_topics: set[str] = set()
     for topic in config.topics:
-        log.info(f"Processing topic: {topic.name}")
-        topic_papers: list[Paper] = []
-
+        if all(db.get_last_run(topic.name, source) is None for source in topic.sources):
+            new_topics.add(topic.name)
         for source in topic.sources:
-            fetcher = SOURCE_FETCHERS.get(source)
-            if not fetcher:
+            if source not in SOURCE_FETCHERS:
                 log.warning(f"Unknown source: {source}, skipping")
                 continue
 
@@ -402,40 +770,62 @@ def cmd_run(
             last_run = db.get_last_run(topic.name, source)
             if last_run:
                 since = last_run
-                log.verbose(f"{source}: incremental from {since.strftime('%Y-%m-%d')}")
+                log.verbose(f"{topic.name} / {source}: incremental from {since.strftime('%Y-%m-%d')}")
             elif last_report_time:
                 since = last_report_time
-                log.verbose(f"{source}: from last report ({since.strftime('%Y-%m-%d %H:%M')})")
+                log.verbose(f"{topic.name} / {source}: from last report ({since.strftime('%Y-%m-%d %H:%M')})")
             else:
                 since = now - timedelta(days=config.initial_lookback_days)
-                log.verbose(f"{source}: initial lookback ({config.initial_lookback_days} days)")
+                log.verbose(f"{topic.name} / {source}: initial lookback ({config.initial_lookback_days} days)")
 
-            # Fetch papers
-            try:
-                new_papers = list(fetcher(topic.query, topic.name, since))
-                log.verbose(f"{source}: found {len(new_papers)} papers")
-            except Exception as e:
-                log.warning(f"Error fetching from {source}: {e}")
+            jobs.append(FetchJob(topic=topic.name, source=source, query=topic.query, since=since))
+
+    # Fetch all pairs concurrently; results come back in job (topic) order
+    log.info(f"Fetching {len(jobs)} topic/source pairs...")
+    log.info("")
+    results_by_topic = group_by_topic(
+        run_fetch_jobs(
+            jobs,
+            fetchers,
+            max_workers=config.fetch.max_workers,
+            source_concurrency=config.fetch.concurrency,
+        )
+    )
+
+    for topic in config.topics:
+        log.info(f"Processing topic: {topic.name}")
+        topic_papers: list[Paper] = []
+
+        # A new topic starts from matching papers already in the local
+        # corpus; the live fetch only adds what is not stored yet
+        if topic.name in new_topics:
+            backfill_since = now - timedelta(days=config.initial_lookback_days)
+            linked = backfill_topic(db, topic, backfill_since)
+            topic_papers.extend(linked)
+            log.verbose(f"local corpus: linked {len(linked)} stored papers")
+
+        for result in results_by_topic.get(topic.name, []):
+            source = result.job.source
+            if result.error is not None:
+                log.warning(f"Error fetching from {source}: {result.error}")
                 continue
 
-            # Filter exclusions and dedupe
-            added = 0
-            for paper in new_papers:
-                # Check exclusions
-                skip = False
-                for exclude_term in topic.exclude:
-                    if exclude_term.lower() in paper.title.lower():
-                        skip = True
-                        break
-                if skip:
-                    continue
-
-                # Add to database (deduplication happens here)
-                if db.add_paper(paper):
-                    topic_papers.append(paper)
-                    added += 1
-
-            log.verbose(f"{source}: added {added} new papers")
+            new_papers = result.papers
+            log.verbose(f"{source}: found {len(new_papers)} papers")
+
+            # Filter exclusions
+            kept = [
+                paper
+                for paper in new_papers
+                if not any(term.lower() in paper.title.lower() for term in topic.exclude)
+            ]
+
+            # Add to database in one batch (deduplication happens here);
+            # papers stored under another topic come back with their summary
+            added = db.add_papers(kept)
+            topic_papers.extend(added)
+
+            log.verbose(f"{source}: added {len(added)} new papers to topic")
 
             # Update last run timestamp
             if not dry_run:
@@ -446,17 +836,8 @@ def cmd_run(
             top_papers = rank_papers(topic_papers, config.top_k_per_topic)
             log.info(f"  Selected top {len(top_papers)} papers")
 
-            # Summarize papers
             if not no_summarize:
-                for paper in top_papers:
-                    if not paper.summary:
-                        log.verbose(f"Summarizing: {paper.title[:50]}...")
-                        try:
-                            summary = summarize_paper(paper, prompt_template)
-                            paper.summary = summary
-                            db.update_summary(paper.id, summary)
-                        except Exception as e:
-                            log.warning(f"Error summarizing: {e}")
+                unsummarized.extend(p for p in top_papers if not p.summary)
 
             papers_by_topic[topic.name] = top_papers
         else:
@@ -489,15 +870,8 @@ def cmd_run(
                 log.verbose("Collecting clinical trials...")
                 cache_dir = config_dir / ".cache" / "ctgov"
                 trials = collect_trials(topic.query, topic.media.trials, cache_dir)
-                # Optionally summarize trials
                 if not no_summarize:
-                    for trial in trials:
-                        if not trial.relevance_summary:
-                            log.verbose(f"Summarizing trial: {trial.nct_id}...")
-                            try:
-                                trial.relevance_summary = summarize_trial(trial)
-                            except Exception as e:
-                                log.warning(f"Error summarizing trial: {e}")
+                    unsummarized_trials.extend(t for t in trials if not t.relevance_summary)
                 trials_by_topic[topic.name] = trials
                 log.info(f"  Found {len(trials)} clinical trials")
             except Exception as e:
@@ -506,6 +880,37 @@ def cmd_run(
 
         log.info("")
 
+    # Papers whose summary failed in earlier runs join this run's stage
+    # once their backoff has passed
+    if not no_summarize:
+        retries = db.pending_summary_papers()
+        if retries:
+            log.verbose(f"Retrying {len(retries)} failed summaries")
+            unsummarized.extend(retries)
+
+    # Summarize every topic's selections in one stage
+    if batch_summarize and not no_summarize:
+        try:
+            batch_summarize_all(db, unsummarized, unsummarized_trials, prompt_template, log)
+        except Exception as e:
+            log.warning(f"Batch summarization failed: {e}")
+    elif unsummarized or unsummarized_trials:
+        summarize_all(
+            db, unsummarized, unsummarized_trials, prompt_template, config.summarize.max_workers, log
+        )
+
+    db.close()
+
+    # Network usage per host
+    log.verbose("HTTP usage:")
+    for line in http.format_stats():
+        log.verbose(f"  {line}")
+    usage = format_usage()
+    if usage:
+        log.info("Claude usage:")
+        for line in usage:
+            log.info(f"  {line}")
+
     # Generate report
     if not dry_run:
         # Find docs directory for MkDocs publishing (if it exists)
@@ -550,6 +955,8 @@ Examples:
   litscout init --path ./my-project    Initialize a new project
   litscout run --config config.yaml    Run literature search
   litscout doctor                      Check configuration
+  litscout search "trem2 AND microglia" --since 2025-07-01
+                                       Search previously fetched papers
 
 Environment variables:
   LITSCOUT_CONFIG    Default config file path
@@ -598,6 +1005,14 @@ Environment variables:
         action="store_true",
         help="Skip Claude summarization (faster, for testing)",
     )
+    run_parser.add_argument(
+        "--batch-summarize",
+        action="store_true",
+        help=(
+            "Summarize through the Message Batches API (cheaper, slower; "
+            "results are written back by the next run once the batch ends)"
+        ),
+    )
     run_parser.add_argument(
         "--verbose",
         "-v",
@@ -658,6 +1073,64 @@ Environment variables:
         help="Path to config.yaml to check",
     )
 
+    # Search command
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Search previously fetched papers",
+        description=(
+            "Full-text search over the local paper database (titles, abstracts, "
+            'authors, summaries). Supports AND, OR, NOT, "phrases" and prefix*.'
+        ),
+    )
+    search_parser.add_argument("query", help="Search query")
+    search_parser.add_argument(
+        "--config",
+        "-c",
+        help="Path to config.yaml (or set LITSCOUT_CONFIG)",
+    )
+    search_parser.add_argument("--topic", "-t", help="Only papers in this topic")
+    search_parser.add_argument(
+        "--source",
+        "-s",
+        choices=sorted(VALID_SOURCES),
+        help="Only papers from this source",
+    )
+    search_parser.add_argument(
+        "--since",
+        metavar="YYYY-MM-DD",
+        help="Only papers first seen on or after this date",
+    )
+    search_parser.add_argument(
+        "--until",
+        metavar="YYYY-MM-DD",
+        help="Only papers first seen on or before this date",
+    )
+    search_parser.add_argument(
+        "--limit",
+        "-n",
+        type=int,
+        default=20,
+        help="Maximum results (default: 20)",
+    )
+
+    # Summarize command
+    summarize_parser = subparsers.add_parser(
+        "summarize",
+        help="Retry failed summaries",
+        description="Summarize papers whose summaries failed in earlier runs.",
+    )
+    summarize_parser.add_argument(
+        "--retry",
+        action="store_true",
+        required=True,
+        help="Retry every queued summary now, ignoring backoff",
+    )
+    summarize_parser.add_argument(
+        "--config",
+        "-c",
+        help="Path to config.yaml (or set LITSCOUT_CONFIG)",
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -671,6 +1144,12 @@ Environment variables:
         elif args.command == "doctor":
             return cmd_doctor(args)
 
+        elif args.command == "search":
+            return cmd_search(args)
+
+        elif args.command == "summarize":
+            return cmd_summarize(args)
+
         elif args.command == "run":
             # Determine verbosity
             if args.quiet:
@@ -691,6 +1170,7 @@ Environment variables:
                 email_to=args.email_to,
                 email_attach=args.email_attach,
                 verbosity=verbosity,
+                batch_summarize=args.batch_summarize,
             )
 
     except KeyboardInterrupt:
@@ -1,11 +1,15 @@
 """Configuration loader for LitScout."""
 
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
 
+from .fetch import DEFAULT_MAX_WORKERS
+from .summarize import DEFAULT_WORKERS
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid."""
@@ -15,6 +19,17 @@ class ConfigError(Exception):
 
 VALID_SOURCES = {"pubmed", "arxiv", "biorxiv", "medrxiv"}
 
+# arXiv archive or archive.subject category, e.g. "hep-th", "q-bio.NC"
+ARXIV_CATEGORY_RE = re.compile(r"^[a-z][a-z-]*(\.[A-Za-z-]+)?$")
+
+# Default number of concurrent fetches per source
+DEFAULT_SOURCE_CONCURRENCY = {
+    "pubmed": 2,
+    "arxiv": 1,
+    "biorxiv": 2,
+    "medrxiv": 2,
+}
+
 # Default shows/channels to favor
 DEFAULT_PODCAST_SHOWS = [
     "Biotech 2050",
@@ -149,6 +164,7 @@ class Topic:
     sources: list[str]
     exclude: list[str] = field(default_factory=list)
     media: MediaConfig = field(default_factory=MediaConfig)
+    arxiv_categories: list[str] = field(default_factory=list)  # Harvest via OAI-PMH
 
 
 @dataclass
@@ -169,6 +185,24 @@ class NotificationsConfig:
     email: EmailConfig = field(default_factory=EmailConfig)
 
 
+@dataclass
+class FetchConfig:
+    """Settings for the fetch stage."""
+
+    max_workers: int = DEFAULT_MAX_WORKERS
+    concurrency: dict[str, int] = field(
+        default_factory=lambda: dict(DEFAULT_SOURCE_CONCURRENCY)
+    )
+    pubmed_two_phase: bool = False  # Rank ESummary records before EFetch
+
+
+@dataclass
+class SummarizeConfig:
+    """Settings for the summarization stage."""
+
+    max_workers: int = DEFAULT_WORKERS  # Concurrent Claude requests (paced by API rate limits)
+
+
 @dataclass
 class Config:
     """Main configuration for LitScout."""
@@ -178,6 +212,8 @@ class Config:
     initial_lookback_days: int
     topics: list[Topic]
     notifications: NotificationsConfig
+    fetch: FetchConfig = field(default_factory=FetchConfig)
+    summarize: SummarizeConfig = field(default_factory=SummarizeConfig)
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "Config":
@@ -225,6 +261,15 @@ class Config:
                     f"Valid sources: {', '.join(sorted(VALID_SOURCES))}"
                 )
 
+            arxiv_categories = t.get("arxiv_categories") or []
+            if not isinstance(arxiv_categories, list) or not all(
+                isinstance(c, str) and ARXIV_CATEGORY_RE.match(c) for c in arxiv_categories
+            ):
+                raise ConfigError(
+                    f"Topic '{t['name']}': arxiv_categories must be a list of arXiv "
+                    f"categories such as q-bio.NC or cs.LG"
+                )
+
             # Parse media config
             media_data = t.get("media", {})
             media_config = _parse_media_config(media_data, t["name"])
@@ -236,6 +281,7 @@ class Config:
                     sources=sources,
                     exclude=t.get("exclude", []),
                     media=media_config,
+                    arxiv_categories=arxiv_categories,
                 )
             )
 
@@ -268,15 +314,66 @@ class Config:
         if email.enabled and not email.to:
             raise ConfigError("Email notifications enabled but 'to' address is empty")
 
+        fetch = _parse_fetch_config(data.get("fetch") or {})
+        summarize = _parse_summarize_config(data.get("summarize") or {})
+
         return cls(
             output_dir=output_dir,
             top_k_per_topic=top_k,
             initial_lookback_days=lookback,
             topics=topics,
             notifications=NotificationsConfig(email=email),
+            fetch=fetch,
+            summarize=summarize,
         )
 
 
+def _parse_fetch_config(fetch_data: dict) -> FetchConfig:
+    """Parse fetch stage configuration."""
+    if not isinstance(fetch_data, dict):
+        raise ConfigError("fetch must be a dictionary")
+
+    max_workers = fetch_data.get("max_workers", DEFAULT_MAX_WORKERS)
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ConfigError("fetch.max_workers must be a positive integer")
+
+    concurrency = dict(DEFAULT_SOURCE_CONCURRENCY)
+    overrides = fetch_data.get("concurrency") or {}
+    if not isinstance(overrides, dict):
+        raise ConfigError("fetch.concurrency must map source names to integers")
+    for source, limit in overrides.items():
+        if source not in VALID_SOURCES:
+            raise ConfigError(
+                f"fetch.concurrency: invalid source '{source}'. "
+                f"Valid sources: {', '.join(sorted(VALID_SOURCES))}"
+            )
+        if not isinstance(limit, int) or limit < 1:
+            raise ConfigError(f"fetch.concurrency.{source} must be a positive integer")
+        concurrency[source] = limit
+
+    pubmed_two_phase = fetch_data.get("pubmed_two_phase", False)
+    if not isinstance(pubmed_two_phase, bool):
+        raise ConfigError("fetch.pubmed_two_phase must be true or false")
+
+    return FetchConfig(
+        max_workers=max_workers,
+        concurrency=concurrency,
+        pubmed_two_phase=pubmed_two_phase,
+    )
+
+
+def _parse_summarize_config(summarize_data: dict) -> SummarizeConfig:
+    """Parse summarization stage configuration."""
+    if not isinstance(summarize_data, dict):
+        raise ConfigError("summarize must be a dictionary")
+
+    max_workers = summarize_data.get("max_workers", DEFAULT_WORKERS)
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ConfigError("summarize.max_workers must be a positive integer")
+
+    return SummarizeConfig(max_workers=max_workers)
+
+
 def _parse_media_config(media_data: dict, topic_name: str) -> MediaConfig:
     """Parse media configuration for a topic."""
     podcasts_data = media_data.get("podcasts", {})
@@ -1,12 +1,17 @@
 """SQLite database for tracking seen papers and run state."""
 
+import hashlib
 import re
 import sqlite3
+import threading
+from array import array
 from contextlib import contextmanager
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
+
+from . import minhash
 
 
 @dataclass
@@ -22,14 +27,73 @@ class Paper:
     url: str
     source: str  # pubmed, arxiv, biorxiv, medrxiv
     published_date: str
-    topic: str
+    topic: str  # Topic first found under; see paper_topics for all
     first_seen: str
     summary: str | None = None
+    pmid: str | None = None
+
+
+# Maximum bound parameters per bulk lookup query
+SQL_CHUNK_SIZE = 500
+
+# Schema version recorded in PRAGMA user_version
+SCHEMA_VERSION = 8
+
+# bm25 column weights for search: title, abstract, authors, summary
+SEARCH_WEIGHTS = (10.0, 1.0, 3.0, 2.0)
+
+# Titles shorter than this (in words) are too generic to dedupe on alone
+MIN_TITLE_IDENTIFIER_WORDS = 5
+
+# Columns written by add_papers, in Paper field order
+PAPER_COLUMNS = (
+    "id",
+    "doi",
+    "arxiv_id",
+    "title",
+    "authors",
+    "abstract",
+    "url",
+    "source",
+    "published_date",
+    "topic",
+    "first_seen",
+    "summary",
+    "pmid",
+)
+
+# Paper columns for SELECTs from papers aliased p (docid is internal)
+PAPER_SELECT = ", ".join(f"p.{column}" for column in PAPER_COLUMNS)
 
+# Connection tuning: WAL lets readers run alongside the writer, and with
+# synchronous=NORMAL commits no longer fsync (only checkpoints do).
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",  # 16 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Prepared statements kept per connection
+CACHED_STATEMENTS = 256
+
+# Failed summaries are retried after RETRY_BASE_MINUTES, doubling per
+# attempt up to RETRY_MAX_HOURS, and dropped from the queue after
+# MAX_SUMMARY_ATTEMPTS
+RETRY_BASE_MINUTES = 15
+RETRY_MAX_HOURS = 24
+MAX_SUMMARY_ATTEMPTS = 8
+
+# Prefix of the error text older versions stored in place of a summary
+FAILED_SUMMARY_PREFIX = "(Summary unavailable"
 
 SCHEMA = """
+-- docid is an explicit rowid alias, so VACUUM cannot renumber the rows
+-- papers_fts points at
 CREATE TABLE IF NOT EXISTS papers (
-    id TEXT PRIMARY KEY,
+    docid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
     doi TEXT,
     arxiv_id TEXT,
     title TEXT NOT NULL,
@@ -40,19 +104,107 @@ CREATE TABLE IF NOT EXISTS papers (
     published_date TEXT,
     topic TEXT NOT NULL,
     first_seen TEXT NOT NULL,
-    summary TEXT
+    summary TEXT,
+    pmid TEXT
 );
 
 CREATE INDEX IF NOT EXISTS idx_papers_topic ON papers(topic);
 CREATE INDEX IF NOT EXISTS idx_papers_doi ON papers(doi);
 CREATE INDEX IF NOT EXISTS idx_papers_arxiv_id ON papers(arxiv_id);
 
+CREATE TABLE IF NOT EXISTS paper_identifiers (
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    paper_id TEXT NOT NULL,
+    PRIMARY KEY (kind, value)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_paper_identifiers_paper ON paper_identifiers(paper_id);
+
+CREATE TABLE IF NOT EXISTS paper_minhash (
+    paper_id TEXT PRIMARY KEY,
+    signature BLOB NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS paper_lsh (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    paper_id TEXT NOT NULL,
+    PRIMARY KEY (band, bucket, paper_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS paper_topics (
+    paper_id TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    added_at TEXT NOT NULL,
+    PRIMARY KEY (paper_id, topic)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_paper_topics_topic ON paper_topics(topic);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+    title, abstract, authors, summary,
+    content='papers', content_rowid='docid',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS papers_fts_insert AFTER INSERT ON papers BEGIN
+    INSERT INTO papers_fts (rowid, title, abstract, authors, summary)
+    VALUES (new.docid, new.title, new.abstract, new.authors, new.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS papers_fts_delete AFTER DELETE ON papers BEGIN
+    INSERT INTO papers_fts (papers_fts, rowid, title, abstract, authors, summary)
+    VALUES ('delete', old.docid, old.title, old.abstract, old.authors, old.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS papers_fts_update
+AFTER UPDATE OF title, abstract, authors, summary ON papers BEGIN
+    INSERT INTO papers_fts (papers_fts, rowid, title, abstract, authors, summary)
+    VALUES ('delete', old.docid, old.title, old.abstract, old.authors, old.summary);
+    INSERT INTO papers_fts (rowid, title, abstract, authors, summary)
+    VALUES (new.docid, new.title, new.abstract, new.authors, new.summary);
+END;
+
 CREATE TABLE IF NOT EXISTS run_state (
     topic TEXT NOT NULL,
     source TEXT NOT NULL,
     last_run TEXT NOT NULL,
     PRIMARY KEY (topic, source)
 );
+
+-- Message Batches submitted for summarization; completed_at stays NULL
+-- until the results have been written back
+CREATE TABLE IF NOT EXISTS summary_batches (
+    batch_id TEXT PRIMARY KEY,
+    submitted_at TEXT NOT NULL,
+    completed_at TEXT
+);
+
+-- What each request in a batch summarizes (kind is 'paper' or 'trial'),
+-- and its key in the shared summary cache
+CREATE TABLE IF NOT EXISTS summary_batch_items (
+    batch_id TEXT NOT NULL,
+    custom_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    cache_key TEXT,
+    PRIMARY KEY (batch_id, custom_id)
+) WITHOUT ROWID;
+
+-- Papers whose summary failed, waiting for a retry
+CREATE TABLE IF NOT EXISTS pending_summaries (
+    paper_id TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    last_error TEXT,
+    next_attempt_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS trial_summaries (
+    nct_id TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
 """
 
 
@@ -62,21 +214,195 @@ class Database:
     def __init__(self, db_path: Path | str):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection per thread, all closed by close()
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_schema()
+        self._load_seen()
+
+    def _load_seen(self) -> None:
+        """
+        Load every stored paper ID and identifier into memory.
+
+        Steady-state runs mostly re-fetch papers already stored, so "seen"
+        answers come from these sets. They only ever grow, so a miss may be
+        stale (e.g. another process wrote since) and falls through to SQLite.
+        """
+        with self._connect() as conn:
+            self._seen_ids = {row[0] for row in conn.execute("SELECT id FROM papers")}
+            self._seen_identifiers = {
+                _identifier_key(row[0], row[1])
+                for row in conn.execute("SELECT kind, value FROM paper_identifiers")
+            }
+            self._seen_memberships = {
+                (row[0], row[1]) for row in conn.execute("SELECT paper_id, topic FROM paper_topics")
+            }
 
     def _init_schema(self) -> None:
         with self._connect() as conn:
             conn.executescript(SCHEMA)
+            self._migrate(conn)
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Bring databases created by older versions up to the current schema."""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(papers)")}
+        if "pmid" not in columns:
+            conn.execute("ALTER TABLE papers ADD COLUMN pmid TEXT")
+        if "docid" not in columns:
+            self._add_docid(conn)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_pmid ON papers(pmid)")
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(summary_batch_items)")}
+        if "cache_key" not in columns:
+            conn.execute("ALTER TABLE summary_batch_items ADD COLUMN cache_key TEXT")
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # Index the identifiers of papers stored before paper_identifiers
+            rows = conn.execute(
+                "SELECT id, doi, arxiv_id, pmid, title FROM papers ORDER BY first_seen"
+            ).fetchall()
+            conn.executemany(
+                "INSERT OR IGNORE INTO paper_identifiers (kind, value, paper_id) VALUES (?, ?, ?)",
+                [
+                    (kind, value, row["id"])
+                    for row in rows
+                    for kind, value in paper_identifiers(
+                        row["doi"], row["arxiv_id"], row["pmid"], row["title"]
+                    )
+                ],
+            )
+        if version < 2:
+            # Sign papers stored before near-duplicate detection
+            rows = conn.execute("SELECT id, title, abstract FROM papers").fetchall()
+            signatures = []
+            for row in rows:
+                sig = minhash.paper_signature(row["title"], row["abstract"])
+                if sig is not None:
+                    signatures.append((row["id"], sig))
+            self._store_signatures(conn, signatures)
+        if version < 3:
+            # Each stored paper belongs to the topic it was first found under
+            conn.execute(
+                """INSERT OR IGNORE INTO paper_topics (paper_id, topic, added_at)
+                   SELECT id, topic, first_seen FROM papers"""
+            )
+        if version < 4:
+            # Index papers stored before full-text search
+            conn.execute("INSERT INTO papers_fts (papers_fts) VALUES ('rebuild')")
+        if version < 5:
+            # Queue papers whose stored summary is an API error message
+            now = datetime.now().isoformat()
+            conn.execute(
+                """INSERT OR IGNORE INTO pending_summaries
+                       (paper_id, attempts, last_error, next_attempt_at)
+                   SELECT id, 1, summary, ? FROM papers WHERE summary LIKE ? || '%'""",
+                (now, FAILED_SUMMARY_PREFIX),
+            )
+            conn.execute(
+                "UPDATE papers SET summary = NULL WHERE summary LIKE ? || '%'",
+                (FAILED_SUMMARY_PREFIX,),
+            )
+        if version < 6:
+            # Drop signatures of papers without a substantial abstract, which
+            # earlier versions signed from the title alone
+            rows = conn.execute(
+                """SELECT p.id, p.abstract FROM paper_minhash m
+                   JOIN papers p ON p.id = m.paper_id"""
+            ).fetchall()
+            unsigned = [
+                row["id"]
+                for row in rows
+                if len(minhash.shingles(row["abstract"] or "")) < minhash.MIN_ABSTRACT_SHINGLES
+            ]
+            for start in range(0, len(unsigned), SQL_CHUNK_SIZE):
+                chunk = unsigned[start : start + SQL_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                conn.execute(f"DELETE FROM paper_minhash WHERE paper_id IN ({placeholders})", chunk)
+                conn.execute(f"DELETE FROM paper_lsh WHERE paper_id IN ({placeholders})", chunk)
+        if version < 8:
+            # Drop papers that earlier versions kept queued past the limit
+            conn.execute(
+                "DELETE FROM pending_summaries WHERE attempts >= ?", (MAX_SUMMARY_ATTEMPTS,)
+            )
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _add_docid(self, conn: sqlite3.Connection) -> None:
+        """Rebuild papers with an explicit docid, keeping rowids, and reindex it."""
+        columns = ", ".join(PAPER_COLUMNS)
+        # One transaction, so an interrupted rebuild leaves the old table
+        conn.execute("BEGIN IMMEDIATE")
+        # Drop the old table's indexes and triggers and the FTS index so the
+        # schema recreates them for the new table
+        for kind, name in conn.execute(
+            """SELECT type, name FROM sqlite_master
+               WHERE tbl_name = 'papers' AND type IN ('index', 'trigger') AND sql IS NOT NULL"""
+        ).fetchall():
+            conn.execute(f"DROP {kind.upper()} {name}")
+        conn.execute("DROP TABLE IF EXISTS papers_fts")
+        conn.execute("ALTER TABLE papers RENAME TO papers_old")
+        # executescript would commit, so run the schema statement by statement
+        for statement in _schema_statements():
+            conn.execute(statement)
+        conn.execute(
+            f"""INSERT INTO papers (docid, {columns})
+                SELECT rowid, {columns} FROM papers_old ORDER BY rowid"""
+        )
+        conn.execute("DROP TABLE papers_old")
+        conn.execute("INSERT INTO papers_fts (papers_fts) VALUES ('rebuild')")
+        conn.commit()
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening and tuning it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=30,
+                cached_statements=CACHED_STATEMENTS,
+                check_same_thread=False,  # Only so close() can run from any thread
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
 
     @contextmanager
-    def _connect(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _connect(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        Use this thread's connection, committing when the outermost block
+        exits cleanly and rolling back if it raises.
+
+        ``write`` takes the write lock up front (BEGIN IMMEDIATE), for blocks
+        that read before writing: a deferred transaction could not upgrade
+        once another connection has committed in the meantime.
+        """
+        conn = self._thread_connection()
+        if write and self._local.depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        self._local.depth += 1
         try:
             yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.rollback()
+            raise
+        self._local.depth -= 1
+        if self._local.depth == 0:
             conn.commit()
-        finally:
+
+    def close(self) -> None:
+        """Close every connection opened by this database."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
             conn.close()
+        self._local = threading.local()
 
     def get_last_run(self, topic: str, source: str) -> datetime | None:
         """Get the last run timestamp for a topic/source pair."""
@@ -100,6 +426,8 @@ class Database:
 
     def paper_exists(self, paper_id: str) -> bool:
         """Check if a paper has already been seen."""
+        if paper_id in self._seen_ids:
+            return True
         with self._connect() as conn:
             row = conn.execute(
                 "SELECT 1 FROM papers WHERE id = ?", (paper_id,)
@@ -108,44 +436,430 @@ class Database:
 
     def add_paper(self, paper: Paper) -> bool:
         """Add a paper if it doesn't exist. Returns True if added."""
-        if self.paper_exists(paper.id):
-            return False
-        with self._connect() as conn:
+        return bool(self.add_papers([paper]))
+
+    def add_papers(self, papers: Iterable[Paper]) -> list[Paper]:
+        """
+        Add papers in one transaction and record their topic memberships.
+
+        A paper is a duplicate if any of its identifiers (DOI, arXiv ID, PMID,
+        normalized title) already belongs to a stored paper or an earlier one
+        in the batch, or if its MinHash signature is a near match for one
+        found through the LSH band index. Its identifiers are then linked to
+        that canonical record. New papers are staged with executemany into a
+        temporary table and copied with a single INSERT ... ON CONFLICT DO
+        NOTHING RETURNING id.
+
+        Returns, in input order, the papers that are new to their topic: newly
+        stored papers as given, and for duplicates not yet in that topic the
+        stored record (with any summary), so it is never fetched or
+        summarized twice.
+        """
+        # Papers already stored, with every identifier known and already in
+        # their topic, are plain repeats and need no database work
+        papers = [paper for paper in papers if not self._is_repeat(paper)]
+        if not papers:
+            return []
+        columns = ", ".join(PAPER_COLUMNS)
+        placeholders = ", ".join("?" * len(PAPER_COLUMNS))
+        now = datetime.now().isoformat()
+        with self._connect(write=True) as conn:
+            # Resolve every paper to a canonical ID
+            resolved: dict[tuple[str, str], str] = {}
+            canonicals: list[str] = []
+            fresh: list[Paper] = []
+            signatures: list[tuple[str, array]] = []
+            batch_buckets: dict[tuple[int, int], list[tuple[str, array]]] = {}
+            for paper in papers:
+                identifiers = paper_identifiers(paper.doi, paper.arxiv_id, paper.pmid, paper.title)
+                canonical = self._resolve(conn, identifiers, resolved)
+                sig = None
+                if canonical is None:
+                    sig = minhash.paper_signature(paper.title, paper.abstract)
+                    if sig is not None:
+                        canonical = self._resolve_near(conn, sig, batch_buckets)
+                if canonical is None:
+                    canonical = paper.id
+                    fresh.append(paper)
+                    if sig is not None:
+                        signatures.append((paper.id, sig))
+                        for key in minhash.band_keys(sig):
+                            batch_buckets.setdefault(key, []).append((paper.id, sig))
+                for identifier in identifiers:
+                    resolved.setdefault(identifier, canonical)
+                canonicals.append(canonical)
+
             conn.execute(
-                """INSERT INTO papers
-                   (id, doi, arxiv_id, title, authors, abstract, url, source,
-                    published_date, topic, first_seen, summary)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    paper.id,
-                    paper.doi,
-                    paper.arxiv_id,
-                    paper.title,
-                    paper.authors,
-                    paper.abstract,
-                    paper.url,
-                    paper.source,
-                    paper.published_date,
-                    paper.topic,
-                    paper.first_seen,
-                    paper.summary,
-                ),
+                f"""CREATE TEMP TABLE IF NOT EXISTS papers_batch AS
+                    SELECT 0 AS seq, {columns} FROM papers WHERE 0"""
             )
-        return True
+            conn.execute("DELETE FROM papers_batch")
+            conn.executemany(
+                f"INSERT INTO papers_batch (seq, {columns}) VALUES (?, {placeholders})",
+                [
+                    (seq, *(getattr(paper, column) for column in PAPER_COLUMNS))
+                    for seq, paper in enumerate(fresh)
+                ],
+            )
+            # WHERE true disambiguates ON CONFLICT after INSERT ... SELECT
+            rows = conn.execute(
+                f"""INSERT INTO papers ({columns})
+                    SELECT {columns} FROM papers_batch WHERE true ORDER BY seq
+                    ON CONFLICT DO NOTHING
+                    RETURNING id"""
+            ).fetchall()
+            conn.execute("DELETE FROM papers_batch")
+
+            conn.executemany(
+                "INSERT OR IGNORE INTO paper_identifiers (kind, value, paper_id) VALUES (?, ?, ?)",
+                [(kind, value, paper_id) for (kind, value), paper_id in resolved.items()],
+            )
+            self._store_signatures(conn, signatures)
+
+            # Attach each paper to its topic; stored papers new to the topic
+            # come back as their stored record
+            added_ids = {row["id"] for row in rows}
+            added: list[Paper] = []
+            for paper, canonical in zip(papers, canonicals):
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO paper_topics (paper_id, topic, added_at) VALUES (?, ?, ?)",
+                    (canonical, paper.topic, now),
+                )
+                if not cursor.rowcount:
+                    continue
+                if canonical in added_ids and canonical == paper.id:
+                    added.append(paper)
+                    added_ids.discard(canonical)
+                else:
+                    row = conn.execute(
+                        f"SELECT {PAPER_SELECT} FROM papers p WHERE p.id = ?", (canonical,)
+                    ).fetchone()
+                    added.append(replace(Paper(**dict(row)), topic=paper.topic))
+
+        self._seen_ids.update(paper.id for paper in fresh)
+        self._seen_identifiers.update(_identifier_key(kind, value) for kind, value in resolved)
+        self._seen_memberships.update(
+            (canonical, paper.topic) for paper, canonical in zip(papers, canonicals)
+        )
+        return added
+
+    def papers_by_pmid(self, pmids: Iterable[str]) -> dict[str, Paper]:
+        """Get the stored papers for any already-known PMIDs, keyed by PMID."""
+        known = self.known_pmids(pmids)
+        if not known:
+            return {}
+        found: dict[str, Paper] = {}
+        known = list(known)
+        with self._connect() as conn:
+            for i in range(0, len(known), SQL_CHUNK_SIZE):
+                chunk = known[i : i + SQL_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""SELECT i.value AS lookup_pmid, {PAPER_SELECT} FROM paper_identifiers i
+                        JOIN papers p ON p.id = i.paper_id
+                        WHERE i.kind = 'pmid' AND i.value IN ({placeholders})""",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    data = dict(row)
+                    pmid = data.pop("lookup_pmid")
+                    found[pmid] = Paper(**data)
+        return found
+
+    def _is_repeat(self, paper: Paper) -> bool:
+        """Check in memory whether a paper and all its identifiers are known."""
+        if paper.id not in self._seen_ids:
+            return False
+        if (paper.id, paper.topic) not in self._seen_memberships:
+            return False
+        identifiers = paper_identifiers(paper.doi, paper.arxiv_id, paper.pmid, paper.title)
+        return all(
+            _identifier_key(kind, value) in self._seen_identifiers for kind, value in identifiers
+        )
+
+    def _resolve(
+        self,
+        conn: sqlite3.Connection,
+        identifiers: list[tuple[str, str]],
+        pending: dict[tuple[str, str], str],
+    ) -> str | None:
+        """Find the canonical paper ID for any of the given identifiers."""
+        for identifier in identifiers:
+            if identifier in pending:
+                return pending[identifier]
+            row = conn.execute(
+                "SELECT paper_id FROM paper_identifiers WHERE kind = ? AND value = ?",
+                identifier,
+            ).fetchone()
+            if row:
+                return row["paper_id"]
+        return None
+
+    def _resolve_near(
+        self,
+        conn: sqlite3.Connection,
+        sig: array,
+        pending: dict[tuple[int, int], list[tuple[str, array]]],
+    ) -> str | None:
+        """Find the most similar stored or pending paper above the MinHash threshold."""
+        candidates: dict[str, array] = {}
+        for band, bucket in minhash.band_keys(sig):
+            for paper_id, other in pending.get((band, bucket), []):
+                candidates.setdefault(paper_id, other)
+            rows = conn.execute(
+                """SELECT l.paper_id, m.signature FROM paper_lsh l
+                   JOIN paper_minhash m ON m.paper_id = l.paper_id
+                   WHERE l.band = ? AND l.bucket = ?""",
+                (band, bucket),
+            ).fetchall()
+            for row in rows:
+                if row["paper_id"] not in candidates:
+                    candidates[row["paper_id"]] = minhash.from_blob(row["signature"])
+
+        best_id, best_score = None, minhash.THRESHOLD
+        for paper_id, other in candidates.items():
+            score = minhash.similarity(sig, other)
+            if score >= best_score:
+                best_id, best_score = paper_id, score
+        return best_id
+
+    def _store_signatures(
+        self, conn: sqlite3.Connection, signatures: list[tuple[str, array]]
+    ) -> None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO paper_minhash (paper_id, signature) VALUES (?, ?)",
+            [(paper_id, minhash.to_blob(sig)) for paper_id, sig in signatures],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO paper_lsh (band, bucket, paper_id) VALUES (?, ?, ?)",
+            [
+                (band, bucket, paper_id)
+                for paper_id, sig in signatures
+                for band, bucket in minhash.band_keys(sig)
+            ],
+        )
+
+    def known_pmids(self, pmids: Iterable[str]) -> set[str]:
+        """Get the subset of PMIDs that are already stored, in bulk."""
+        known: set[str] = set()
+        unknown: list[str] = []
+        for pmid in pmids:
+            if _identifier_key("pmid", pmid) in self._seen_identifiers:
+                known.add(pmid)
+            else:
+                unknown.append(pmid)
+        if not unknown:
+            return known
+        pmids = unknown
+        with self._connect() as conn:
+            for i in range(0, len(pmids), SQL_CHUNK_SIZE):
+                chunk = pmids[i : i + SQL_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""SELECT value FROM paper_identifiers
+                        WHERE kind = 'pmid' AND value IN ({placeholders})""",
+                    chunk,
+                ).fetchall()
+                known.update(row["value"] for row in rows)
+        return known
+
+    def search(
+        self,
+        query: str,
+        topic: str | None = None,
+        source: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 20,
+    ) -> list[Paper]:
+        """
+        Full-text search of stored papers, best bm25 match first.
+
+        ``query`` uses FTS5 syntax (AND/OR/NOT, "phrases", prefix*). ``since``
+        and ``until`` bound the first-seen date (ISO, inclusive). Raises
+        ValueError on a malformed query.
+        """
+        weights = ", ".join(str(w) for w in SEARCH_WEIGHTS)
+        sql = f"""SELECT {PAPER_SELECT} FROM papers_fts f JOIN papers p ON p.docid = f.rowid
+                  WHERE papers_fts MATCH ?"""
+        params: list = [query]
+        if topic:
+            sql += " AND EXISTS (SELECT 1 FROM paper_topics t WHERE t.paper_id = p.id AND t.topic = ?)"
+            params.append(topic)
+        if source:
+            sql += " AND p.source = ?"
+            params.append(source)
+        if since:
+            sql += " AND p.first_seen >= ?"
+            params.append(since)
+        if until:
+            # Inclusive of the whole end day
+            sql += " AND p.first_seen < ?"
+            params.append(until + "\uffff")
+        sql += f" ORDER BY bm25(papers_fts, {weights}) LIMIT ?"
+        params.append(limit)
+
+        with self._connect() as conn:
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError as e:
+                raise ValueError(f"Invalid search query: {e}") from e
+        return [Paper(**dict(row)) for row in rows]
 
     def update_summary(self, paper_id: str, summary: str) -> None:
-        """Update the summary for a paper."""
+        """Update the summary for a paper, removing it from the retry queue."""
         with self._connect() as conn:
             conn.execute(
                 "UPDATE papers SET summary = ? WHERE id = ?",
                 (summary, paper_id),
             )
+            conn.execute("DELETE FROM pending_summaries WHERE paper_id = ?", (paper_id,))
+
+    def queue_summary_retry(self, paper_id: str, error: str) -> bool:
+        """
+        Record a failed summary attempt and schedule the next one with
+        backoff. Returns False, dropping the paper from the queue, once it
+        has failed MAX_SUMMARY_ATTEMPTS times.
+        """
+        with self._connect(write=True) as conn:
+            row = conn.execute(
+                "SELECT attempts FROM pending_summaries WHERE paper_id = ?", (paper_id,)
+            ).fetchone()
+            attempts = (row["attempts"] if row else 0) + 1
+            if attempts >= MAX_SUMMARY_ATTEMPTS:
+                conn.execute("DELETE FROM pending_summaries WHERE paper_id = ?", (paper_id,))
+                return False
+            delay = min(
+                timedelta(minutes=RETRY_BASE_MINUTES * 2 ** (attempts - 1)),
+                timedelta(hours=RETRY_MAX_HOURS),
+            )
+            conn.execute(
+                """INSERT OR REPLACE INTO pending_summaries
+                       (paper_id, attempts, last_error, next_attempt_at)
+                   VALUES (?, ?, ?, ?)""",
+                (paper_id, attempts, error, (datetime.now() + delay).isoformat()),
+            )
+        return True
+
+    def pending_summary_papers(self, due_only: bool = True) -> list[Paper]:
+        """
+        Get papers waiting for a summary retry, oldest deadline first. With
+        due_only, skips papers still backing off.
+        """
+        query = f"SELECT {PAPER_SELECT} FROM pending_summaries q JOIN papers p ON p.id = q.paper_id"
+        params: tuple = ()
+        if due_only:
+            query += " WHERE q.next_attempt_at <= ?"
+            params = (datetime.now().isoformat(),)
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY q.next_attempt_at, q.paper_id", params).fetchall()
+        return [Paper(**dict(row)) for row in rows]
+
+    def trial_summaries(self, nct_ids: Iterable[str]) -> dict[str, str]:
+        """Get stored trial summaries keyed by NCT ID."""
+        nct_ids = list(dict.fromkeys(nct_ids))
+        summaries: dict[str, str] = {}
+        with self._connect() as conn:
+            for start in range(0, len(nct_ids), SQL_CHUNK_SIZE):
+                chunk = nct_ids[start : start + SQL_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT nct_id, summary FROM trial_summaries WHERE nct_id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                summaries.update((row["nct_id"], row["summary"]) for row in rows)
+        return summaries
+
+    def update_trial_summary(self, nct_id: str, summary: str) -> None:
+        """Store the summary for a clinical trial."""
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO trial_summaries (nct_id, summary, updated_at)
+                   VALUES (?, ?, ?)""",
+                (nct_id, summary, datetime.now().isoformat()),
+            )
+
+    def add_summary_batch(
+        self, batch_id: str, items: Iterable[tuple[str, str, str, str | None]]
+    ) -> None:
+        """Record a submitted batch and its (custom_id, kind, item_id, cache_key) requests."""
+        with self._connect(write=True) as conn:
+            conn.execute(
+                "INSERT INTO summary_batches (batch_id, submitted_at) VALUES (?, ?)",
+                (batch_id, datetime.now().isoformat()),
+            )
+            conn.executemany(
+                """INSERT INTO summary_batch_items (batch_id, custom_id, kind, item_id, cache_key)
+                   VALUES (?, ?, ?, ?, ?)""",
+                [(batch_id, *item) for item in items],
+            )
+
+    def pending_summary_batches(self) -> list[str]:
+        """Get the IDs of batches whose results have not been written back, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """SELECT batch_id FROM summary_batches
+                   WHERE completed_at IS NULL ORDER BY submitted_at"""
+            ).fetchall()
+        return [row["batch_id"] for row in rows]
+
+    def summary_batch_items(self, batch_id: str) -> dict[str, tuple[str, str, str | None]]:
+        """Map custom_id to (kind, item_id, cache_key) for a batch's requests."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """SELECT custom_id, kind, item_id, cache_key FROM summary_batch_items
+                   WHERE batch_id = ?""",
+                (batch_id,),
+            ).fetchall()
+        return {row["custom_id"]: (row["kind"], row["item_id"], row["cache_key"]) for row in rows}
+
+    def pending_batch_items(self) -> set[tuple[str, str]]:
+        """Get the (kind, item_id) pairs awaiting results in unfinished batches."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """SELECT i.kind, i.item_id FROM summary_batch_items i
+                   JOIN summary_batches b ON b.batch_id = i.batch_id
+                   WHERE b.completed_at IS NULL"""
+            ).fetchall()
+        return {(row["kind"], row["item_id"]) for row in rows}
+
+    def finish_summary_batch(self, batch_id: str) -> None:
+        """Mark a batch's results as written back."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE summary_batches SET completed_at = ? WHERE batch_id = ?",
+                (datetime.now().isoformat(), batch_id),
+            )
+
+    def papers_published_since(self, since: datetime, sources: Iterable[str]) -> list[Paper]:
+        """
+        Get stored papers from the given sources published on or after since.
+
+        Partial dates (a year, or year and month) count if their period
+        reaches since. Undated papers fall back to when they were first seen.
+        """
+        sources = list(sources)
+        if not sources:
+            return []
+        placeholders = ",".join("?" * len(sources))
+        with self._connect() as conn:
+            # Dates start with the year, so this prefilter is a string compare
+            rows = conn.execute(
+                f"""SELECT {PAPER_SELECT} FROM papers p
+                    WHERE source IN ({placeholders})
+                    AND (published_date >= ?
+                         OR (COALESCE(published_date, '') = '' AND first_seen >= ?))
+                    ORDER BY first_seen, id""",
+                (*sources, f"{since.year:04d}", since.isoformat()),
+            ).fetchall()
+        papers = [Paper(**dict(row)) for row in rows]
+        return [p for p in papers if not p.published_date or published_since(p.published_date, since)]
 
     def get_paper(self, paper_id: str) -> Paper | None:
         """Get a paper by ID."""
         with self._connect() as conn:
             row = conn.execute(
-                "SELECT * FROM papers WHERE id = ?", (paper_id,)
+                f"SELECT {PAPER_SELECT} FROM papers p WHERE p.id = ?", (paper_id,)
             ).fetchone()
             if row:
                 return Paper(**dict(row))
@@ -166,7 +880,68 @@ def generate_paper_id(doi: str | None, arxiv_id: str | None, title: str) -> str:
         return f"doi:{doi}"
     if arxiv_id:
         return f"arxiv:{arxiv_id}"
-    import hashlib
 
     normalized = normalize_title(title)
     return f"title:{hashlib.sha256(normalized.encode()).hexdigest()[:16]}"
+
+
+def published_since(published_date: str, since: datetime) -> bool:
+    """
+    Check whether a publication date ("2024-03-05", "2024-Mar-05",
+    "2024-03" or "2024") could fall on or after since.
+    """
+    parts = published_date.split("-")
+    fields: list[int] = []
+    try:
+        fields.append(int(parts[0][:4]))
+        if len(parts) > 1:
+            month = parts[1]
+            fields.append(int(month) if month.isdigit() else datetime.strptime(month[:3], "%b").month)
+        if len(parts) > 2:
+            fields.append(int(parts[2][:2]))
+    except ValueError:
+        pass  # Compare the leading parts that parsed
+    if not fields:
+        return False
+    return tuple(fields) >= (since.year, since.month, since.day)[: len(fields)]
+
+
+def _schema_statements() -> list[str]:
+    """Split SCHEMA into single statements (trigger bodies stay whole)."""
+    statements: list[str] = []
+    current = ""
+    for line in SCHEMA.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ""
+    return statements
+
+
+def _identifier_key(kind: str, value: str) -> str:
+    """Flatten an identifier into the in-memory seen-set key."""
+    return f"{kind}:{value}"
+
+
+def paper_identifiers(
+    doi: str | None, arxiv_id: str | None, pmid: str | None, title: str
+) -> list[tuple[str, str]]:
+    """
+    Get the normalized (kind, value) identifiers of a paper for dedupe.
+
+    DOIs are lowercased, arXiv IDs lose their version suffix, and titles are
+    hashed after normalize_title (only when long enough to be distinctive).
+    """
+    identifiers = []
+    if doi:
+        doi = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:)", "", doi.strip(), flags=re.IGNORECASE)
+        identifiers.append(("doi", doi.lower()))
+    if arxiv_id:
+        identifiers.append(("arxiv", re.sub(r"v\d+$", "", arxiv_id.strip())))
+    if pmid:
+        identifiers.append(("pmid", pmid.strip()))
+    normalized = normalize_title(title or "")
+    if len(normalized.split()) >= MIN_TITLE_IDENTIFIER_WORDS:
+        digest = hashlib.sha256(normalized.encode()).hexdigest()[:16]
+        identifiers.append(("title", digest))
+    return identifiers
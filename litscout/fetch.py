@@ -0,0 +1,113 @@
+"""Concurrent fetch stage for topic × source pairs."""
+
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterable, Iterator
+
+from .db import Paper
+
+Fetcher = Callable[..., Iterable[Paper]]
+
+# Concurrent fetch jobs overall, and per source unless configured
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_SOURCE_WORKERS = 2
+
+
+@dataclass
+class FetchJob:
+    """A single (topic, source) fetch to run."""
+
+    topic: str
+    source: str
+    query: str
+    since: datetime
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a fetch job: the papers found, or the error raised."""
+
+    job: FetchJob
+    papers: list[Paper] = field(default_factory=list)
+    error: Exception | None = None
+
+
+def run_fetch_jobs(
+    jobs: list[FetchJob],
+    fetchers: dict[str, Fetcher],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    source_concurrency: dict[str, int] | None = None,
+) -> list[FetchResult]:
+    """
+    Run fetch jobs through a bounded worker pool.
+
+    Each source gets its own pool sized by ``source_concurrency`` (so a slow
+    source cannot occupy every worker), and ``max_workers`` caps the number of
+    fetches in flight across all sources. Results are returned in the same
+    order as ``jobs``, regardless of completion order.
+    """
+    source_concurrency = source_concurrency or {}
+    slots = threading.BoundedSemaphore(max_workers)
+
+    def run(job: FetchJob) -> FetchResult:
+        with slots:
+            try:
+                fetcher = fetchers[job.source]
+                papers = list(fetcher(job.query, job.topic, job.since))
+                return FetchResult(job=job, papers=papers)
+            except Exception as e:
+                return FetchResult(job=job, error=e)
+
+    pools: dict[str, ThreadPoolExecutor] = {}
+    futures: list[Future] = []
+    try:
+        for job in jobs:
+            pool = pools.get(job.source)
+            if pool is None:
+                workers = source_concurrency.get(job.source, DEFAULT_PER_SOURCE_WORKERS)
+                pool = ThreadPoolExecutor(
+                    max_workers=max(1, min(workers, max_workers)),
+                    thread_name_prefix=f"fetch-{job.source}",
+                )
+                pools[job.source] = pool
+            futures.append(pool.submit(run, job))
+        return [future.result() for future in futures]
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True)
+
+
+def group_by_topic(results: list[FetchResult]) -> dict[str, list[FetchResult]]:
+    """Group fetch results by topic, preserving job order within each topic."""
+    grouped: dict[str, list[FetchResult]] = {}
+    for result in results:
+        grouped.setdefault(result.job.topic, []).append(result)
+    return grouped
+
+
+def ordered_map(fn: Callable, items: Iterable, max_workers: int) -> Iterator:
+    """
+    Apply ``fn`` to ``items`` concurrently, yielding results in input order.
+
+    At most ``max_workers`` calls are in flight at once, so results stream
+    out as they are consumed instead of accumulating for the whole input.
+    """
+    max_workers = max(1, max_workers)
+    items = iter(items)
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        try:
+            for item in itertools.islice(items, max_workers):
+                pending.append(pool.submit(fn, item))
+            while pending:
+                result = pending.popleft().result()
+                for item in itertools.islice(items, 1):
+                    pending.append(pool.submit(fn, item))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
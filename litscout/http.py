@@ -0,0 +1,212 @@
+"""Shared HTTP client with pooled sessions, retries and per-host statistics."""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import __version__, ratelimit
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeout in seconds, applied to every request
+DEFAULT_TIMEOUT = (10, 60)
+
+# Retry policy for transient failures
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 120.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Keep-alive connections kept open per host
+POOL_SIZE = 10
+
+USER_AGENT = f"LitScout/{__version__} (+https://github.com/adamnelson/LitScout)"
+
+
+@dataclass
+class HostStats:
+    """Request statistics for a single host."""
+
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean seconds per request."""
+        return self.seconds / self.requests if self.requests else 0.0
+
+
+_sessions: dict[str, requests.Session] = {}
+_stats: dict[str, HostStats] = {}
+_lock = threading.Lock()
+
+
+def _host(url: str) -> str:
+    return (urlparse(url).hostname or url).lower()
+
+
+def _session_for(host: str) -> requests.Session:
+    """Get the pooled session for a host, creating it on first use."""
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(
+                {
+                    "User-Agent": USER_AGENT,
+                    "Accept-Encoding": "gzip, deflate",
+                }
+            )
+            _sessions[host] = session
+        return session
+
+
+def _record(host: str, **deltas: float) -> None:
+    with _lock:
+        stats = _stats.setdefault(host, HostStats())
+        for name, value in deltas.items():
+            setattr(stats, name, getattr(stats, name) + value)
+
+
+def _retry_after(resp: requests.Response) -> float | None:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with jitter for the given retry attempt."""
+    delay = BACKOFF_BASE * (2**attempt)
+    return min(BACKOFF_MAX, delay + random.uniform(0, delay / 2))
+
+
+def request(
+    method: str,
+    url: str,
+    params: dict | None = None,
+    data: dict | None = None,
+    headers: dict | None = None,
+    stream: bool = False,
+    timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+) -> requests.Response:
+    """
+    Send a rate-limited request with retries on transient failures.
+
+    Connection errors, timeouts and 429/5xx responses are retried up to
+    MAX_RETRIES times, honouring Retry-After when the server sends it and
+    falling back to exponential backoff otherwise. Raises
+    ``requests.RequestException`` once retries are exhausted or on any other
+    HTTP error status.
+    """
+    host = _host(url)
+    session = _session_for(host)
+    attempt = 0
+
+    while True:
+        ratelimit.acquire(url)
+        start = time.monotonic()
+        try:
+            resp = session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=headers,
+                stream=stream,
+                timeout=timeout,
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            _record(host, requests=1, errors=1, seconds=time.monotonic() - start)
+            if attempt >= MAX_RETRIES:
+                raise
+            delay = _backoff(attempt)
+            reason = str(e)
+        else:
+            if resp.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+                _record(host, requests=1, errors=1, seconds=time.monotonic() - start)
+                delay = _retry_after(resp)
+                delay = min(BACKOFF_MAX, delay) if delay is not None else _backoff(attempt)
+                reason = f"HTTP {resp.status_code}"
+                resp.close()
+            else:
+                if stream:
+                    size = int(resp.headers.get("Content-Length") or 0)
+                else:
+                    size = len(resp.content)
+                _record(
+                    host,
+                    requests=1,
+                    errors=0 if resp.ok else 1,
+                    bytes=size,
+                    seconds=time.monotonic() - start,
+                )
+                resp.raise_for_status()
+                return resp
+
+        attempt += 1
+        _record(host, retries=1)
+        logger.warning(f"{host}: {reason}; retry {attempt}/{MAX_RETRIES} in {delay:.1f}s")
+        time.sleep(delay)
+
+
+def get(url: str, params: dict | None = None, **kwargs) -> requests.Response:
+    """Send a GET request through the shared client."""
+    return request("GET", url, params=params, **kwargs)
+
+
+def post(url: str, data: dict | None = None, **kwargs) -> requests.Response:
+    """Send a POST request through the shared client."""
+    return request("POST", url, data=data, **kwargs)
+
+
+def get_stats() -> dict[str, HostStats]:
+    """Get a snapshot of per-host request statistics."""
+    with _lock:
+        return {host: replace(stats) for host, stats in _stats.items()}
+
+
+def reset_stats() -> None:
+    """Clear per-host request statistics."""
+    with _lock:
+        _stats.clear()
+
+
+def format_stats() -> list[str]:
+    """Format per-host statistics as human-readable lines."""
+    lines = []
+    for host, stats in sorted(get_stats().items()):
+        line = (
+            f"{host}: {stats.requests} requests, "
+            f"{stats.bytes / 1024:.0f} KiB, "
+            f"{stats.mean_latency * 1000:.0f} ms avg"
+        )
+        if stats.retries:
+            line += f", {stats.retries} retries"
+        lines.append(line)
+    return lines
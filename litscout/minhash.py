@@ -0,0 +1,116 @@
+"""MinHash signatures and LSH banding for near-duplicate paper detection.
+
+Exact identifiers miss revised preprints, journal versions of preprints and
+punctuation or Greek-letter variants of a title. Each paper's title and
+abstract are reduced to character shingles, summarized as a MinHash
+signature, and split into LSH bands: papers sharing any band bucket are
+candidates, confirmed by their estimated Jaccard similarity.
+"""
+
+import hashlib
+import random
+import re
+import unicodedata
+from array import array
+
+# Signature length, split into BANDS bands of NUM_PERM // BANDS rows. With
+# 16 bands of 8 rows, pairs above ~0.7 Jaccard similarity become candidates.
+NUM_PERM = 128
+BANDS = 16
+
+# Estimated Jaccard similarity at which a candidate counts as a duplicate
+THRESHOLD = 0.8
+
+# Characters per shingle
+SHINGLE_SIZE = 5
+
+# Texts with fewer shingles than this are too short to compare reliably
+MIN_SHINGLES = 25
+
+# Papers are only signed when the abstract alone has this many shingles
+# (about 100 characters). Titles by themselves differ by a token or two
+# between distinct papers ("Phase 2 trial of X" vs "Phase 3 trial of X"),
+# so title-only text must never reach the similarity threshold.
+MIN_ABSTRACT_SHINGLES = 100
+
+# Fixed seed so signatures are comparable across runs
+_MASKS = [random.Random(20240101 + i).getrandbits(64) for i in range(NUM_PERM)]
+
+GREEK_LETTERS = {
+    "α": "alpha", "β": "beta", "γ": "gamma", "δ": "delta", "ε": "epsilon",
+    "ζ": "zeta", "η": "eta", "θ": "theta", "ι": "iota", "κ": "kappa",
+    "λ": "lambda", "μ": "mu", "ν": "nu", "ξ": "xi", "ο": "omicron",
+    "π": "pi", "ρ": "rho", "σ": "sigma", "ς": "sigma", "τ": "tau",
+    "υ": "upsilon", "φ": "phi", "χ": "chi", "ψ": "psi", "ω": "omega",
+}
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, spell out Greek letters, strip accents and punctuation."""
+    text = text.lower()
+    text = "".join(f" {GREEK_LETTERS[c]} " if c in GREEK_LETTERS else c for c in text)
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = re.sub(r"[^a-z0-9]+", " ", text)
+    return text.strip()
+
+
+def shingles(text: str) -> set[str]:
+    """Get the character shingles of normalized text."""
+    text = normalize_text(text)
+    return {text[i : i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def signature(text: str) -> array | None:
+    """
+    Compute the MinHash signature of a text, or None if it is too short.
+
+    Each shingle is hashed once to 64 bits; the permutations are XOR masks
+    over that hash, which keeps the per-paper cost to a few milliseconds.
+    """
+    grams = shingles(text)
+    if len(grams) < MIN_SHINGLES:
+        return None
+    hashes = [
+        int.from_bytes(hashlib.blake2b(g.encode(), digest_size=8).digest(), "little")
+        for g in grams
+    ]
+    return array("Q", (min(map(mask.__xor__, hashes)) for mask in _MASKS))
+
+
+def paper_signature(title: str | None, abstract: str | None) -> array | None:
+    """
+    Compute a paper's signature from its title and abstract, or None if it
+    has no substantial abstract to compare.
+    """
+    if len(shingles(abstract or "")) < MIN_ABSTRACT_SHINGLES:
+        return None
+    return signature(f"{title or ''} {abstract}")
+
+
+def band_keys(sig: array) -> list[tuple[int, int]]:
+    """Split a signature into (band, bucket) keys for the LSH index."""
+    rows = NUM_PERM // BANDS
+    keys = []
+    for band in range(BANDS):
+        chunk = sig[band * rows : (band + 1) * rows].tobytes()
+        bucket = int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), "little", signed=True)
+        keys.append((band, bucket))
+    return keys
+
+
+def similarity(a: array, b: array) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def to_blob(sig: array) -> bytes:
+    """Serialize a signature for storage."""
+    return sig.tobytes()
+
+
+def from_blob(blob: bytes) -> array:
+    """Deserialize a stored signature."""
+    sig = array("Q")
+    sig.frombytes(blob)
+    return sig
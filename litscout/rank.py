@@ -4,41 +4,52 @@ from datetime import datetime
 
 from .db import Paper
 
-
-def rank_papers(papers: list[Paper], top_k: int) -> list[Paper]:
-    """Rank papers by recency and return top_k."""
-    def score(paper: Paper) -> float:
-        """Score a paper based on recency."""
-        # Parse publication date
-        try:
-            if paper.published_date:
-                # Handle various date formats
-                date_str = paper.published_date
-                for fmt in ("%Y-%m-%d", "%Y-%m", "%Y"):
-                    try:
-                        pub_date = datetime.strptime(date_str[:len(fmt.replace("%", ""))+fmt.count("-")], fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    pub_date = datetime.now()
+# Bonus for having abstract (more informative)
+ABSTRACT_BONUS = 20
+
+# Bonus for having DOI (likely peer-reviewed or formal preprint)
+DOI_BONUS = 10
+
+
+def score_paper(paper: Paper, has_abstract: bool | None = None) -> float:
+    """
+    Score a paper based on recency.
+
+    ``has_abstract`` overrides the abstract check for provisional records
+    whose abstract has not been downloaded yet.
+    """
+    # Parse publication date
+    try:
+        if paper.published_date:
+            # Handle various date formats
+            date_str = paper.published_date
+            for fmt in ("%Y-%m-%d", "%Y-%m", "%Y"):
+                try:
+                    pub_date = datetime.strptime(date_str[:len(fmt.replace("%", ""))+fmt.count("-")], fmt)
+                    break
+                except ValueError:
+                    continue
             else:
                 pub_date = datetime.now()
-        except Exception:
+        else:
             pub_date = datetime.now()
+    except Exception:
+        pub_date = datetime.now()
 
-        # Days since publication (more recent = higher score)
-        days_old = (datetime.now() - pub_date).days
-        recency_score = max(0, 100 - days_old)
+    # Days since publication (more recent = higher score)
+    days_old = (datetime.now() - pub_date).days
+    recency_score = max(0, 100 - days_old)
 
-        # Bonus for having abstract (more informative)
-        abstract_score = 20 if paper.abstract and len(paper.abstract) > 100 else 0
+    if has_abstract is None:
+        has_abstract = bool(paper.abstract) and len(paper.abstract) > 100
+    abstract_score = ABSTRACT_BONUS if has_abstract else 0
+    doi_score = DOI_BONUS if paper.doi else 0
 
-        # Bonus for having DOI (likely peer-reviewed or formal preprint)
-        doi_score = 10 if paper.doi else 0
+    return recency_score + abstract_score + doi_score
 
-        return recency_score + abstract_score + doi_score
 
+def rank_papers(papers: list[Paper], top_k: int) -> list[Paper]:
+    """Rank papers by recency and return top_k."""
     # Sort by score descending
-    ranked = sorted(papers, key=score, reverse=True)
+    ranked = sorted(papers, key=score_paper, reverse=True)
     return ranked[:top_k]
@@ -0,0 +1,85 @@
+"""Process-wide per-host rate limiting for HTTP sources."""
+
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+# Requests per second for each host, from each service's published usage policy.
+HOST_LIMITS = {
+    # NCBI E-utilities: 3 requests/second, or 10 with an API key
+    "eutils.ncbi.nlm.nih.gov": 3.0,
+    # arXiv API: no more than one request every three seconds
+    "export.arxiv.org": 1 / 3,
+    # arXiv OAI-PMH: sequential harvesting, same courtesy pacing
+    "oaipmh.arxiv.org": 1 / 3,
+    # bioRxiv/medRxiv API: no published limit; stay polite
+    "api.biorxiv.org": 2.0,
+    # ClinicalTrials.gov API v2: ~50 requests/minute per IP
+    "clinicaltrials.gov": 50 / 60,
+    # iTunes Search API: ~20 calls/minute
+    "itunes.apple.com": 20 / 60,
+    # YouTube Data API: quota is per day; keep bursts modest
+    "www.googleapis.com": 10.0,
+}
+
+# NCBI allows 10 requests/second when an API key is supplied
+NCBI_API_KEY_LIMIT = 10.0
+
+# Limit for hosts not listed above (e.g. podcast RSS feeds)
+DEFAULT_LIMIT = 2.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks callers until a token is free."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if necessary. Returns seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve the token now so concurrent callers queue up behind us
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_limiters: dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+
+
+def host_limit(host: str) -> float:
+    """Get the requests-per-second limit for a host."""
+    if host == "eutils.ncbi.nlm.nih.gov" and os.environ.get("NCBI_API_KEY"):
+        return NCBI_API_KEY_LIMIT
+    return HOST_LIMITS.get(host, DEFAULT_LIMIT)
+
+
+def get_limiter(url: str) -> TokenBucket:
+    """Get the shared limiter for the host of a URL (or a bare host name)."""
+    host = urlparse(url).hostname or url
+    host = host.lower()
+    with _registry_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = TokenBucket(host_limit(host))
+            _limiters[host] = limiter
+        return limiter
+
+
+def acquire(url: str) -> float:
+    """Wait for permission to send one request to the host of ``url``."""
+    return get_limiter(url).acquire()
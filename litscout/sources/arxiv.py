@@ -1,60 +1,91 @@
 """arXiv fetcher using Atom API."""
 
-import time
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Iterator
 from urllib.parse import quote
 
 import requests
 
+from .. import http
 from ..db import Paper, generate_paper_id
 
 ARXIV_API_URL = "https://export.arxiv.org/api/query"
 
+ATOM_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
+}
+
+# Entries per API call (arXiv asks for at most 2000)
+PAGE_SIZE = 200
+
+# Upper bound on entries per search
+MAX_RESULTS = 2000
+
 
 def fetch_arxiv(
     query: str,
     topic: str,
     since: datetime | None = None,
-    max_results: int = 100,
+    max_results: int = MAX_RESULTS,
+    page_size: int = PAGE_SIZE,
 ) -> Iterator[Paper]:
-    """Fetch papers from arXiv matching the query."""
-    # arXiv uses a different query syntax - convert boolean operators
-    arxiv_query = _convert_query(query)
-
-    params = {
-        "search_query": arxiv_query,
-        "start": 0,
-        "max_results": max_results,
-        "sortBy": "submittedDate",
-        "sortOrder": "descending",
-    }
+    """
+    Fetch papers from arXiv matching the query.
 
-    try:
-        resp = requests.get(ARXIV_API_URL, params=params, timeout=60)
-        resp.raise_for_status()
-    except requests.RequestException as e:
-        print(f"arXiv fetch error: {e}")
-        return
+    The ``since`` window is applied server-side as a submittedDate range, and
+    results are paged newest first with ``start`` offsets. Paging stops at
+    the last page, at ``max_results``, or as soon as an entry is older than
+    ``since``. Calls are paced by the export.arxiv.org rate limiter.
+    """
+    # Naive datetimes are local time; arXiv timestamps are UTC
+    since_utc = since.astimezone(timezone.utc) if since else None
 
-    # Parse Atom feed
-    root = ET.fromstring(resp.content)
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
+    # arXiv uses a different query syntax - convert boolean operators
+    arxiv_query = _convert_query(query, since_utc)
+
+    found = 0
+    start = 0
+    while found < max_results:
+        params = {
+            "search_query": arxiv_query,
+            "start": start,
+            "max_results": min(page_size, max_results - found),
+            "sortBy": "submittedDate",
+            "sortOrder": "descending",
+        }
 
-    for entry in root.findall("atom:entry", ns):
         try:
-            paper = _parse_entry(entry, ns, topic, since)
-            if paper:
-                yield paper
-        except Exception as e:
-            print(f"Error parsing arXiv entry: {e}")
-            continue
-
-        time.sleep(0.1)  # Be nice to arXiv
-
-
-def _convert_query(query: str) -> str:
+            resp = http.get(ARXIV_API_URL, params=params)
+            root = ET.fromstring(resp.content)
+        except (requests.RequestException, ET.ParseError) as e:
+            print(f"arXiv fetch error: {e}")
+            return
+
+        entries = root.findall("atom:entry", ATOM_NS)
+        for entry in entries:
+            published = _entry_published(entry, ATOM_NS)
+            if since_utc and published and published < since_utc:
+                # Sorted newest first: everything after this is older
+                return
+            try:
+                paper = _parse_entry(entry, ATOM_NS, topic, since_utc)
+                if paper:
+                    yield paper
+                    found += 1
+            except Exception as e:
+                print(f"Error parsing arXiv entry: {e}")
+                continue
+
+        total_elem = root.find("opensearch:totalResults", ATOM_NS)
+        total = int(total_elem.text) if total_elem is not None and total_elem.text else 0
+        start += len(entries)
+        if not entries or start >= total:
+            return
+
+
+def _convert_query(query: str, since: datetime | None = None) -> str:
     """Convert PubMed-style query to arXiv query syntax."""
     # arXiv uses 'all:' prefix for searching all fields
     # Remove field specifiers like [dp]
@@ -64,26 +95,40 @@ def _convert_query(query: str) -> str:
     # arXiv prefers AND/OR in lowercase or as operators
     # Wrap terms for better matching
     q = f"all:{q}"
+
+    # Restrict to the submission window (YYYYMMDDHHMM, GMT)
+    if since:
+        start = since.astimezone(timezone.utc).strftime("%Y%m%d%H%M")
+        end = datetime.now(timezone.utc).strftime("%Y%m%d%H%M")
+        q = f"({q}) AND submittedDate:[{start} TO {end}]"
     return q
 
 
+def _entry_published(entry: ET.Element, ns: dict) -> datetime | None:
+    """Get the published (first submitted) timestamp of an Atom entry, in UTC."""
+    published_elem = entry.find("atom:published", ns)
+    if published_elem is None or not published_elem.text:
+        return None
+    try:
+        published = datetime.fromisoformat(published_elem.text.replace("Z", "+00:00"))
+    except ValueError:
+        return datetime.now(timezone.utc)
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published
+
+
 def _parse_entry(
     entry: ET.Element, ns: dict, topic: str, since: datetime | None
 ) -> Paper | None:
     """Parse an arXiv Atom entry into a Paper."""
     # Published date
-    published_elem = entry.find("atom:published", ns)
-    if published_elem is None or not published_elem.text:
+    published_date = _entry_published(entry, ns)
+    if published_date is None:
         return None
 
-    published_str = published_elem.text
-    try:
-        published_date = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-    except ValueError:
-        published_date = datetime.now()
-
-    # Filter by date if specified
-    if since and published_date.replace(tzinfo=None) < since:
+    # Filter by date if specified (since is UTC-aware)
+    if since and published_date < since:
         return None
 
     # Title
@@ -1,14 +1,11 @@
 """bioRxiv and medRxiv fetcher using their API."""
 
-import time
 from datetime import datetime, timedelta
 from typing import Iterator
 
-import requests
-
 from ..db import Paper, generate_paper_id
-
-BIORXIV_API_URL = "https://api.biorxiv.org/details"
+from .query import QueryRouter, matches_query, parse_query_groups
+from .rxiv_mirror import RxivMirror, iter_details
 
 
 def fetch_biorxiv(
@@ -16,9 +13,11 @@ def fetch_biorxiv(
     topic: str,
     since: datetime | None = None,
     max_results: int = 100,
+    mirror: RxivMirror | None = None,
+    router: QueryRouter | None = None,
 ) -> Iterator[Paper]:
     """Fetch papers from bioRxiv matching the query."""
-    yield from _fetch_rxiv("biorxiv", query, topic, since, max_results)
+    yield from _fetch_rxiv("biorxiv", query, topic, since, max_results, mirror, router)
 
 
 def fetch_medrxiv(
@@ -26,9 +25,11 @@ def fetch_medrxiv(
     topic: str,
     since: datetime | None = None,
     max_results: int = 100,
+    mirror: RxivMirror | None = None,
+    router: QueryRouter | None = None,
 ) -> Iterator[Paper]:
     """Fetch papers from medRxiv matching the query."""
-    yield from _fetch_rxiv("medrxiv", query, topic, since, max_results)
+    yield from _fetch_rxiv("medrxiv", query, topic, since, max_results, mirror, router)
 
 
 def _fetch_rxiv(
@@ -37,6 +38,8 @@ def _fetch_rxiv(
     topic: str,
     since: datetime | None,
     max_results: int,
+    mirror: RxivMirror | None = None,
+    router: QueryRouter | None = None,
 ) -> Iterator[Paper]:
     """Fetch papers from bioRxiv/medRxiv API."""
     # The API returns papers by date range, not by search query
@@ -44,129 +47,38 @@ def _fetch_rxiv(
     if since is None:
         since = datetime.now() - timedelta(days=30)
 
-    start_date = since.strftime("%Y-%m-%d")
-    end_date = datetime.now().strftime("%Y-%m-%d")
-
-    # API endpoint format: /details/{server}/{start}/{end}/{cursor}
-    cursor = 0
-    query_groups = _parse_query_groups(query)
-    found = 0
-
-    while found < max_results:
-        url = f"{BIORXIV_API_URL}/{server}/{start_date}/{end_date}/{cursor}"
-
-        try:
-            resp = requests.get(url, timeout=60)
-            resp.raise_for_status()
-            data = resp.json()
-        except requests.RequestException as e:
-            print(f"{server} fetch error: {e}")
-            return
-
-        messages = data.get("messages", [])
-        if messages and messages[0].get("status") == "no posts found":
-            return
-
-        collection = data.get("collection", [])
-        if not collection:
-            return
-
-        for item in collection:
-            paper = _parse_item(item, server, topic, query_groups)
-            if paper:
-                yield paper
-                found += 1
-                if found >= max_results:
-                    return
-
-        # Check if more results available
-        total_raw = messages[0].get("total", 0) if messages else 0
-        total = int(total_raw) if total_raw else 0
-        cursor += len(collection)
-        if cursor >= total:
-            return
-
-        time.sleep(0.5)  # Rate limiting
-
-
-def _parse_query_groups(query: str) -> list[list[str]]:
-    """
-    Parse a boolean query into AND-connected groups of OR terms.
-
-    Example: "(A OR B) AND (C OR D)" -> [['a', 'b'], ['c', 'd']]
-
-    Each inner list is an OR group; all groups must match (AND logic).
-    """
-    import re
-
-    # Normalize whitespace
-    query = " ".join(query.split())
+    start_date = since.date()
+    end_date = datetime.now().date()
 
-    # Split on AND (case insensitive) to get groups
-    and_parts = re.split(r"\s+AND\s+", query, flags=re.IGNORECASE)
-
-    groups = []
-    for part in and_parts:
-        # Remove outer parentheses
-        part = part.strip()
-        while part.startswith("(") and part.endswith(")"):
-            part = part[1:-1].strip()
-
-        # Split on OR to get terms within this group
-        or_parts = re.split(r"\s+OR\s+", part, flags=re.IGNORECASE)
-
-        terms = []
-        for term in or_parts:
-            term = term.strip()
-            # Remove parentheses and quotes
-            term = re.sub(r"[()]", "", term)
-
-            # Handle quoted phrases
-            if term.startswith('"') and term.endswith('"'):
-                term = term[1:-1]
-
-            # Handle wildcards (keep as prefix match)
-            term = term.lower().strip()
-
-            if len(term) >= 2:  # Skip very short terms
-                terms.append(term)
-
-        if terms:
-            groups.append(terms)
-
-    return groups
-
-
-def _term_matches(text: str, term: str) -> bool:
-    """Check if a term matches in text, supporting wildcards."""
-    if term.endswith("*"):
-        # Prefix match
-        prefix = term[:-1]
-        return prefix in text
+    # With a mirror, only days not yet mirrored are downloaded, and every
+    # topic filters the same local records
+    if mirror is not None:
+        mirror.sync(server, start_date, end_date)
+        items = mirror.records(server, start_date, end_date)
     else:
-        # Exact word or phrase match
-        return term in text
-
-
-def _matches_query(text: str, query_groups: list[list[str]]) -> bool:
-    """
-    Check if text matches the query using proper AND/OR logic.
+        items = iter_details(server, start_date, end_date)
 
-    All groups must match (AND). Within each group, any term matching suffices (OR).
-    """
-    if not query_groups:
-        return True
-
-    text_lower = text.lower()
-
-    # ALL groups must match (AND logic between groups)
-    for group in query_groups:
-        # At least ONE term in the group must match (OR logic within group)
-        group_matched = any(_term_matches(text_lower, term) for term in group)
-        if not group_matched:
-            return False
+    query_groups = parse_query_groups(query)
+    found = 0
 
-    return True
+    # A shared router scans each record once for every topic; this topic
+    # then only reads the cached result
+    use_router = router is not None and topic in router
+
+    for item in items:
+        if use_router:
+            key = f"{server}:{item.get('doi', '')}:{item.get('version', '')}"
+            searchable = f"{item.get('title', '')} {item.get('abstract', '')}"
+            if topic not in router.route(key, searchable):
+                continue
+            paper = _parse_item(item, server, topic, [])
+        else:
+            paper = _parse_item(item, server, topic, query_groups)
+        if paper:
+            yield paper
+            found += 1
+            if found >= max_results:
+                return
 
 
 def _parse_item(
@@ -178,7 +90,7 @@ def _parse_item(
 
     # Filter by query (since API doesn't support search)
     searchable = f"{title} {abstract}"
-    if query_groups and not _matches_query(searchable, query_groups):
+    if query_groups and not matches_query(searchable, query_groups):
         return None
 
     doi = item.get("doi", "")
@@ -10,6 +10,7 @@ from urllib.parse import quote_plus
 import feedparser
 import requests
 
+from litscout import http
 from litscout.config import PodcastConfig
 
 logger = logging.getLogger(__name__)
@@ -102,8 +103,7 @@ def _search_itunes_podcasts(query: str, limit: int = 20) -> list[dict]:
     url = f"https://itunes.apple.com/search?term={quote_plus(query)}&media=podcast&limit={limit}"
 
     try:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
+        resp = http.get(url)
         data = resp.json()
         return data.get("results", [])
     except requests.RequestException as e:
@@ -145,7 +145,8 @@ def _parse_rss_feed(
 ) -> list[PodcastEpisode]:
     """Parse a podcast RSS feed and return recent episodes."""
     try:
-        feed = feedparser.parse(feed_url)
+        resp = http.get(feed_url)
+        feed = feedparser.parse(resp.content)
     except Exception as e:
         logger.warning(f"Failed to parse RSS feed {feed_url}: {e}")
         return []
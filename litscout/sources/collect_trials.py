@@ -3,7 +3,6 @@
 import hashlib
 import json
 import logging
-import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -11,6 +10,7 @@ from typing import Optional
 
 import requests
 
+from litscout import http
 from litscout.config import TrialsConfig
 
 logger = logging.getLogger(__name__)
@@ -196,8 +196,7 @@ def _fetch_trials_from_api(query: str, config: TrialsConfig) -> list[ClinicalTri
             params["pageToken"] = page_token
 
         try:
-            resp = requests.get(CTGOV_API_BASE, params=params, timeout=30)
-            resp.raise_for_status()
+            resp = http.get(CTGOV_API_BASE, params=params)
             data = resp.json()
         except requests.RequestException as e:
             logger.error(f"ClinicalTrials.gov API request failed: {e}")
@@ -217,9 +216,6 @@ def _fetch_trials_from_api(query: str, config: TrialsConfig) -> list[ClinicalTri
         if not page_token:
             break
 
-        # Rate limiting: 0.5s delay between pages
-        time.sleep(0.5)
-
     return trials
 
 
@@ -10,6 +10,7 @@ from urllib.parse import quote_plus
 
 import requests
 
+from litscout import http
 from litscout.config import YouTubeConfig
 
 logger = logging.getLogger(__name__)
@@ -119,8 +120,7 @@ def _search_videos(
     )
 
     try:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
+        resp = http.get(url)
         data = resp.json()
 
         video_ids = []
@@ -152,8 +152,7 @@ def _get_video_details(api_key: str, video_ids: list[str]) -> list[YouTubeVideo]
     )
 
     try:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
+        resp = http.get(url)
         data = resp.json()
 
         videos = []
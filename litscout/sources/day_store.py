@@ -0,0 +1,130 @@
+"""Day-range bookkeeping shared by the local source mirrors.
+
+The bioRxiv/medRxiv mirror and the arXiv OAI-PMH store both download
+records by date range into SQLite and remember which days each key (a
+server or an OAI set) has covered, so later runs only fetch days they have
+not seen. This base class owns that bookkeeping; subclasses define their
+record tables and how a batch of downloaded items is stored.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+# Days this close to today may still receive new records, so they are
+# re-fetched on every run rather than marked as done.
+SETTLE_DAYS = 1
+
+# Items written per transaction while downloading
+STORE_BATCH_SIZE = 500
+
+
+class DayStore:
+    """
+    SQLite store that tracks downloaded days per key.
+
+    Subclasses set ``days_table``, ``key_column`` and ``stamp_column`` to
+    name the table of (key, day, timestamp) rows, and pass their own schema,
+    which must create that table.
+    """
+
+    days_table: str
+    key_column: str
+    stamp_column: str
+
+    def __init__(self, db_path: Path | str, schema: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        # Unsettled days already fetched by this instance (i.e. this run)
+        self._fresh: set[tuple[str, str]] = set()
+        with self._connect() as conn:
+            conn.executescript(schema)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def missing_ranges(self, key: str, start: date, end: date) -> list[tuple[date, date]]:
+        """Get contiguous (start, end) day ranges that still need fetching."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""SELECT day FROM {self.days_table}
+                    WHERE {self.key_column} = ? AND day BETWEEN ? AND ?""",
+                (key, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        done = {row[0] for row in rows}
+        done |= {day for k, day in self._fresh if k == key}
+
+        ranges: list[tuple[date, date]] = []
+        day = start
+        while day <= end:
+            if day.isoformat() not in done:
+                if ranges and ranges[-1][1] == day - timedelta(days=1):
+                    ranges[-1] = (ranges[-1][0], day)
+                else:
+                    ranges.append((day, day))
+            day += timedelta(days=1)
+        return ranges
+
+    def _download(
+        self,
+        key: str,
+        start: date,
+        end: date,
+        fetch: Callable[[date, date], Iterable[dict]],
+        store: Callable[[list[dict]], None],
+    ) -> int:
+        """
+        Fetch and store every missing day range in [start, end] for a key,
+        marking each range done once stored. Returns the number of items
+        fetched. Callers for the same key wait for each other, so a day is
+        never downloaded twice.
+        """
+        fetched = 0
+        with self._key_lock(key):
+            for range_start, range_end in self.missing_ranges(key, start, end):
+                batch: list[dict] = []
+                for item in fetch(range_start, range_end):
+                    batch.append(item)
+                    if len(batch) >= STORE_BATCH_SIZE:
+                        store(batch)
+                        fetched += len(batch)
+                        batch = []
+                if batch:
+                    store(batch)
+                    fetched += len(batch)
+                self._mark_done(key, range_start, range_end)
+        return fetched
+
+    def _mark_done(self, key: str, start: date, end: date) -> None:
+        settled_before = date.today() - timedelta(days=SETTLE_DAYS)
+        now = datetime.now().isoformat()
+        settled = []
+        day = start
+        while day <= end:
+            if day < settled_before:
+                settled.append((key, day.isoformat(), now))
+            else:
+                self._fresh.add((key, day.isoformat()))
+            day += timedelta(days=1)
+        if settled:
+            with self._connect() as conn:
+                conn.executemany(
+                    f"""INSERT OR REPLACE INTO {self.days_table}
+                        ({self.key_column}, day, {self.stamp_column}) VALUES (?, ?, ?)""",
+                    settled,
+                )
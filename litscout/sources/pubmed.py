@@ -1,26 +1,70 @@
 """PubMed fetcher using NCBI E-utilities API."""
 
-import time
+import os
 import xml.etree.ElementTree as ET
+from dataclasses import replace
 from datetime import datetime
-from typing import Iterator
+from typing import IO, Callable, Iterator
 from urllib.parse import quote
 
 import requests
 
+from .. import http
 from ..db import Paper, generate_paper_id
+from ..fetch import ordered_map
+from ..rank import score_paper
 
 ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
 EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+ESUMMARY_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+
+# Upper bound on articles per search (the history server pages up to 10k)
+MAX_RESULTS = 10000
+
+# PMIDs per ESearch request when the ID list is needed
+ESEARCH_PAGE_SIZE = 1000
+
+# Articles per EFetch request
+EFETCH_CHUNK_SIZE = 200
+
+# Document summaries per ESummary request
+ESUMMARY_CHUNK_SIZE = 500
+
+# Two-phase mode EFetches this many times top_k provisional candidates, as
+# headroom for short abstracts and papers already stored from other sources
+SHORTLIST_FACTOR = 2
+
+# Concurrent EFetch requests (paced by the NCBI rate limiter)
+EFETCH_WORKERS = 3
 
 
 def fetch_pubmed(
     query: str,
     topic: str,
     since: datetime | None = None,
-    max_results: int = 100,
+    max_results: int = MAX_RESULTS,
+    chunk_size: int = EFETCH_CHUNK_SIZE,
+    known_papers: Callable[[list[str]], dict[str, Paper]] | None = None,
+    two_phase_top_k: int | None = None,
+    exclude: list[str] | None = None,
 ) -> Iterator[Paper]:
-    """Fetch papers from PubMed matching the query."""
+    """
+    Fetch papers from PubMed matching the query.
+
+    ESearch stores the result set on the NCBI history server, and EFetch
+    pages through it in chunks of ``chunk_size`` articles. Chunks are fetched
+    concurrently (paced by the NCBI rate limiter) and yielded in search order.
+
+    If ``known_papers`` is given, the ESearch ID list is paged from the
+    history server ``ESEARCH_PAGE_SIZE`` PMIDs at a time, and
+    ``known_papers`` is called with each page and returns stored papers for
+    PMIDs already known. Those are yielded as
+    stored (under this topic) and only the remaining IDs are EFetched.
+
+    If ``two_phase_top_k`` is given, lightweight ESummary records are ranked
+    first (after dropping titles matching ``exclude``) and only the leading
+    ``SHORTLIST_FACTOR * two_phase_top_k`` articles are EFetched.
+    """
     # Build date filter
     date_filter = ""
     if since:
@@ -29,55 +73,221 @@ def fetch_pubmed(
         date_filter = f" AND ({date_str}:{today_str}[dp])"
 
     full_query = query + date_filter
+    by_id = known_papers is not None or two_phase_top_k is not None
 
-    # Step 1: Search for IDs
+    # Step 1: Search, keeping the result set on the history server. Filtering
+    # PMIDs first also needs the ID list, which is paged from the same result
+    # set with ESearch retstart.
     search_params = {
         "db": "pubmed",
         "term": full_query,
-        "retmax": max_results,
+        "retmax": min(ESEARCH_PAGE_SIZE, max_results) if by_id else 0,
         "retmode": "json",
         "sort": "date",
+        "usehistory": "y",
     }
+    api_key = os.environ.get("NCBI_API_KEY")
+    if api_key:
+        search_params["api_key"] = api_key
 
     try:
-        resp = requests.get(ESEARCH_URL, params=search_params, timeout=30)
-        resp.raise_for_status()
+        resp = http.get(ESEARCH_URL, params=search_params)
         data = resp.json()
     except requests.RequestException as e:
         print(f"PubMed search error: {e}")
         return
 
-    id_list = data.get("esearchresult", {}).get("idlist", [])
-    if not id_list:
+    result = data.get("esearchresult", {})
+    count = min(int(result.get("count", 0) or 0), max_results)
+    webenv = result.get("webenv")
+    query_key = result.get("querykey")
+    if not count or not webenv or not query_key:
         return
 
-    # Step 2: Fetch article details
-    time.sleep(0.34)  # Rate limit: 3 requests/second without API key
+    # Step 2: Page article details, either from the history server or, when
+    # PMIDs are filtered first, by explicit ID lists
+    if not by_id:
+        batches = [
+            {
+                "WebEnv": webenv,
+                "query_key": query_key,
+                "retstart": retstart,
+                "retmax": min(chunk_size, count - retstart),
+            }
+            for retstart in range(0, count, chunk_size)
+        ]
+    else:
+        pmids: list[str] = []
+        page = result.get("idlist", [])[:count]
+        retstart = len(page)
+        while True:
+            if known_papers is not None:
+                # Known PMIDs are yielded as each ID page arrives
+                known = known_papers(page)
+                for pmid in page:
+                    if pmid in known:
+                        yield replace(known[pmid], topic=topic)
+                page = [pmid for pmid in page if pmid not in known]
+            pmids.extend(page)
+            if retstart >= count:
+                break
+            try:
+                retmax = min(ESEARCH_PAGE_SIZE, count - retstart)
+                page = _search_page(webenv, query_key, retstart, retmax, api_key)
+            except requests.RequestException as e:
+                print(f"PubMed search error: {e}")
+                return
+            if not page:
+                break
+            retstart += len(page)
+        if two_phase_top_k is not None:
+            try:
+                pmids = _shortlist(pmids, topic, two_phase_top_k, exclude or [], api_key)
+            except requests.RequestException as e:
+                print(f"PubMed summary error: {e}")
+                return
+        batches = [
+            {"id": ",".join(pmids[i : i + chunk_size])}
+            for i in range(0, len(pmids), chunk_size)
+        ]
+
+    def fetch_chunk(batch: dict) -> list[Paper] | Exception:
+        fetch_params = {"db": "pubmed", "retmode": "xml", **batch}
+        if api_key:
+            fetch_params["api_key"] = api_key
+        try:
+            # POST keeps long ID lists out of the URL
+            resp = http.post(EFETCH_URL, data=fetch_params, stream=True)
+        except requests.RequestException as e:
+            return e
+        try:
+            resp.raw.decode_content = True
+            return list(_iter_articles(resp.raw, topic))
+        except Exception as e:
+            return e
+        finally:
+            resp.close()
 
-    fetch_params = {
+    chunks = ordered_map(fetch_chunk, batches, EFETCH_WORKERS)
+    for papers in chunks:
+        if isinstance(papers, Exception):
+            print(f"PubMed fetch error: {papers}")
+            return
+        yield from papers
+
+
+def _search_page(
+    webenv: str, query_key: str, retstart: int, retmax: int, api_key: str | None
+) -> list[str]:
+    """Get one page of PMIDs from a result set on the history server."""
+    params = {
         "db": "pubmed",
-        "id": ",".join(id_list),
-        "retmode": "xml",
+        "term": f"#{query_key}",
+        "WebEnv": webenv,
+        "retstart": retstart,
+        "retmax": retmax,
+        "retmode": "json",
+        "sort": "date",
     }
+    if api_key:
+        params["api_key"] = api_key
+    resp = http.get(ESEARCH_URL, params=params)
+    return resp.json().get("esearchresult", {}).get("idlist", [])
+
+
+def _shortlist(
+    pmids: list[str], topic: str, top_k: int, exclude: list[str], api_key: str | None
+) -> list[str]:
+    """Rank ESummary records and return the PMIDs worth a full EFetch."""
+    candidates: list[tuple[Paper, bool]] = []
+    for i in range(0, len(pmids), ESUMMARY_CHUNK_SIZE):
+        params = {
+            "db": "pubmed",
+            "id": ",".join(pmids[i : i + ESUMMARY_CHUNK_SIZE]),
+            "retmode": "json",
+        }
+        if api_key:
+            params["api_key"] = api_key
+        result = http.post(ESUMMARY_URL, data=params).json().get("result", {})
+        for uid in result.get("uids", []):
+            doc = result.get(uid, {})
+            paper = _parse_summary(doc, topic)
+            if paper is None:
+                continue
+            # Excluded titles would be dropped later and must not take a slot
+            if any(term.lower() in paper.title.lower() for term in exclude):
+                continue
+            candidates.append((paper, "Has Abstract" in doc.get("attributes", [])))
+
+    # Stable sort, like rank_papers, so ties keep search order
+    ranked = sorted(
+        candidates,
+        key=lambda c: score_paper(c[0], has_abstract=c[1]),
+        reverse=True,
+    )
+    keep = {paper.pmid for paper, _ in ranked[: top_k * SHORTLIST_FACTOR]}
+    return [paper.pmid for paper, _ in candidates if paper.pmid in keep]
 
-    try:
-        resp = requests.get(EFETCH_URL, params=fetch_params, timeout=60)
-        resp.raise_for_status()
-    except requests.RequestException as e:
-        print(f"PubMed fetch error: {e}")
-        return
 
-    # Parse XML response
-    root = ET.fromstring(resp.content)
+def _parse_summary(doc: dict, topic: str) -> Paper | None:
+    """Parse an ESummary document into a provisional Paper without abstract."""
+    pmid = doc.get("uid")
+    title = doc.get("title", "")
+    if not pmid or not title:
+        return None
 
-    for article in root.findall(".//PubmedArticle"):
+    doi = None
+    for aid in doc.get("articleids", []):
+        if aid.get("idtype") == "doi":
+            doi = aid.get("value")
+            break
+
+    # "2024 Jan 5" -> "2024-Jan-5", matching the EFetch PubDate layout
+    pub_date = "-".join(doc.get("pubdate", "").split()[:3])
+
+    authors = [a.get("name", "") for a in doc.get("authors", []) if a.get("name")]
+    authors_str = ", ".join(authors[:5])
+    if len(authors) > 5:
+        authors_str += " et al."
+
+    return Paper(
+        id=generate_paper_id(doi, None, title),
+        doi=doi,
+        arxiv_id=None,
+        title=title,
+        authors=authors_str,
+        abstract="",
+        url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+        source="pubmed",
+        published_date=pub_date,
+        topic=topic,
+        first_seen=datetime.now().isoformat(),
+        pmid=pmid,
+    )
+
+
+def _iter_articles(source: IO[bytes], topic: str) -> Iterator[Paper]:
+    """
+    Incrementally parse EFetch XML from a file-like source into Papers.
+
+    Each PubmedArticle is parsed as soon as its closing tag arrives and then
+    discarded, so memory does not grow with the number of articles.
+    """
+    root = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        if event != "end" or elem.tag != "PubmedArticle":
+            continue
         try:
-            paper = _parse_article(article, topic)
+            paper = _parse_article(elem, topic)
             if paper:
                 yield paper
         except Exception as e:
             print(f"Error parsing PubMed article: {e}")
-            continue
+        # Drop parsed articles from the tree
+        root.clear()
 
 
 def _parse_article(article: ET.Element, topic: str) -> Paper | None:
@@ -171,4 +381,5 @@ def _parse_article(article: ET.Element, topic: str) -> Paper | None:
         published_date=pub_date,
         topic=topic,
         first_seen=datetime.now().isoformat(),
+        pmid=pmid,
     )
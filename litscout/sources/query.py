@@ -0,0 +1,170 @@
+"""Boolean query parsing and local matching for sources without server-side search."""
+
+import re
+import threading
+
+
+def parse_query_groups(query: str) -> list[list[str]]:
+    """
+    Parse a boolean query into AND-connected groups of OR terms.
+
+    Example: "(A OR B) AND (C OR D)" -> [['a', 'b'], ['c', 'd']]
+
+    Each inner list is an OR group; all groups must match (AND logic).
+    """
+    # Normalize whitespace
+    query = " ".join(query.split())
+
+    # Split on AND (case insensitive) to get groups
+    and_parts = re.split(r"\s+AND\s+", query, flags=re.IGNORECASE)
+
+    groups = []
+    for part in and_parts:
+        # Remove outer parentheses
+        part = part.strip()
+        while part.startswith("(") and part.endswith(")"):
+            part = part[1:-1].strip()
+
+        # Split on OR to get terms within this group
+        or_parts = re.split(r"\s+OR\s+", part, flags=re.IGNORECASE)
+
+        terms = []
+        for term in or_parts:
+            term = term.strip()
+            # Remove parentheses and quotes
+            term = re.sub(r"[()]", "", term)
+
+            # Handle quoted phrases
+            if term.startswith('"') and term.endswith('"'):
+                term = term[1:-1]
+
+            # Handle wildcards (keep as prefix match)
+            term = term.lower().strip()
+
+            if len(term) >= 2:  # Skip very short terms
+                terms.append(term)
+
+        if terms:
+            groups.append(terms)
+
+    return groups
+
+
+def term_matches(text: str, term: str) -> bool:
+    """Check if a term matches in text, supporting wildcards."""
+    if term.endswith("*"):
+        # Prefix match
+        prefix = term[:-1]
+        return prefix in text
+    else:
+        # Exact word or phrase match
+        return term in text
+
+
+def matches_query(text: str, query_groups: list[list[str]]) -> bool:
+    """
+    Check if text matches the query using proper AND/OR logic.
+
+    All groups must match (AND). Within each group, any term matching suffices (OR).
+    """
+    if not query_groups:
+        return True
+
+    text_lower = text.lower()
+
+    # ALL groups must match (AND logic between groups)
+    for group in query_groups:
+        # At least ONE term in the group must match (OR logic within group)
+        group_matched = any(term_matches(text_lower, term) for term in group)
+        if not group_matched:
+            return False
+
+    return True
+
+
+def _term_pattern(term: str) -> str:
+    """Get the substring a term must contain (wildcards are prefix matches)."""
+    return term[:-1] if term.endswith("*") else term
+
+
+def _trie_regex(patterns: set[str]) -> str:
+    """Build a regex alternation factored as a trie, so shared prefixes are tested once."""
+    trie: dict = {}
+    for pattern in patterns:
+        node = trie
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional: prefer the longest pattern ending below this node
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class QueryRouter:
+    """
+    Match text against many topics' queries in a single scan.
+
+    All terms from every topic are compiled into one regex. A zero-width
+    lookahead finds the longest term starting at each position of the text;
+    every shorter term that is a prefix of it also matches there. Matching
+    keeps the substring semantics of ``matches_query``, including wildcard
+    prefixes and quoted phrases.
+    """
+
+    def __init__(self, queries: dict[str, str]):
+        self._groups: dict[str, list[frozenset[str]]] = {}
+        patterns: set[str] = set()
+        for topic, query in queries.items():
+            groups = [
+                frozenset(_term_pattern(term) for term in group)
+                for group in parse_query_groups(query)
+            ]
+            self._groups[topic] = groups
+            for group in groups:
+                patterns.update(group)
+
+        self._prefixes = {
+            pattern: frozenset(p for p in patterns if pattern.startswith(p))
+            for pattern in patterns
+        }
+        self._regex = re.compile(f"(?=({_trie_regex(patterns)}))") if patterns else None
+        self._cache: dict[str, frozenset[str]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, topic: str) -> bool:
+        return topic in self._groups
+
+    def terms_in(self, text: str) -> set[str]:
+        """Get every compiled term that occurs in the text."""
+        found: set[str] = set()
+        if self._regex is None:
+            return found
+        for m in self._regex.finditer(text.lower()):
+            found |= self._prefixes[m.group(1)]
+        return found
+
+    def match(self, text: str) -> frozenset[str]:
+        """Get the topics whose AND/OR groups are all satisfied by the text."""
+        found = self.terms_in(text)
+        return frozenset(
+            topic
+            for topic, groups in self._groups.items()
+            if all(group & found for group in groups)
+        )
+
+    def route(self, key: str, text: str) -> frozenset[str]:
+        """Like ``match``, but cached by record key so each record is scanned once."""
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is None:
+            cached = self.match(text)
+            with self._lock:
+                self._cache[key] = cached
+        return cached
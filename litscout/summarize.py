@@ -1,15 +1,260 @@
 """Paper summarization using Claude API."""
 
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterator, Mapping
 
 import anthropic
 
 from .db import Paper
+from .summary_cache import SummaryCache, default_cache_dir, request_key
 
 if TYPE_CHECKING:
     from .sources.collect_trials import ClinicalTrial
 
+MODEL = "claude-sonnet-4-20250514"
+PAPER_MAX_TOKENS = 1500
+TRIAL_MAX_TOKENS = 300
+
+# Concurrent summarization requests
+DEFAULT_WORKERS = 4
+
+# Rate limit kinds reported as anthropic-ratelimit-{kind}-remaining/-reset
+RATE_LIMIT_KINDS = ("requests", "tokens", "input-tokens", "output-tokens")
+
+
+class RateLimitTracker:
+    """
+    Thread-safe view of the API's remaining request and token budgets.
+
+    Each response's rate-limit headers refresh the budgets; callers reserve
+    their estimated usage before a request and wait for the reset time when
+    a budget would go negative.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # kind -> (remaining, reset as time.monotonic())
+        self._budgets: dict[str, tuple[int, float]] = {}
+        self._paused_until = 0.0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Refresh budgets from a response's headers."""
+        now = time.monotonic()
+        with self._lock:
+            for kind in RATE_LIMIT_KINDS:
+                remaining = headers.get(f"anthropic-ratelimit-{kind}-remaining")
+                if remaining is None:
+                    continue
+                reset = _seconds_until(headers.get(f"anthropic-ratelimit-{kind}-reset"))
+                self._budgets[kind] = (int(remaining), now + reset)
+            retry_after = headers.get("retry-after")
+            if retry_after:
+                try:
+                    self._paused_until = max(self._paused_until, now + float(retry_after))
+                except ValueError:
+                    pass
+
+    def acquire(self, input_tokens: int, output_tokens: int) -> None:
+        """Block until the estimated usage fits every known budget, then reserve it."""
+        needs = {
+            "requests": 1,
+            "tokens": input_tokens + output_tokens,
+            "input-tokens": input_tokens,
+            "output-tokens": output_tokens,
+        }
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                for kind, (remaining, reset_at) in self._budgets.items():
+                    if remaining < needs[kind] and reset_at > now:
+                        wait = max(wait, reset_at - now)
+                if wait <= 0:
+                    # Budgets past their reset are unknown until the next response
+                    self._budgets = {
+                        kind: (remaining - needs[kind], reset_at)
+                        for kind, (remaining, reset_at) in self._budgets.items()
+                        if reset_at > now
+                    }
+                    return
+            time.sleep(wait)
+
+
+@dataclass
+class UsageStats:
+    """Token usage across Claude requests, including prompt cache hits."""
+
+    requests: int = 0
+    cached_summaries: int = 0  # Served from the local summary cache
+    input_tokens: int = 0  # Uncached input
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    output_tokens: int = 0
+
+
+_usage = UsageStats()
+_usage_lock = threading.Lock()
+
+
+def _record_usage(usage) -> None:
+    """Add a response's usage block to the running totals."""
+    with _usage_lock:
+        _usage.requests += 1
+        for name in (
+            "input_tokens",
+            "cache_creation_input_tokens",
+            "cache_read_input_tokens",
+            "output_tokens",
+        ):
+            setattr(_usage, name, getattr(_usage, name) + (getattr(usage, name, None) or 0))
+
+
+def get_usage() -> UsageStats:
+    """Get a snapshot of token usage so far."""
+    with _usage_lock:
+        return replace(_usage)
+
+
+def reset_usage() -> None:
+    """Clear token usage totals."""
+    global _usage
+    with _usage_lock:
+        _usage = UsageStats()
+
+
+def format_usage() -> list[str]:
+    """Format token usage as human-readable lines."""
+    usage = get_usage()
+    lines = []
+    if usage.cached_summaries:
+        lines.append(f"{usage.cached_summaries} summaries reused from the local cache")
+    if not usage.requests:
+        return lines
+    total_input = usage.input_tokens + usage.cache_creation_input_tokens + usage.cache_read_input_tokens
+    hit_rate = usage.cache_read_input_tokens / total_input if total_input else 0.0
+    return lines + [
+        f"{usage.requests} requests, {total_input} input tokens, {usage.output_tokens} output tokens",
+        f"prompt cache: {usage.cache_read_input_tokens} tokens read ({hit_rate:.0%} of input), "
+        f"{usage.cache_creation_input_tokens} written",
+    ]
+
+
+def _seconds_until(timestamp: str | None) -> float:
+    """Seconds from now until an RFC 3339 timestamp (0 if missing or past)."""
+    if not timestamp:
+        return 0.0
+    try:
+        when = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return 0.0
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+_client: anthropic.Anthropic | None = None
+_client_lock = threading.Lock()
+_tracker = RateLimitTracker()
+
+
+_cache: SummaryCache | None = None
+_cache_disabled = False
+
+
+def get_cache() -> SummaryCache | None:
+    """Get the machine-wide summary cache, or None if it cannot be opened."""
+    global _cache, _cache_disabled
+    with _client_lock:
+        if _cache is None and not _cache_disabled:
+            try:
+                _cache = SummaryCache(default_cache_dir() / "summaries.db")
+            except (OSError, sqlite3.Error):
+                _cache_disabled = True
+        return _cache
+
+
+def cached_summary(key: str) -> str | None:
+    """Get the cached summary for a request key, counting the hit."""
+    cache = get_cache()
+    summary = cache.get(key) if cache else None
+    if summary is not None:
+        with _usage_lock:
+            _usage.cached_summaries += 1
+    return summary
+
+
+def cache_summary(key: str, summary: str) -> None:
+    """Store a successful summary under its request key."""
+    cache = get_cache()
+    if cache:
+        cache.put(key, MODEL, summary)
+
+
+def get_client() -> anthropic.Anthropic:
+    """Get the shared Anthropic client (one connection pool per process)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = anthropic.Anthropic()
+        return _client
+
+
+def message_params(prompt_template: str, context: str, max_tokens: int) -> dict:
+    """
+    Build request parameters. The shared template is a system block marked
+    for prompt caching, so only the per-item context varies between requests.
+    The API caches prefixes of at least 1024 tokens (2048 on Haiku); shorter
+    templates are sent the same way but billed uncached.
+    """
+    return {
+        "model": MODEL,
+        "max_tokens": max_tokens,
+        "system": [
+            {"type": "text", "text": prompt_template, "cache_control": {"type": "ephemeral"}}
+        ],
+        "messages": [{"role": "user", "content": context}],
+    }
+
+
+def _create(
+    prompt_template: str,
+    context: str,
+    max_tokens: int,
+    client=None,
+    tracker: RateLimitTracker | None = None,
+) -> str:
+    """
+    Send one message, pacing by the rate limit tracker, and return its text.
+    Identical requests are answered from the summary cache.
+    """
+    params = message_params(prompt_template, context, max_tokens)
+    key = request_key(params)
+    summary = cached_summary(key)
+    if summary is not None:
+        return summary
+
+    client = client or get_client()
+    tracker = tracker or _tracker
+    # Rough estimate: ~4 characters per token
+    tracker.acquire((len(prompt_template) + len(context)) // 4, max_tokens)
+    try:
+        raw = client.messages.with_raw_response.create(**params)
+    except anthropic.APIStatusError as e:
+        tracker.update(e.response.headers)
+        raise
+    tracker.update(raw.headers)
+    message = raw.parse()
+    _record_usage(message.usage)
+    summary = message.content[0].text
+    cache_summary(key, summary)
+    return summary
+
 
 def load_prompt_template(prompt_path: Path | None = None) -> str:
     """Load the summary prompt template."""
@@ -25,13 +270,9 @@ def load_prompt_template(prompt_path: Path | None = None) -> str:
 Provide: one-sentence claim, key methods, key results, limitations."""
 
 
-def summarize_paper(paper: Paper, prompt_template: str | None = None) -> str:
-    """Generate a summary for a paper using Claude."""
-    if prompt_template is None:
-        prompt_template = load_prompt_template()
-
-    # Build the paper context
-    paper_context = f"""Title: {paper.title}
+def paper_context(paper: Paper) -> str:
+    """Build the per-paper part of a summary request."""
+    return f"""Title: {paper.title}
 
 Authors: {paper.authors}
 
@@ -43,22 +284,72 @@ Abstract:
 {paper.abstract if paper.abstract else "(No abstract available)"}
 """
 
-    client = anthropic.Anthropic()
 
-    try:
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1500,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"{prompt_template}\n\n---\n\n{paper_context}",
-                }
-            ],
-        )
-        return message.content[0].text
-    except anthropic.APIError as e:
-        return f"(Summary unavailable: {e})"
+def summarize_paper(
+    paper: Paper,
+    prompt_template: str | None = None,
+    client=None,
+    tracker: RateLimitTracker | None = None,
+) -> str:
+    """
+    Generate a summary for a paper using Claude.
+
+    Raises anthropic.APIError on failure, so callers can queue a retry
+    instead of storing an error message as the summary.
+    """
+    if prompt_template is None:
+        prompt_template = load_prompt_template()
+
+    return _create(prompt_template, paper_context(paper), PAPER_MAX_TOKENS, client, tracker)
+
+
+def summarize_papers(
+    papers: list[Paper],
+    prompt_template: str | None = None,
+    max_workers: int = DEFAULT_WORKERS,
+    client=None,
+    tracker: RateLimitTracker | None = None,
+    on_error: Callable[[Paper, Exception], None] | None = None,
+) -> Iterator[tuple[Paper, str]]:
+    """
+    Summarize papers over a bounded worker pool, yielding (paper, summary)
+    pairs as they complete. Requests are paced by the shared rate limit
+    tracker, so throughput approaches the API limits. Papers that fail are
+    passed to on_error (if given) and skipped.
+    """
+    if prompt_template is None:
+        prompt_template = load_prompt_template()
+    return _summarize_concurrently(
+        summarize_paper, papers, prompt_template, max_workers, client, tracker, on_error
+    )
+
+
+def _summarize_concurrently(
+    summarize: Callable[..., str],
+    items: list,
+    prompt_template: str,
+    max_workers: int,
+    client,
+    tracker: RateLimitTracker | None,
+    on_error: Callable[..., None] | None,
+) -> Iterator[tuple]:
+    """Run a summarize function over items in a thread pool, yielding as completed."""
+    if not items:
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(summarize, item, prompt_template, client, tracker): item
+            for item in items
+        }
+        for future in as_completed(futures):
+            try:
+                summary = future.result()
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(futures[future], e)
+                continue
+            yield futures[future], summary
 
 
 def load_trial_prompt_template(prompt_path: Path | None = None) -> str:
@@ -74,19 +365,13 @@ def load_trial_prompt_template(prompt_path: Path | None = None) -> str:
 Focus on novel mechanisms, potential impact, and unique study design aspects."""
 
 
-def summarize_trial(
-    trial: "ClinicalTrial", prompt_template: str | None = None
-) -> str:
-    """Generate a 'why it matters' summary for a clinical trial using Claude."""
-    if prompt_template is None:
-        prompt_template = load_trial_prompt_template()
-
-    # Build the trial context
+def trial_context(trial: "ClinicalTrial") -> str:
+    """Build the per-trial part of a summary request."""
     conditions_str = ", ".join(trial.conditions) if trial.conditions else "N/A"
     interventions_str = ", ".join(trial.interventions) if trial.interventions else "N/A"
     collaborators_str = ", ".join(trial.collaborators) if trial.collaborators else "N/A"
 
-    trial_context = f"""NCT ID: {trial.nct_id}
+    return f"""NCT ID: {trial.nct_id}
 Title: {trial.title}
 Phase: {trial.phase}
 Status: {trial.status}
@@ -102,19 +387,70 @@ Brief Summary:
 {trial.brief_summary if trial.brief_summary else '(No summary available)'}
 """
 
-    client = anthropic.Anthropic()
 
-    try:
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=300,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"{prompt_template}\n\n---\n\n{trial_context}",
-                }
-            ],
-        )
-        return message.content[0].text
-    except anthropic.APIError as e:
-        return f"(Summary unavailable: {e})"
+def summarize_trial(
+    trial: "ClinicalTrial",
+    prompt_template: str | None = None,
+    client=None,
+    tracker: RateLimitTracker | None = None,
+) -> str:
+    """
+    Generate a 'why it matters' summary for a clinical trial using Claude.
+
+    Raises anthropic.APIError on failure.
+    """
+    if prompt_template is None:
+        prompt_template = load_trial_prompt_template()
+
+    return _create(prompt_template, trial_context(trial), TRIAL_MAX_TOKENS, client, tracker)
+
+
+def summarize_trials(
+    trials: list["ClinicalTrial"],
+    prompt_template: str | None = None,
+    max_workers: int = DEFAULT_WORKERS,
+    client=None,
+    tracker: RateLimitTracker | None = None,
+    on_error: Callable[["ClinicalTrial", Exception], None] | None = None,
+) -> Iterator[tuple["ClinicalTrial", str]]:
+    """Summarize trials over a bounded worker pool, yielding (trial, summary) as completed."""
+    if prompt_template is None:
+        prompt_template = load_trial_prompt_template()
+    return _summarize_concurrently(
+        summarize_trial, trials, prompt_template, max_workers, client, tracker, on_error
+    )
+
+
+def batch_request(custom_id: str, prompt_template: str, context: str, max_tokens: int) -> dict:
+    """Build one Message Batches request."""
+    return {
+        "custom_id": custom_id,
+        "params": message_params(prompt_template, context, max_tokens),
+    }
+
+
+def submit_batch(requests: list[dict], client=None) -> str:
+    """Submit requests as one Message Batch and return its ID."""
+    client = client or get_client()
+    return client.messages.batches.create(requests=requests).id
+
+
+def batch_ended(batch_id: str, client=None) -> bool:
+    """Check whether a batch has finished processing."""
+    client = client or get_client()
+    return client.messages.batches.retrieve(batch_id).processing_status == "ended"
+
+
+def batch_results(batch_id: str, client=None) -> Iterator[tuple[str, str | None]]:
+    """
+    Yield (custom_id, summary) for each request of an ended batch. The
+    summary is None for requests that errored, expired or were canceled.
+    """
+    client = client or get_client()
+    for entry in client.messages.batches.results(batch_id):
+        result = entry.result
+        if result.type == "succeeded":
+            _record_usage(result.message.usage)
+            yield entry.custom_id, result.message.content[0].text
+        else:
+            yield entry.custom_id, None
@@ -0,0 +1,77 @@
+"""Content-addressed cache of Claude summaries, shared across projects.
+
+Summaries on the papers table are tied to one project and one paper ID, so
+a paper re-ingested under a new ID, or watched by another project, would
+be paid for again. This cache keys each summary by a hash of the complete
+request (model, max_tokens, prompt template and item context), so any
+identical request on the same machine reuses the stored answer.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+
+def default_cache_dir() -> Path:
+    """Get the cache directory: $LITSCOUT_CACHE_DIR, else the XDG cache dir."""
+    override = os.environ.get("LITSCOUT_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg).expanduser() if xdg else Path.home() / ".cache") / "litscout"
+
+
+def request_key(params: dict) -> str:
+    """Hash Messages API request parameters into a cache key."""
+    canonical = json.dumps(params, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class SummaryCache:
+    """SQLite-backed summary cache keyed by request hash."""
+
+    def __init__(self, db_path: Path | str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            # WAL lets runs from several projects read while one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> str | None:
+        """Get the cached summary for a request key."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, summary: str) -> None:
+        """Store a summary under its request key."""
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO summaries (key, model, summary, created_at)
+                   VALUES (?, ?, ?, ?)""",
+                (key, model, summary, datetime.now().isoformat()),
+            )
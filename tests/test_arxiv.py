@@ -0,0 +1,111 @@
+"""Tests for the arXiv fetcher."""
+
+import time
+from datetime import datetime, timedelta
+
+from litscout.sources import arxiv
+
+
+def _entry(n: int, published: datetime) -> str:
+    return f"""
+  <entry>
+    <id>http://arxiv.org/abs/2401.{n:05d}v1</id>
+    <published>{published.strftime("%Y-%m-%dT%H:%M:%SZ")}</published>
+    <title>Paper {n}</title>
+    <summary>Abstract {n}</summary>
+    <author><name>Jane Doe</name></author>
+  </entry>"""
+
+
+class _FakeArxiv:
+    """Serves Atom pages from a newest-first list of publication times."""
+
+    def __init__(self, published: list[datetime]):
+        self.published = published
+        self.requests: list[dict] = []
+
+    def get(self, url, params=None, **kwargs):
+        assert url == arxiv.ARXIV_API_URL
+        self.requests.append(dict(params))
+        start, size = params["start"], params["max_results"]
+        entries = "".join(
+            _entry(n, self.published[n]) for n in range(start, min(start + size, len(self.published)))
+        )
+        xml = (
+            '<feed xmlns="http://www.w3.org/2005/Atom" '
+            'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+            f"<opensearch:totalResults>{len(self.published)}</opensearch:totalResults>"
+            f"{entries}</feed>"
+        )
+
+        class _Response:
+            content = xml.encode()
+
+        return _Response()
+
+
+def _install(monkeypatch, published: list[datetime]) -> _FakeArxiv:
+    fake = _FakeArxiv(published)
+    monkeypatch.setattr(arxiv.http, "get", fake.get)
+    return fake
+
+
+def test_convert_query_adds_date_window():
+    """Test that since becomes a submittedDate range."""
+    since = datetime(2024, 1, 2, 3, 4).astimezone()
+
+    q = arxiv._convert_query("tau AND amyloid[tiab]", since)
+
+    assert q.startswith("(all:tau AND amyloid) AND submittedDate:[")
+    assert arxiv._convert_query("tau") == "all:tau"
+
+
+def test_fetch_pages_until_total(monkeypatch):
+    """Test that all pages are fetched when nothing crosses since."""
+    now = datetime.utcnow()
+    fake = _install(monkeypatch, [now - timedelta(minutes=n) for n in range(25)])
+
+    papers = list(arxiv.fetch_arxiv("tau", "T", page_size=10))
+
+    assert [p.title for p in papers] == [f"Paper {n}" for n in range(25)]
+    assert [r["start"] for r in fake.requests] == [0, 10, 20]
+
+
+def test_fetch_stops_at_since_boundary(monkeypatch):
+    """Test that paging stops on the page that crosses since."""
+    now = datetime.utcnow()
+    fake = _install(monkeypatch, [now - timedelta(hours=n) for n in range(50)])
+
+    # since is naive local time, as cmd_run passes it
+    since = datetime.now() - timedelta(hours=14, minutes=30)
+    papers = list(arxiv.fetch_arxiv("tau", "T", since=since, page_size=10))
+
+    assert len(papers) == 15
+    assert [r["start"] for r in fake.requests] == [0, 10]
+
+
+def test_fetch_compares_since_in_utc(monkeypatch):
+    """Test that a local since east of UTC does not drop papers inside the window."""
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    try:
+        now = datetime.utcnow()
+        _install(monkeypatch, [now - timedelta(hours=2), now - timedelta(hours=5)])
+
+        papers = list(arxiv.fetch_arxiv("tau", "T", since=datetime.now() - timedelta(hours=3)))
+    finally:
+        monkeypatch.delenv("TZ")
+        time.tzset()
+
+    assert [p.title for p in papers] == ["Paper 0"]
+
+
+def test_fetch_respects_max_results(monkeypatch):
+    """Test that max_results caps the entries requested and yielded."""
+    now = datetime.utcnow()
+    fake = _install(monkeypatch, [now - timedelta(minutes=n) for n in range(50)])
+
+    papers = list(arxiv.fetch_arxiv("tau", "T", max_results=15, page_size=10))
+
+    assert len(papers) == 15
+    assert [(r["start"], r["max_results"]) for r in fake.requests] == [(0, 10), (10, 5)]
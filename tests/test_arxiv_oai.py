@@ -0,0 +1,157 @@
+"""Tests for the arXiv OAI-PMH harvester."""
+
+import json
+from datetime import date, datetime, timedelta
+
+from litscout.sources import arxiv_oai
+
+
+def _record(arxiv_id: str, created: str, categories: str, title: str) -> str:
+    return f"""
+    <record>
+      <header><identifier>oai:arXiv.org:{arxiv_id}</identifier><datestamp>{created}</datestamp></header>
+      <metadata>
+        <arXiv xmlns="http://arxiv.org/OAI/arXiv/">
+          <id>{arxiv_id}</id>
+          <created>{created}</created>
+          <authors><author><keyname>Doe</keyname><forenames>Jane</forenames></author></authors>
+          <title>{title}</title>
+          <categories>{categories}</categories>
+          <abstract>An abstract about {title.lower()}.</abstract>
+        </arXiv>
+      </metadata>
+    </record>"""
+
+
+class _FakeOAI:
+    """Serves ListRecords pages of two records, chained by resumption tokens."""
+
+    def __init__(self, records: list[str]):
+        self.records = records
+        self.requests: list[dict] = []
+
+    def get(self, url, params=None, **kwargs):
+        assert url == arxiv_oai.OAI_URL
+        self.requests.append(dict(params))
+        page = int(params.get("resumptionToken", 0))
+        chunk = self.records[page * 2 : page * 2 + 2]
+        if not chunk:
+            body = '<error code="noRecordsMatch">none</error>'
+        else:
+            more = page * 2 + 2 < len(self.records)
+            token = f"<resumptionToken>{page + 1}</resumptionToken>" if more else "<resumptionToken/>"
+            body = f"<ListRecords>{''.join(chunk)}{token}</ListRecords>"
+        xml = f'<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">{body}</OAI-PMH>'
+
+        class _Response:
+            content = xml.encode()
+
+        return _Response()
+
+
+def test_set_spec():
+    """Test category to OAI set mapping."""
+    assert arxiv_oai.set_spec("q-bio.NC") == "q-bio"
+    assert arxiv_oai.set_spec("cs.LG") == "cs"
+    assert arxiv_oai.set_spec("hep-th") == "physics:hep-th"
+    assert arxiv_oai.set_spec("cond-mat.soft") == "physics:cond-mat"
+
+
+def test_harvest_follows_resumption_tokens(monkeypatch, tmp_path):
+    """Test that all pages are harvested and stored once."""
+    today = date.today().isoformat()
+    fake = _FakeOAI([_record(f"2401.0000{n}", today, "q-bio.NC", f"Paper {n}") for n in range(5)])
+    monkeypatch.setattr(arxiv_oai.http, "get", fake.get)
+    store = arxiv_oai.ArxivOAIStore(tmp_path / "oai.db")
+
+    assert store.harvest("q-bio", date.today(), date.today()) == 5
+    assert len(fake.requests) == 3
+    assert fake.requests[0]["set"] == "q-bio"
+    assert fake.requests[1] == {"verb": "ListRecords", "resumptionToken": "1"}
+
+    # Today is unsettled but already harvested by this store instance
+    assert store.harvest("q-bio", date.today(), date.today()) == 0
+    assert len(fake.requests) == 3
+
+
+def test_settled_days_are_not_reharvested(monkeypatch, tmp_path):
+    """Test that settled days persist across store instances."""
+    old = date.today() - timedelta(days=10)
+    fake = _FakeOAI([_record("2401.00001", old.isoformat(), "cs.LG", "Paper")])
+    monkeypatch.setattr(arxiv_oai.http, "get", fake.get)
+
+    arxiv_oai.ArxivOAIStore(tmp_path / "oai.db").harvest("cs", old, old)
+    store = arxiv_oai.ArxivOAIStore(tmp_path / "oai.db")
+
+    assert store.missing_ranges("cs", old - timedelta(days=2), old) == [
+        (old - timedelta(days=2), old - timedelta(days=1))
+    ]
+
+
+def test_fetch_filters_by_category_and_query(monkeypatch, tmp_path):
+    """Test that the topic query and categories are applied locally."""
+    today = date.today().isoformat()
+    fake = _FakeOAI(
+        [
+            _record("2401.00001", today, "q-bio.NC cs.LG", "Cortical dynamics"),
+            _record("2401.00002", today, "q-bio.GN", "Cortical genomics"),
+            _record("2401.00003", today, "q-bio.NC", "Protein folding"),
+        ]
+    )
+    monkeypatch.setattr(arxiv_oai.http, "get", fake.get)
+    store = arxiv_oai.ArxivOAIStore(tmp_path / "oai.db")
+
+    papers = list(
+        arxiv_oai.fetch_arxiv_oai(
+            "cortical OR neuron*",
+            "T",
+            since=datetime.now() - timedelta(days=1),
+            categories=["q-bio.NC"],
+            store=store,
+        )
+    )
+
+    assert [p.arxiv_id for p in papers] == ["2401.00001"]
+    paper = papers[0]
+    assert paper.id == "arxiv:2401.00001"
+    assert paper.authors == "Jane Doe"
+    assert paper.source == "arxiv"
+    assert paper.published_date == today
+
+
+def test_fetch_strips_field_tags(monkeypatch, tmp_path):
+    """Test that PubMed field tags in the query still match locally."""
+    today = date.today().isoformat()
+    fake = _FakeOAI([_record("2401.00001", today, "q-bio.NC", "Microglia in ageing")])
+    monkeypatch.setattr(arxiv_oai.http, "get", fake.get)
+    store = arxiv_oai.ArxivOAIStore(tmp_path / "oai.db")
+
+    papers = list(
+        arxiv_oai.fetch_arxiv_oai(
+            "microglia[tiab]",
+            "T",
+            since=datetime.now() - timedelta(days=1),
+            categories=["q-bio.NC"],
+            store=store,
+        )
+    )
+
+    assert [p.arxiv_id for p in papers] == ["2401.00001"]
+
+
+def test_categories_indexed_for_existing_store(tmp_path):
+    """Test that records stored before the category table are indexed on open."""
+    store = arxiv_oai.ArxivOAIStore(tmp_path / "oai.db")
+    item = {"id": "2401.00001", "datestamp": "2024-01-02", "created": "2024-01-02", "categories": ["cs.LG"]}
+    with store._connect() as conn:
+        conn.execute(
+            "INSERT INTO oai_records (arxiv_id, datestamp, created, data) VALUES (?, ?, ?, ?)",
+            (item["id"], item["datestamp"], item["created"], json.dumps(item)),
+        )
+        conn.execute("PRAGMA user_version = 0")
+
+    store = arxiv_oai.ArxivOAIStore(tmp_path / "oai.db")
+
+    day = date(2024, 1, 2)
+    assert [r["id"] for r in store.records(day, day, ["cs.LG"])] == ["2401.00001"]
+    assert list(store.records(day, day, ["q-bio.NC"])) == []
@@ -0,0 +1,119 @@
+"""Tests for the bioRxiv/medRxiv fetcher and local mirror."""
+
+from datetime import date, datetime, timedelta
+
+from litscout.sources import biorxiv, day_store, rxiv_mirror
+from litscout.sources.rxiv_mirror import RxivMirror
+
+
+class _FakeDetailsAPI:
+    """Serves /details pages from an in-memory list of records."""
+
+    def __init__(self, records: list[dict], page_size: int = 2):
+        self.records = records
+        self.page_size = page_size
+        self.urls: list[str] = []
+
+    def get(self, url, params=None, **kwargs):
+        self.urls.append(url)
+        server, start, end, cursor = url.rsplit("/", 4)[1:]
+        matching = [r for r in self.records if start <= r["date"] <= end]
+        page = matching[int(cursor) : int(cursor) + self.page_size]
+        if not matching:
+            body = {"messages": [{"status": "no posts found"}], "collection": []}
+        else:
+            body = {"messages": [{"status": "ok", "total": len(matching)}], "collection": page}
+        return _FakeResponse(body)
+
+
+class _FakeResponse:
+    def __init__(self, body: dict):
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+def _record(doi: str, day: date, title: str) -> dict:
+    return {
+        "doi": doi,
+        "version": "1",
+        "date": day.isoformat(),
+        "title": title,
+        "abstract": "",
+        "authors": "Doe, J.; Roe, R.",
+    }
+
+
+def _install(monkeypatch, records: list[dict]) -> _FakeDetailsAPI:
+    api = _FakeDetailsAPI(records)
+    monkeypatch.setattr(rxiv_mirror.http, "get", api.get)
+    return api
+
+
+def test_fetch_without_mirror_filters_by_query(monkeypatch, tmp_path):
+    """Test that records are filtered locally by the topic query."""
+    today = date.today()
+    _install(
+        monkeypatch,
+        [
+            _record("10.1/a", today - timedelta(days=3), "Microglia in tau models"),
+            _record("10.1/b", today - timedelta(days=2), "Unrelated plant biology"),
+            _record("10.1/c", today - timedelta(days=1), "Tau seeding assays"),
+        ],
+    )
+    since = datetime.now() - timedelta(days=5)
+
+    papers = list(biorxiv.fetch_biorxiv("tau", "T", since))
+
+    assert [p.doi for p in papers] == ["10.1/a", "10.1/c"]
+
+
+def test_mirror_downloads_settled_days_once(monkeypatch, tmp_path):
+    """Test that a second topic reuses mirrored days instead of re-fetching."""
+    today = date.today()
+    api = _install(
+        monkeypatch,
+        [_record(f"10.1/{i}", today - timedelta(days=10 - i), f"Tau paper {i}") for i in range(8)],
+    )
+    mirror = RxivMirror(tmp_path / "mirror.db")
+    since = datetime.now() - timedelta(days=10)
+
+    first = list(biorxiv.fetch_biorxiv("tau", "A", since, mirror=mirror))
+    calls_after_first = len(api.urls)
+    second = list(biorxiv.fetch_biorxiv("paper", "B", since, mirror=mirror))
+
+    assert len(first) == len(second) == 8
+    assert calls_after_first > 0
+    assert len(api.urls) == calls_after_first
+
+    # A new mirror instance (next run) only re-fetches unsettled recent days
+    mirror = RxivMirror(tmp_path / "mirror.db")
+    ranges = mirror.missing_ranges("biorxiv", since.date(), today)
+    assert ranges == [(today - timedelta(days=day_store.SETTLE_DAYS), today)]
+
+
+def test_missing_ranges_are_contiguous(tmp_path):
+    """Test that unsynced days are grouped into contiguous ranges."""
+    mirror = RxivMirror(tmp_path / "mirror.db")
+    start = date(2024, 1, 1)
+    mirror._mark_done("biorxiv", date(2024, 1, 3), date(2024, 1, 4))
+
+    ranges = mirror.missing_ranges("biorxiv", start, date(2024, 1, 6))
+
+    assert ranges == [
+        (date(2024, 1, 1), date(2024, 1, 2)),
+        (date(2024, 1, 5), date(2024, 1, 6)),
+    ]
+
+
+def test_parallel_pages_are_yielded_in_cursor_order(monkeypatch):
+    """Test that concurrently fetched pages keep cursor order."""
+    today = date.today()
+    records = [_record(f"10.1/{i:03d}", today, f"Tau {i}") for i in range(25)]
+    api = _install(monkeypatch, records)
+
+    items = list(rxiv_mirror.iter_details("biorxiv", today, today))
+
+    assert [item["doi"] for item in items] == [r["doi"] for r in records]
+    assert len(api.urls) == 13
@@ -63,3 +63,221 @@ def test_cli_run_requires_config():
     )
     # Should fail because no config found
     assert result.returncode != 0 or "No config" in result.stderr or "not found" in result.stderr
+
+
+def test_cli_search_local_corpus():
+    """Test that search queries the database next to the config."""
+    from litscout.db import Database, Paper
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yaml"
+        config_path.write_text("output_dir: reports\ntopics: []\n")
+        db = Database(Path(tmpdir) / "litscout.db")
+        db.add_paper(
+            Paper(
+                id="doi:10.1/a",
+                doi="10.1/a",
+                arxiv_id=None,
+                title="TREM2 variants in microglia",
+                authors="Jane Doe",
+                abstract="",
+                url="https://doi.org/10.1/a",
+                source="pubmed",
+                published_date="2024",
+                topic="T",
+                first_seen="2024-01-01T00:00:00",
+            )
+        )
+        db.close()
+
+        result = subprocess.run(
+            [sys.executable, "-m", "litscout", "search", "trem2", "-c", str(config_path)],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert "1. TREM2 variants in microglia" in result.stdout
+        assert "1 result(s)" in result.stdout
+
+
+def test_backfill_topic_links_matching_stored_papers(tmp_path):
+    """Test that a new topic picks up matching papers from the local corpus."""
+    from datetime import datetime
+
+    from litscout.__main__ import backfill_topic
+    from litscout.config import Topic
+    from litscout.db import Database, Paper
+
+    def paper(n: int, title: str, source: str = "pubmed") -> Paper:
+        return Paper(
+            id=f"doi:10.1/{n}",
+            doi=f"10.1/{n}",
+            arxiv_id=None,
+            title=title,
+            authors="",
+            abstract="",
+            url="",
+            source=source,
+            published_date="2024",
+            topic="Old topic",
+            first_seen="2024-06-01T00:00:00",
+            summary=f"Summary {n}",
+        )
+
+    db = Database(tmp_path / "litscout.db")
+    db.add_papers(
+        [
+            paper(1, "TREM2 signalling in microglia"),
+            paper(2, "TREM2 protocol for microglia isolation"),
+            paper(3, "Astrocyte metabolism"),
+            paper(4, "TREM2 in microglia, from arXiv", source="arxiv"),
+        ]
+    )
+    topic = Topic(
+        name="New topic",
+        query="trem2[tiab] AND (microglia OR macrophage)",
+        sources=["pubmed"],
+        exclude=["protocol"],
+    )
+
+    linked = backfill_topic(db, topic, datetime(2024, 1, 1))
+
+    assert [(p.id, p.topic, p.summary) for p in linked] == [("doi:10.1/1", "New topic", "Summary 1")]
+    assert backfill_topic(db, topic, datetime(2024, 1, 1)) == []
+    assert backfill_topic(db, topic, datetime(2025, 1, 1)) == []
+
+
+def test_backfill_topic_uses_publication_date(tmp_path):
+    """Test that backfill selects stored papers by publication date, not ingestion date."""
+    from datetime import datetime
+
+    from litscout.__main__ import backfill_topic
+    from litscout.config import Topic
+    from litscout.db import Database, Paper
+
+    def paper(n: int, published: str, first_seen: str) -> Paper:
+        return Paper(
+            id=f"doi:10.1/{n}",
+            doi=f"10.1/{n}",
+            arxiv_id=None,
+            title=f"TREM2 study {n}",
+            authors="",
+            abstract="",
+            url="",
+            source="pubmed",
+            published_date=published,
+            topic="Old topic",
+            first_seen=first_seen,
+        )
+
+    db = Database(tmp_path / "litscout.db")
+    db.add_papers(
+        [
+            paper(1, "2024-Mar-05", "2023-12-01T00:00:00"),  # ingested before the window
+            paper(2, "2019-Jan-10", "2024-06-01T00:00:00"),  # old paper, fetched recently
+            paper(3, "2024-Feb", "2024-06-01T00:00:00"),  # month before the window
+            paper(4, "", "2024-06-01T00:00:00"),  # undated: first seen in the window
+        ]
+    )
+    topic = Topic(name="New topic", query="trem2", sources=["pubmed"])
+
+    linked = backfill_topic(db, topic, datetime(2024, 3, 1))
+
+    assert sorted(p.id for p in linked) == ["doi:10.1/1", "doi:10.1/4"]
+
+
+def test_summarize_all_shares_summaries_across_topics(tmp_path, monkeypatch):
+    """Test that a paper selected by two topics is summarized once and stored."""
+    from dataclasses import replace
+
+    from litscout import __main__ as cli
+    from litscout.db import Database, Paper
+
+    paper = Paper(
+        id="doi:10.1/1",
+        doi="10.1/1",
+        arxiv_id=None,
+        title="TREM2 signalling in microglia",
+        authors="",
+        abstract="",
+        url="",
+        source="pubmed",
+        published_date="2024",
+        topic="A",
+        first_seen="2024-06-01T00:00:00",
+    )
+    db = Database(tmp_path / "litscout.db")
+    db.add_paper(paper)
+    requested = []
+
+    def fake_summarize_papers(papers, prompt_template, max_workers, on_error=None):
+        requested.extend(p.id for p in papers)
+        for p in papers:
+            yield p, f"Summary of {p.id}"
+
+    monkeypatch.setattr(cli, "summarize_papers", fake_summarize_papers)
+    copies = [paper, replace(paper, topic="B")]
+
+    cli.summarize_all(db, copies, [], "Prompt", max_workers=2, log=cli.Logger(cli.QUIET))
+
+    assert requested == ["doi:10.1/1"]
+    assert [p.summary for p in copies] == ["Summary of doi:10.1/1"] * 2
+    assert db.get_paper("doi:10.1/1").summary == "Summary of doi:10.1/1"
+
+
+def test_summarize_retry_drains_failed_summaries(tmp_path, monkeypatch):
+    """Test that failures are queued and `summarize --retry` fills them in."""
+    import argparse
+
+    from litscout import __main__ as cli
+    from litscout.db import Database, Paper
+
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    config_path = config_dir / "config.yaml"
+    config_path.write_text('output_dir: "./reports"\ntopics:\n  - name: "T"\n    query: "tau"\n')
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+
+    papers = [
+        Paper(
+            id=f"doi:10.1/{n}",
+            doi=f"10.1/{n}",
+            arxiv_id=None,
+            title=f"Paper {n}",
+            authors="",
+            abstract="",
+            url="",
+            source="pubmed",
+            published_date="2024",
+            topic="T",
+            first_seen="2024-06-01T00:00:00",
+        )
+        for n in range(3)
+    ]
+    db = Database(config_dir / "litscout.db")
+    db.add_papers(papers)
+
+    def overloaded(papers, prompt_template, max_workers, on_error=None):
+        for p in papers:
+            if p.id.endswith("/1"):
+                on_error(p, RuntimeError("overloaded"))
+            else:
+                yield p, f"Summary of {p.id}"
+
+    monkeypatch.setattr(cli, "summarize_papers", overloaded)
+    cli.summarize_all(db, papers, [], "Prompt", max_workers=2, log=cli.Logger(cli.QUIET))
+    assert db.get_paper("doi:10.1/1").summary is None
+    assert [p.id for p in db.pending_summary_papers(due_only=False)] == ["doi:10.1/1"]
+    db.close()
+
+    def recovered(papers, prompt_template, max_workers, on_error=None):
+        for p in papers:
+            yield p, f"Summary of {p.id}"
+
+    monkeypatch.setattr(cli, "summarize_papers", recovered)
+    assert cli.cmd_summarize(argparse.Namespace(config=str(config_path), retry=True)) == 0
+
+    db = Database(config_dir / "litscout.db")
+    assert db.get_paper("doi:10.1/1").summary == "Summary of doi:10.1/1"
+    assert db.pending_summary_papers(due_only=False) == []
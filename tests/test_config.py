@@ -135,3 +135,126 @@ topics:
 
         with pytest.raises(ConfigError, match="'to' address is empty"):
             Config.from_yaml(f.name)
+
+
+def test_config_fetch_defaults():
+    """Test that fetch concurrency defaults are applied."""
+    config_content = """
+output_dir: "./reports"
+topics:
+  - name: "Test"
+    query: "test"
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(config_content)
+        f.flush()
+
+        config = Config.from_yaml(f.name)
+
+        assert config.fetch.max_workers == 8
+        assert config.fetch.concurrency["arxiv"] == 1
+
+
+def test_config_fetch_concurrency_overrides():
+    """Test that per-source concurrency can be overridden."""
+    config_content = """
+output_dir: "./reports"
+fetch:
+  max_workers: 4
+  concurrency:
+    pubmed: 3
+topics:
+  - name: "Test"
+    query: "test"
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(config_content)
+        f.flush()
+
+        config = Config.from_yaml(f.name)
+
+        assert config.fetch.max_workers == 4
+        assert config.fetch.concurrency["pubmed"] == 3
+        assert config.fetch.concurrency["biorxiv"] == 2
+
+
+def test_config_fetch_validates_source():
+    """Test that unknown sources in fetch.concurrency raise ConfigError."""
+    config_content = """
+output_dir: "./reports"
+fetch:
+  concurrency:
+    scholar: 2
+topics:
+  - name: "Test"
+    query: "test"
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(config_content)
+        f.flush()
+
+        with pytest.raises(ConfigError, match="invalid source"):
+            Config.from_yaml(f.name)
+
+
+def test_config_fetch_pubmed_two_phase():
+    """Test that the PubMed two-phase flag is parsed and validated."""
+    base = """
+output_dir: "~/test/reports"
+topics:
+  - name: "Test Topic"
+    query: "test query"
+    sources: [pubmed]
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(base + "fetch:\n  pubmed_two_phase: true\n")
+        f.flush()
+        assert Config.from_yaml(f.name).fetch.pubmed_two_phase is True
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(base + "fetch:\n  pubmed_two_phase: 'yes'\n")
+        f.flush()
+        with pytest.raises(ConfigError, match="pubmed_two_phase"):
+            Config.from_yaml(f.name)
+
+
+def test_config_topic_arxiv_categories():
+    """Test that arxiv_categories is parsed and validated."""
+    template = """
+output_dir: "~/test/reports"
+topics:
+  - name: "Test Topic"
+    query: "test query"
+    sources: [arxiv]
+    arxiv_categories: {categories}
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(template.format(categories="[q-bio.NC, hep-th]"))
+        f.flush()
+        assert Config.from_yaml(f.name).topics[0].arxiv_categories == ["q-bio.NC", "hep-th"]
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(template.format(categories="q-bio.NC"))
+        f.flush()
+        with pytest.raises(ConfigError, match="arxiv_categories"):
+            Config.from_yaml(f.name)
+
+
+def test_config_summarize_max_workers():
+    """Test that summarize.max_workers is parsed and validated."""
+    base = """
+output_dir: "~/test/reports"
+topics:
+  - name: "Test Topic"
+    query: "test query"
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(base)
+        f.flush()
+        assert Config.from_yaml(f.name).summarize.max_workers == 4
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(base + "summarize:\n  max_workers: 0\n")
+        f.flush()
+        with pytest.raises(ConfigError, match="summarize.max_workers"):
+            Config.from_yaml(f.name)
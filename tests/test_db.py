@@ -0,0 +1,413 @@
+"""Tests for the paper database."""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from litscout.db import Database, Paper, paper_identifiers
+
+
+def _paper(
+    paper_id: str,
+    pmid: str | None = None,
+    doi: str | None = None,
+    arxiv_id: str | None = None,
+    title: str | None = None,
+) -> Paper:
+    return Paper(
+        id=paper_id,
+        doi=doi,
+        arxiv_id=arxiv_id,
+        title=title or f"Title {paper_id}",
+        authors="",
+        abstract="",
+        url="",
+        source="pubmed",
+        published_date="2024",
+        topic="T",
+        first_seen="2024-01-01T00:00:00",
+        pmid=pmid,
+    )
+
+
+def test_known_pmids(tmp_path):
+    """Test bulk lookup of stored PMIDs."""
+    db = Database(tmp_path / "papers.db")
+    for i in range(3):
+        db.add_paper(_paper(f"title:{i}", pmid=str(100 + i)))
+    db.add_paper(_paper("title:x"))
+
+    queried = [str(n) for n in range(0, 1200)]
+    assert db.known_pmids(queried) == {"100", "101", "102"}
+    assert db.known_pmids([]) == set()
+    assert db.get_paper("title:1").pmid == "101"
+
+
+def test_migrates_pmid_column(tmp_path):
+    """Test that databases from before the pmid column are upgraded."""
+    path = tmp_path / "papers.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """CREATE TABLE papers (
+            id TEXT PRIMARY KEY, doi TEXT, arxiv_id TEXT, title TEXT NOT NULL,
+            authors TEXT, abstract TEXT, url TEXT, source TEXT NOT NULL,
+            published_date TEXT, topic TEXT NOT NULL, first_seen TEXT NOT NULL,
+            summary TEXT
+        )"""
+    )
+    conn.commit()
+    conn.close()
+
+    db = Database(path)
+    db.add_paper(_paper("title:a", pmid="7"))
+
+    assert db.known_pmids(["7"]) == {"7"}
+
+
+def test_connection_is_reused_and_tuned(tmp_path):
+    """Test that each thread keeps one WAL-mode connection."""
+    db = Database(tmp_path / "papers.db")
+
+    with db._connect() as first, db._connect() as second:
+        assert first is second
+        assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert first.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    db.close()
+    db.add_paper(_paper("title:after-close"))
+    assert db.paper_exists("title:after-close")
+
+
+def test_failed_block_rolls_back(tmp_path):
+    """Test that an exception inside a block discards its writes."""
+    db = Database(tmp_path / "papers.db")
+
+    try:
+        with db._connect() as conn:
+            conn.execute("INSERT INTO run_state VALUES ('T', 'pubmed', '2024-01-01')")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert db.get_last_run("T", "pubmed") is None
+
+
+def test_threads_use_separate_connections(tmp_path):
+    """Test that writes from worker threads are visible to the main thread."""
+    db = Database(tmp_path / "papers.db")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda i: db.add_paper(_paper(f"title:{i}", pmid=str(i))), range(20)))
+
+    assert db.known_pmids(str(i) for i in range(20)) == {str(i) for i in range(20)}
+    db.close()
+
+
+def test_add_papers_returns_new_in_order(tmp_path):
+    """Test that add_papers inserts in bulk and reports only new papers."""
+    db = Database(tmp_path / "papers.db")
+    db.add_paper(_paper("title:b"))
+
+    batch = [_paper("title:c"), _paper("title:b"), _paper("title:a"), _paper("title:c", pmid="9")]
+    added = db.add_papers(batch)
+
+    assert [p.id for p in added] == ["title:c", "title:a"]
+    assert added[0] is batch[0]
+    assert db.get_paper("title:c").pmid is None
+    assert db.add_papers([]) == []
+    assert db.add_papers(batch) == []
+
+
+def test_add_paper_reports_duplicates(tmp_path):
+    """Test the single-paper wrapper."""
+    db = Database(tmp_path / "papers.db")
+
+    assert db.add_paper(_paper("title:a")) is True
+    assert db.add_paper(_paper("title:a")) is False
+
+
+def test_paper_identifiers_normalize():
+    """Test identifier normalization."""
+    identifiers = paper_identifiers(
+        "https://doi.org/10.1000/ABC", "2401.00001v3", "123", "Tau Spreading in the Human Cortex!"
+    )
+
+    assert identifiers[:3] == [("doi", "10.1000/abc"), ("arxiv", "2401.00001"), ("pmid", "123")]
+    assert identifiers[3][0] == "title"
+    assert paper_identifiers(None, None, None, "Editorial") == []
+
+
+def test_cross_identifier_dedupe(tmp_path):
+    """Test that a later record matching any identifier resolves to the first."""
+    db = Database(tmp_path / "papers.db")
+    title = "Tau spreading in the human cortex"
+    preprint = _paper("arxiv:2401.00001", arxiv_id="2401.00001", title=title)
+    assert db.add_papers([preprint]) == [preprint]
+
+    # Same title, now with a DOI and PMID: a duplicate of the preprint
+    journal = _paper("doi:10.1000/x", pmid="55", doi="10.1000/X", title=title.upper())
+    assert db.add_papers([journal]) == []
+    assert db.get_paper("doi:10.1000/x") is None
+
+    # Its DOI and PMID are now linked to the canonical record
+    other = _paper("doi:10.1000/x-dup", doi="10.1000/x", title="Different title entirely here ok")
+    assert db.add_papers([other]) == []
+    assert db.known_pmids(["55"]) == {"55"}
+
+
+def test_dedupe_within_batch(tmp_path):
+    """Test that duplicates inside one batch are caught."""
+    db = Database(tmp_path / "papers.db")
+    first = _paper("doi:10.1/a", doi="10.1/a", arxiv_id="2401.1")
+    second = _paper("arxiv:2401.1", arxiv_id="2401.1v2")
+
+    assert db.add_papers([first, second]) == [first]
+
+
+def test_backfills_identifiers(tmp_path):
+    """Test that papers stored before the identifier table are indexed."""
+    path = tmp_path / "papers.db"
+    db = Database(path)
+    db.add_paper(_paper("doi:10.1/a", doi="10.1/a"))
+    db.close()
+
+    conn = sqlite3.connect(path)
+    conn.execute("DELETE FROM paper_identifiers")
+    conn.execute("PRAGMA user_version = 0")
+    conn.commit()
+    conn.close()
+
+    db = Database(path)
+    assert db.add_papers([_paper("doi:10.1/A", doi="10.1/A")]) == []
+
+
+def test_near_duplicate_links_to_existing(tmp_path):
+    """Test that a revised preprint is linked to the stored version."""
+    db = Database(tmp_path / "papers.db")
+    abstract = (
+        "We measured tau accumulation across cortical regions in two hundred participants "
+        "using positron emission tomography and found regional spread patterns that follow "
+        "structural connectivity, supporting a prion-like propagation model."
+    )
+    v1 = _paper("doi:10.1101/1", doi="10.1101/1", title="Tau spreading in the human cortex")
+    v1.abstract = abstract
+    v2 = _paper("doi:10.1101/2", doi="10.1101/2", title="Tau spread across the human cortex")
+    v2.abstract = abstract
+    unrelated = _paper("doi:10.1101/3", doi="10.1101/3", title="CRISPR screens in human neurons")
+    unrelated.abstract = "Genome-wide knockout screens reveal regulators of lysosomal function."
+
+    assert db.add_papers([v1]) == [v1]
+    assert db.add_papers([v2, unrelated]) == [unrelated]
+
+    # The near-duplicate's DOI now resolves exactly to the first version
+    again = _paper("doi:10.1101/2-again", doi="10.1101/2", title="Short")
+    assert db.add_papers([again]) == []
+
+
+def test_title_only_papers_differing_by_one_token_stay_distinct(tmp_path):
+    """Test that papers without abstracts are never merged as near-duplicates."""
+    db = Database(tmp_path / "papers.db")
+    phase2 = _paper("doi:10.1/1", doi="10.1/1", title="Phase 2 trial of lecanemab in early Alzheimer disease")
+    phase3 = _paper("doi:10.1/2", doi="10.1/2", title="Phase 3 trial of lecanemab in early Alzheimer disease")
+
+    assert db.add_papers([phase2]) == [phase2]
+    assert db.add_papers([phase3]) == [phase3]
+    assert db.get_paper("doi:10.1/2").title == phase3.title
+
+    # The second DOI resolves to its own record
+    again = _paper("doi:10.1/2-again", doi="10.1/2", title="Short")
+    again.topic = "Other"
+    assert [p.id for p in db.add_papers([again])] == ["doi:10.1/2"]
+
+
+def test_seen_papers_answered_from_memory(tmp_path, monkeypatch):
+    """Test that repeats are recognized without touching SQLite."""
+    path = tmp_path / "papers.db"
+    first = Database(path)
+    first.add_paper(_paper("doi:10.1/a", pmid="1", doi="10.1/a"))
+    first.close()
+
+    db = Database(path)
+
+    def no_sql():
+        raise AssertionError("unexpected SQLite access")
+
+    monkeypatch.setattr(db, "_connect", no_sql)
+    assert db.paper_exists("doi:10.1/a")
+    assert db.add_papers([_paper("doi:10.1/a", pmid="1", doi="10.1/a")]) == []
+    assert db.known_pmids(["1"]) == {"1"}
+
+
+def test_unseen_identifiers_fall_through_to_sqlite(tmp_path):
+    """Test that writes by another instance are still found."""
+    path = tmp_path / "papers.db"
+    db = Database(path)
+    other = Database(path)
+    other.add_paper(_paper("doi:10.1/a", pmid="1", doi="10.1/a"))
+
+    assert db.paper_exists("doi:10.1/a")
+    assert db.known_pmids(["1", "2"]) == {"1"}
+    assert db.add_papers([_paper("doi:10.1/a", doi="10.1/a")]) == []
+
+
+def test_duplicate_attaches_to_new_topic(tmp_path):
+    """Test that a stored paper found by a second topic is returned with its summary."""
+    db = Database(tmp_path / "papers.db")
+    first = _paper("doi:10.1/a", doi="10.1/a", pmid="7")
+    db.add_papers([first])
+    db.update_summary("doi:10.1/a", "Summary")
+
+    again = _paper("doi:10.1/a", doi="10.1/a", pmid="7")
+    again.topic = "Other"
+    (attached,) = db.add_papers([again])
+
+    assert attached.topic == "Other"
+    assert attached.summary == "Summary"
+    assert db.get_paper("doi:10.1/a").topic == "T"
+
+    # Already a member of both topics: nothing new for either
+    assert db.add_papers([again]) == []
+    assert db.add_papers([first]) == []
+    reopened = Database(tmp_path / "papers.db")
+    assert reopened.add_papers([again]) == []
+
+
+def test_papers_by_pmid(tmp_path):
+    """Test that stored papers are looked up by any linked PMID."""
+    db = Database(tmp_path / "papers.db")
+    db.add_papers([_paper("doi:10.1/a", doi="10.1/a", pmid="7")])
+
+    found = db.papers_by_pmid(["7", "8"])
+
+    assert list(found) == ["7"]
+    assert found["7"].id == "doi:10.1/a"
+
+
+def test_search_ranks_and_filters(tmp_path):
+    """Test full-text search with bm25 ranking and filters."""
+    db = Database(tmp_path / "papers.db")
+    title_hit = _paper("doi:10.1/a", doi="10.1/a", title="TREM2 variants in microglia")
+    abstract_hit = _paper("doi:10.1/b", doi="10.1/b", title="Innate immunity in the aging brain")
+    abstract_hit.abstract = "We profile TREM2 signalling."
+    abstract_hit.source = "biorxiv"
+    miss = _paper("doi:10.1/c", doi="10.1/c", title="Retinal organoids")
+    db.add_papers([title_hit, abstract_hit, miss])
+
+    assert [p.id for p in db.search("trem2")] == ["doi:10.1/a", "doi:10.1/b"]
+    assert [p.id for p in db.search("trem2", source="biorxiv")] == ["doi:10.1/b"]
+    assert db.search("trem2", topic="Other") == []
+    assert db.search("trem2", until="2023-12-31") == []
+    assert len(db.search("trem2", since="2024-01-01", until="2024-01-01")) == 2
+
+    # Summaries are indexed as they are written
+    db.update_summary("doi:10.1/c", "Organoids model photoreceptor loss.")
+    assert [p.id for p in db.search("photoreceptor")] == ["doi:10.1/c"]
+
+
+def test_search_survives_vacuum_after_docid_migration(tmp_path):
+    """Test that papers indexed on implicit rowids move to docid and stay searchable."""
+    path = tmp_path / "papers.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """CREATE TABLE papers (
+            id TEXT PRIMARY KEY, doi TEXT, arxiv_id TEXT, title TEXT NOT NULL,
+            authors TEXT, abstract TEXT, url TEXT, source TEXT NOT NULL,
+            published_date TEXT, topic TEXT NOT NULL, first_seen TEXT NOT NULL,
+            summary TEXT, pmid TEXT
+        );
+        CREATE VIRTUAL TABLE papers_fts USING fts5(
+            title, abstract, authors, summary, content='papers', content_rowid='rowid'
+        );
+        PRAGMA user_version = 6;"""
+    )
+    for n, title in enumerate(["Gap", "TREM2 variants", "Retinal organoids"]):
+        conn.execute(
+            """INSERT INTO papers (id, title, url, source, topic, first_seen)
+               VALUES (?, ?, '', 'pubmed', 'T', '2024')""",
+            (f"p{n}", title),
+        )
+    conn.execute("DELETE FROM papers WHERE id = 'p0'")
+    conn.execute("INSERT INTO papers_fts (papers_fts) VALUES ('rebuild')")
+    conn.commit()
+    conn.close()
+
+    db = Database(path)
+    with db._connect() as conn:
+        conn.execute("VACUUM")
+
+    assert [p.id for p in db.search("trem2")] == ["p1"]
+    assert [p.id for p in db.search("organoids")] == ["p2"]
+    db.add_paper(_paper("p3", title="TREM2 signalling"))
+    assert {p.id for p in db.search("trem2")} == {"p1", "p3"}
+    with db._connect() as conn:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_papers_topic", "idx_papers_pmid"} <= indexes
+
+
+def test_search_rejects_bad_syntax(tmp_path):
+    """Test that malformed FTS queries raise ValueError."""
+    db = Database(tmp_path / "papers.db")
+
+    with pytest.raises(ValueError):
+        db.search('"unbalanced')
+
+
+def test_summary_retry_queue_backs_off(tmp_path, monkeypatch):
+    """Test that failed summaries are queued with growing backoff and cleared on success."""
+    from datetime import datetime, timedelta
+
+    from litscout import db as db_module
+
+    db = Database(tmp_path / "papers.db")
+    db.add_papers([_paper("a"), _paper("b")])
+    db.queue_summary_retry("a", "overloaded")
+    db.queue_summary_retry("b", "overloaded")
+    db.queue_summary_retry("b", "overloaded again")
+
+    assert db.pending_summary_papers() == []
+    assert [p.id for p in db.pending_summary_papers(due_only=False)] == ["a", "b"]
+
+    class _Later(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(minutes=20)
+
+    monkeypatch.setattr(db_module, "datetime", _Later)
+    # "a" waited 15 minutes after one failure; "b" waits 30 after two
+    assert [p.id for p in db.pending_summary_papers()] == ["a"]
+
+    db.update_summary("a", "Summary")
+    assert [p.id for p in db.pending_summary_papers(due_only=False)] == ["b"]
+
+
+def test_summary_retry_gives_up_after_max_attempts(tmp_path):
+    """Test that a paper leaves the retry queue after MAX_SUMMARY_ATTEMPTS failures."""
+    from litscout.db import MAX_SUMMARY_ATTEMPTS
+
+    db = Database(tmp_path / "papers.db")
+    db.add_papers([_paper("a")])
+
+    results = [db.queue_summary_retry("a", "overloaded") for _ in range(MAX_SUMMARY_ATTEMPTS)]
+
+    assert results == [True] * (MAX_SUMMARY_ATTEMPTS - 1) + [False]
+    assert db.pending_summary_papers(due_only=False) == []
+    with db._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM pending_summaries").fetchone()[0] == 0
+
+
+def test_migrates_stored_error_summaries_to_retry_queue(tmp_path):
+    """Test that error messages stored as summaries by older versions are queued."""
+    path = tmp_path / "papers.db"
+    db = Database(path)
+    db.add_papers([_paper("a"), _paper("b")])
+    db.update_summary("a", "(Summary unavailable: Overloaded)")
+    db.update_summary("b", "Real summary")
+    with db._connect() as conn:
+        conn.execute("PRAGMA user_version = 4")
+    db.close()
+
+    db = Database(path)
+
+    assert db.get_paper("a").summary is None
+    assert db.get_paper("b").summary == "Real summary"
+    assert [p.id for p in db.pending_summary_papers()] == ["a"]
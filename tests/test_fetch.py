@@ -0,0 +1,123 @@
+"""Tests for the concurrent fetch stage."""
+
+import threading
+import time
+from datetime import datetime
+
+from litscout.db import Paper
+from litscout.fetch import FetchJob, group_by_topic, ordered_map, run_fetch_jobs
+
+
+def _make_paper(topic: str, source: str, n: int) -> Paper:
+    return Paper(
+        id=f"test:{topic}:{source}:{n}",
+        doi=None,
+        arxiv_id=None,
+        title=f"{topic} {source} {n}",
+        authors="",
+        abstract="",
+        url="https://example.com",
+        source=source,
+        published_date="2024-01-01",
+        topic=topic,
+        first_seen=datetime.now().isoformat(),
+    )
+
+
+def _jobs(topics: list[str], sources: list[str]) -> list[FetchJob]:
+    since = datetime(2024, 1, 1)
+    return [
+        FetchJob(topic=t, source=s, query="q", since=since)
+        for t in topics
+        for s in sources
+    ]
+
+
+def test_results_are_in_job_order():
+    """Test that results come back in job order regardless of completion."""
+
+    def slow_first(query, topic, since):
+        # Earlier topics finish last
+        time.sleep(0.05 if topic == "A" else 0)
+        yield _make_paper(topic, "pubmed", 1)
+
+    jobs = _jobs(["A", "B", "C"], ["pubmed"])
+    results = run_fetch_jobs(jobs, {"pubmed": slow_first}, source_concurrency={"pubmed": 3})
+
+    assert [r.job.topic for r in results] == ["A", "B", "C"]
+    assert [r.papers[0].topic for r in results] == ["A", "B", "C"]
+
+
+def test_errors_are_captured_per_job():
+    """Test that a failing fetcher does not affect other jobs."""
+
+    def ok(query, topic, since):
+        yield _make_paper(topic, "arxiv", 1)
+
+    def broken(query, topic, since):
+        raise RuntimeError("boom")
+        yield
+
+    jobs = _jobs(["A"], ["pubmed", "arxiv"])
+    results = run_fetch_jobs(jobs, {"pubmed": broken, "arxiv": ok})
+
+    assert isinstance(results[0].error, RuntimeError)
+    assert results[0].papers == []
+    assert results[1].error is None
+    assert len(results[1].papers) == 1
+
+
+def test_source_concurrency_is_respected():
+    """Test that no more than the per-source limit run at once."""
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def fetcher(query, topic, since):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return []
+
+    jobs = _jobs(["A", "B", "C", "D", "E"], ["arxiv"])
+    run_fetch_jobs(jobs, {"arxiv": fetcher}, max_workers=8, source_concurrency={"arxiv": 2})
+
+    assert peak <= 2
+
+
+def test_group_by_topic():
+    """Test grouping results by topic keeps source order."""
+
+    def fetcher(query, topic, since):
+        return []
+
+    jobs = _jobs(["A", "B"], ["pubmed", "arxiv"])
+    results = run_fetch_jobs(jobs, {"pubmed": fetcher, "arxiv": fetcher})
+    grouped = group_by_topic(results)
+
+    assert list(grouped) == ["A", "B"]
+    assert [r.job.source for r in grouped["A"]] == ["pubmed", "arxiv"]
+
+
+def test_ordered_map_preserves_order_and_bounds_inflight():
+    """Test that ordered_map yields in input order with bounded concurrency."""
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def work(n):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01 * (5 - n % 5))
+        with lock:
+            active -= 1
+        return n * 2
+
+    assert list(ordered_map(work, range(12), max_workers=3)) == [n * 2 for n in range(12)]
+    assert peak <= 3
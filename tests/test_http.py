@@ -0,0 +1,100 @@
+"""Tests for the shared HTTP client."""
+
+import io
+
+import requests
+
+from litscout import http
+
+
+class _FakeResponse(requests.Response):
+    def __init__(self, status: int, body: bytes = b"", headers: dict | None = None):
+        super().__init__()
+        self.status_code = status
+        self._content = body
+        self.raw = io.BytesIO(body)
+        self.headers.update(headers or {})
+
+
+class _FakeSession:
+    def __init__(self, responses: list):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        item = self.responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def _install(monkeypatch, host: str, session: _FakeSession) -> list[float]:
+    sleeps: list[float] = []
+    monkeypatch.setitem(http._sessions, host, session)
+    monkeypatch.setattr(http.time, "sleep", sleeps.append)
+    monkeypatch.setattr(http.ratelimit, "acquire", lambda url: 0.0)
+    http.reset_stats()
+    return sleeps
+
+
+def test_retries_on_503_then_succeeds(monkeypatch):
+    """Test that transient 5xx responses are retried."""
+    session = _FakeSession([_FakeResponse(503), _FakeResponse(200, b"ok")])
+    sleeps = _install(monkeypatch, "example.org", session)
+
+    resp = http.get("https://example.org/x")
+
+    assert resp.content == b"ok"
+    assert session.calls == 2
+    assert len(sleeps) == 1
+    stats = http.get_stats()["example.org"]
+    assert stats.requests == 2
+    assert stats.retries == 1
+    assert stats.bytes == 2
+
+
+def test_honours_retry_after(monkeypatch):
+    """Test that Retry-After on 429 sets the retry delay."""
+    session = _FakeSession(
+        [_FakeResponse(429, headers={"Retry-After": "7"}), _FakeResponse(200)]
+    )
+    sleeps = _install(monkeypatch, "example.org", session)
+
+    http.get("https://example.org/x")
+
+    assert sleeps == [7.0]
+
+
+def test_retries_connection_errors(monkeypatch):
+    """Test that connection errors are retried."""
+    session = _FakeSession([requests.ConnectionError("reset"), _FakeResponse(200)])
+    _install(monkeypatch, "example.org", session)
+
+    assert http.get("https://example.org/x").status_code == 200
+
+
+def test_gives_up_after_max_retries(monkeypatch):
+    """Test that persistent failures raise after MAX_RETRIES."""
+    session = _FakeSession([_FakeResponse(500)] * (http.MAX_RETRIES + 1))
+    _install(monkeypatch, "example.org", session)
+
+    try:
+        http.get("https://example.org/x")
+    except requests.HTTPError:
+        pass
+    else:
+        raise AssertionError("expected HTTPError")
+    assert session.calls == http.MAX_RETRIES + 1
+
+
+def test_does_not_retry_client_errors(monkeypatch):
+    """Test that 4xx responses other than 429 fail immediately."""
+    session = _FakeSession([_FakeResponse(404)])
+    _install(monkeypatch, "example.org", session)
+
+    try:
+        http.get("https://example.org/x")
+    except requests.HTTPError:
+        pass
+    assert session.calls == 1
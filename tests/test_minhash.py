@@ -0,0 +1,48 @@
+"""Tests for MinHash near-duplicate detection."""
+
+from litscout import minhash
+
+ABSTRACT = (
+    "We measured tau accumulation across cortical regions in two hundred participants "
+    "using positron emission tomography and found regional spread patterns that follow "
+    "structural connectivity, supporting a prion-like propagation model."
+)
+
+
+def test_normalize_text_spells_out_greek_and_strips_accents():
+    """Test that Greek letters, accents and punctuation are normalized."""
+    assert minhash.normalize_text("Aβ-42 and τ: Café") == "a beta 42 and tau cafe"
+
+
+def test_short_text_has_no_signature():
+    """Test that very short texts are not signed."""
+    assert minhash.signature("Editorial") is None
+
+
+def test_variants_are_similar():
+    """Test that edited titles with the same abstract stay above the threshold."""
+    v1 = minhash.signature("Tau spreading in the human cortex. " + ABSTRACT)
+    v2 = minhash.signature("Tau spread across the human cortex: a PET study. " + ABSTRACT)
+    other = minhash.signature(
+        "CRISPR screens in human neurons identify regulators of lysosomal function "
+        "and reveal cell-type specific vulnerabilities."
+    )
+
+    assert minhash.similarity(v1, v2) >= minhash.THRESHOLD
+    assert set(minhash.band_keys(v1)) & set(minhash.band_keys(v2))
+    assert minhash.similarity(v1, other) < 0.2
+
+
+def test_signature_round_trip():
+    """Test that signatures survive serialization."""
+    sig = minhash.signature(ABSTRACT)
+
+    assert len(sig) == minhash.NUM_PERM
+    assert minhash.from_blob(minhash.to_blob(sig)) == sig
+
+
+def test_title_only_papers_are_not_signed():
+    """Test that papers without a substantial abstract get no signature."""
+    assert minhash.paper_signature("Phase 2 trial of lecanemab in early Alzheimer disease", "") is None
+    assert minhash.paper_signature("A title", "Too short to compare.") is None
+    assert minhash.paper_signature("Tau spreading", ABSTRACT) is not None
@@ -0,0 +1,256 @@
+"""Tests for the PubMed fetcher."""
+
+import io
+
+from litscout.db import Paper
+from litscout.sources import pubmed
+
+
+def _article_xml(pmid: int) -> str:
+    return f"""
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>{pmid}</PMID>
+      <Article>
+        <Journal><JournalIssue><PubDate><Year>2024</Year><Month>Jan</Month><Day>05</Day></PubDate></JournalIssue></Journal>
+        <ArticleTitle>Article {pmid}</ArticleTitle>
+        <Abstract><AbstractText Label="BACKGROUND">Abstract {pmid}</AbstractText></Abstract>
+        <AuthorList><Author><LastName>Doe</LastName><ForeName>Jane</ForeName></Author></AuthorList>
+      </Article>
+    </MedlineCitation>
+    <PubmedData><ArticleIdList><ArticleId IdType="doi">10.1000/{pmid}</ArticleId></ArticleIdList></PubmedData>
+  </PubmedArticle>"""
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes = b"", json_body: dict | None = None):
+        self.content = body
+        self.raw = io.BytesIO(body)
+        self._json = json_body
+
+    def json(self):
+        return self._json
+
+    def close(self):
+        self.raw.close()
+
+
+class _FakeEutils:
+    """Serves ESearch/EFetch responses for a fixed list of PMIDs."""
+
+    def __init__(self, pmids: list[int]):
+        self.pmids = pmids
+        self.requests: list[tuple[str, dict]] = []
+
+    def get(self, url, params=None, **kwargs):
+        params = dict(params or {})
+        self.requests.append((url, params))
+        if url == pubmed.ESEARCH_URL:
+            start = int(params.get("retstart", 0))
+            return _FakeResponse(
+                json_body={
+                    "esearchresult": {
+                        "count": str(len(self.pmids)),
+                        "webenv": "WE",
+                        "querykey": "1",
+                        "idlist": [str(p) for p in self.pmids[start : start + int(params.get("retmax", 0))]],
+                    }
+                }
+            )
+        raise AssertionError(f"unexpected URL {url}")
+
+    def post(self, url, data=None, **kwargs):
+        params = dict(data or {})
+        self.requests.append((url, params))
+        if url == pubmed.ESUMMARY_URL:
+            uids = params["id"].split(",")
+            result = {"uids": uids}
+            for uid in uids:
+                result[uid] = {
+                    "uid": uid,
+                    "title": f"Article {uid}",
+                    "pubdate": "2024 Jan 5",
+                    "authors": [{"name": "Doe J"}],
+                    # Only PMIDs divisible by 3 report an abstract
+                    "attributes": ["Has Abstract"] if int(uid) % 3 == 0 else [],
+                    # Only odd PMIDs have a DOI, so they rank higher
+                    "articleids": [{"idtype": "doi", "value": f"10.1000/{uid}"}] if int(uid) % 2 else [],
+                }
+            return _FakeResponse(json_body={"result": result})
+        if url == pubmed.EFETCH_URL:
+            if "id" in params:
+                chunk = [int(p) for p in params["id"].split(",")]
+            else:
+                start = int(params["retstart"])
+                chunk = self.pmids[start : start + int(params["retmax"])]
+            xml = "<PubmedArticleSet>" + "".join(_article_xml(p) for p in chunk) + "</PubmedArticleSet>"
+            return _FakeResponse(xml.encode())
+        raise AssertionError(f"unexpected URL {url}")
+
+
+def _install(monkeypatch, pmids: list[int]) -> _FakeEutils:
+    fake = _FakeEutils(pmids)
+    monkeypatch.setattr(pubmed.http, "get", fake.get)
+    monkeypatch.setattr(pubmed.http, "post", fake.post)
+    return fake
+
+
+def test_fetch_pages_history_in_chunks(monkeypatch):
+    """Test that EFetch pages the history server and keeps search order."""
+    pmids = list(range(1000, 1450))
+    fake = _install(monkeypatch, pmids)
+
+    papers = list(pubmed.fetch_pubmed("tau", "T", chunk_size=200))
+
+    assert [p.url for p in papers] == [f"https://pubmed.ncbi.nlm.nih.gov/{p}/" for p in pmids]
+    efetches = [params for url, params in fake.requests if url == pubmed.EFETCH_URL]
+    assert [(p["retstart"], p["retmax"]) for p in efetches] == [(0, 200), (200, 200), (400, 50)]
+    assert all(p["WebEnv"] == "WE" and p["query_key"] == "1" for p in efetches)
+
+
+def test_fetch_respects_max_results(monkeypatch):
+    """Test that max_results caps the number of articles fetched."""
+    _install(monkeypatch, list(range(1, 301)))
+
+    papers = list(pubmed.fetch_pubmed("tau", "T", max_results=250, chunk_size=100))
+
+    assert len(papers) == 250
+
+
+def test_parse_article_fields(monkeypatch):
+    """Test that article fields are parsed from EFetch XML."""
+    _install(monkeypatch, [42])
+
+    (paper,) = pubmed.fetch_pubmed("tau", "T")
+
+    assert paper.title == "Article 42"
+    assert paper.doi == "10.1000/42"
+    assert paper.id == "doi:10.1000/42"
+    assert paper.abstract == "BACKGROUND: Abstract 42"
+    assert paper.authors == "Jane Doe"
+    assert paper.published_date == "2024-Jan-05"
+    assert paper.pmid == "42"
+
+
+def _stored(pmid: str) -> Paper:
+    return Paper(
+        id=f"stored:{pmid}",
+        doi=None,
+        arxiv_id=None,
+        title=f"Stored {pmid}",
+        authors="",
+        abstract="",
+        url="",
+        source="pubmed",
+        published_date="2024",
+        topic="Other",
+        first_seen="2024-01-01T00:00:00",
+        summary="Already summarized",
+        pmid=pmid,
+    )
+
+
+def test_fetch_skips_known_pmids(monkeypatch):
+    """Test that known PMIDs are yielded as stored instead of EFetched."""
+    pmids = list(range(1, 11))
+    fake = _install(monkeypatch, pmids)
+    seen: list[list[str]] = []
+
+    def known(ids):
+        seen.append(ids)
+        return {str(p): _stored(str(p)) for p in pmids if p % 2 == 0}
+
+    papers = list(pubmed.fetch_pubmed("tau", "T", chunk_size=3, known_papers=known))
+
+    assert seen == [[str(p) for p in pmids]]
+    assert [p.pmid for p in papers] == ["2", "4", "6", "8", "10", "1", "3", "5", "7", "9"]
+    assert papers[0].summary == "Already summarized"
+    assert {p.topic for p in papers} == {"T"}
+    efetches = [params["id"] for url, params in fake.requests if url == pubmed.EFETCH_URL]
+    assert efetches == ["1,3,5", "7,9"]
+
+
+def test_fetch_pages_search_ids(monkeypatch):
+    """Test that PMIDs are paged from the history server with ESearch retstart."""
+    monkeypatch.setattr(pubmed, "ESEARCH_PAGE_SIZE", 4)
+    pmids = list(range(1, 11))
+    fake = _install(monkeypatch, pmids)
+    seen: list[list[str]] = []
+
+    def known(ids):
+        seen.append(ids)
+        return {}
+
+    papers = list(pubmed.fetch_pubmed("tau", "T", known_papers=known))
+
+    assert [p.pmid for p in papers] == [str(p) for p in pmids]
+    assert seen == [["1", "2", "3", "4"], ["5", "6", "7", "8"], ["9", "10"]]
+    searches = [params for url, params in fake.requests if url == pubmed.ESEARCH_URL]
+    assert [(p.get("retstart", 0), p["retmax"]) for p in searches] == [(0, 4), (4, 4), (8, 2)]
+    assert all(p["WebEnv"] == "WE" and p["term"] == "#1" for p in searches[1:])
+
+
+def test_fetch_all_known_skips_efetch(monkeypatch):
+    """Test that no EFetch request is made when every PMID is known."""
+    fake = _install(monkeypatch, [1, 2])
+
+    papers = list(
+        pubmed.fetch_pubmed("tau", "T", known_papers=lambda ids: {i: _stored(i) for i in ids})
+    )
+
+    assert [p.title for p in papers] == ["Stored 1", "Stored 2"]
+    assert [url for url, _ in fake.requests] == [pubmed.ESEARCH_URL]
+
+
+def test_iter_articles_streams_incrementally():
+    """Test that articles are yielded before the whole document is read."""
+    xml = ("<PubmedArticleSet>" + "".join(_article_xml(p) for p in range(1, 51)) + "</PubmedArticleSet>").encode()
+
+    class _Trickle(io.RawIOBase):
+        def __init__(self):
+            self.pos = 0
+
+        def readable(self):
+            return True
+
+        def readinto(self, buf):
+            n = min(len(buf), 256, len(xml) - self.pos)
+            buf[:n] = xml[self.pos : self.pos + n]
+            self.pos += n
+            return n
+
+    source = _Trickle()
+    first = next(pubmed._iter_articles(source, "T"))
+
+    assert first.title == "Article 1"
+    assert source.pos < len(xml)
+
+
+def test_two_phase_fetches_only_shortlist(monkeypatch):
+    """Test that two-phase mode EFetches only the provisional leaders."""
+    fake = _install(monkeypatch, list(range(1, 13)))
+
+    papers = list(pubmed.fetch_pubmed("tau", "T", two_phase_top_k=2, exclude=["Article 9"]))
+
+    # Odd PMIDs carry a DOI bonus and multiples of 3 an abstract bonus:
+    # 3 scores highest, then 6 and 12, then 1/5/7/11; 9 is excluded
+    assert [p.pmid for p in papers] == ["1", "3", "6", "12"]
+    urls = [url for url, _ in fake.requests]
+    assert urls == [pubmed.ESEARCH_URL, pubmed.ESUMMARY_URL, pubmed.EFETCH_URL]
+    (efetch,) = [params for url, params in fake.requests if url == pubmed.EFETCH_URL]
+    assert efetch["id"] == "1,3,6,12"
+
+
+def test_two_phase_honours_known_pmids(monkeypatch):
+    """Test that known PMIDs are skipped before ESummary."""
+    fake = _install(monkeypatch, list(range(1, 7)))
+
+    papers = list(
+        pubmed.fetch_pubmed(
+            "tau", "T", two_phase_top_k=5, known_papers=lambda ids: {i: _stored(i) for i in ("3", "6")}
+        )
+    )
+
+    assert [p.pmid for p in papers] == ["3", "6", "1", "2", "4", "5"]
+    (esummary,) = [params for url, params in fake.requests if url == pubmed.ESUMMARY_URL]
+    assert esummary["id"] == "1,2,4,5"
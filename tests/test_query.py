@@ -0,0 +1,70 @@
+"""Tests for boolean query parsing and multi-topic routing."""
+
+import random
+
+from litscout.sources.query import QueryRouter, matches_query, parse_query_groups
+
+
+def test_parse_query_groups():
+    """Test parsing AND-of-OR queries with phrases and wildcards."""
+    groups = parse_query_groups('("cell painting" OR phenomic*) AND (iPSC OR organoid)')
+    assert groups == [["cell painting", "phenomic*"], ["ipsc", "organoid"]]
+
+
+def test_matches_query_and_or_logic():
+    """Test that all groups must match and any term within a group suffices."""
+    groups = parse_query_groups("(tau OR amyloid) AND microglia")
+    assert matches_query("Tau pathology in microglia", groups)
+    assert not matches_query("Tau pathology in neurons", groups)
+    assert matches_query("anything", [])
+
+
+def test_router_returns_matching_topics():
+    """Test that one scan returns every topic whose query is satisfied."""
+    router = QueryRouter(
+        {
+            "tau": "(tau OR tauopathy) AND microglia",
+            "organoids": '"brain organoid*" OR assembloid',
+            "painting": '"cell painting"',
+        }
+    )
+    text = "Microglia in brain organoids model tauopathy"
+    assert router.match(text) == {"tau", "organoids"}
+    assert "tau" in router
+    assert "missing" not in router
+
+
+def test_router_finds_overlapping_terms():
+    """Test that terms sharing a start position or overlapping all match."""
+    router = QueryRouter({"a": "tauopathy", "b": "tau", "c": "opathy", "d": "neuro*"})
+    assert router.match("primary tauopathy in neurons") == {"a", "b", "c", "d"}
+    assert router.match("tau alone") == {"b"}
+
+
+def test_router_caches_by_key():
+    """Test that route() reuses the result for a known record key."""
+    router = QueryRouter({"t": "tau"})
+    assert router.route("doi:1", "tau") == {"t"}
+    # Same key, different text: cached result is returned
+    assert router.route("doi:1", "nothing") == {"t"}
+
+
+def test_router_agrees_with_matches_query():
+    """Test that the router has the same semantics as per-topic matching."""
+    rng = random.Random(0)
+    vocab = ["tau", "taup", "tauopathy", "glia", "microglia", "neuro", "neuron",
+             "cell painting", "organoid", "ipsc", "amyloid", "app"]
+    queries = {}
+    for i in range(20):
+        groups = []
+        for _ in range(rng.randint(1, 3)):
+            terms = [rng.choice(vocab) + ("*" if rng.random() < 0.3 else "") for _ in range(3)]
+            terms = [f'"{t}"' if " " in t else t for t in terms]
+            groups.append("(" + " OR ".join(terms) + ")")
+        queries[f"t{i}"] = " AND ".join(groups)
+    router = QueryRouter(queries)
+
+    for _ in range(200):
+        text = " ".join(rng.choice(vocab + ["x", "the", "y"]) for _ in range(8))
+        expected = {t for t, q in queries.items() if matches_query(text, parse_query_groups(q))}
+        assert router.match(text) == expected, text
@@ -0,0 +1,41 @@
+"""Tests for per-host rate limiting."""
+
+import time
+
+from litscout import ratelimit
+from litscout.ratelimit import TokenBucket
+
+
+def test_token_bucket_first_call_does_not_wait():
+    """Test that a fresh bucket allows one request immediately."""
+    bucket = TokenBucket(rate=1.0)
+    assert bucket.acquire() == 0.0
+
+
+def test_token_bucket_paces_requests():
+    """Test that requests beyond capacity are spaced by the rate."""
+    bucket = TokenBucket(rate=20.0)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+    # First token is free, the remaining four take 1/20 s each
+    assert elapsed >= 4 / 20 * 0.9
+
+
+def test_limiters_are_shared_per_host():
+    """Test that URLs on the same host share one limiter."""
+    a = ratelimit.get_limiter("https://export.arxiv.org/api/query?x=1")
+    b = ratelimit.get_limiter("https://export.arxiv.org/oai2")
+    c = ratelimit.get_limiter("https://api.biorxiv.org/details")
+    assert a is b
+    assert a is not c
+    assert a.rate == ratelimit.HOST_LIMITS["export.arxiv.org"]
+
+
+def test_ncbi_limit_with_api_key(monkeypatch):
+    """Test that an NCBI API key raises the E-utilities limit."""
+    monkeypatch.setenv("NCBI_API_KEY", "abc")
+    assert ratelimit.host_limit("eutils.ncbi.nlm.nih.gov") == ratelimit.NCBI_API_KEY_LIMIT
+    monkeypatch.delenv("NCBI_API_KEY")
+    assert ratelimit.host_limit("eutils.ncbi.nlm.nih.gov") == 3.0
@@ -0,0 +1,376 @@
+"""Tests for concurrent, rate-limited and batched summarization."""
+
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import anthropic
+import pytest
+
+from litscout import __main__ as cli
+from litscout import summarize
+from litscout.db import Database, Paper
+from litscout.sources.collect_trials import ClinicalTrial
+from litscout.summarize import RateLimitTracker, summarize_papers
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    """Give each test its own summary cache and usage totals."""
+    monkeypatch.setenv("LITSCOUT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(summarize, "_cache", None)
+    summarize.reset_usage()
+    yield
+    summarize.reset_usage()
+
+
+def _paper(n: int) -> Paper:
+    return Paper(
+        id=f"p{n}",
+        doi=None,
+        arxiv_id=None,
+        title=f"Paper {n}",
+        authors="",
+        abstract="Abstract",
+        url="",
+        source="arxiv",
+        published_date="2024",
+        topic="T",
+        first_seen="2024-01-01T00:00:00",
+    )
+
+
+class _FakeRaw:
+    def __init__(self, text: str, headers: dict, usage: SimpleNamespace | None = None):
+        self.headers = headers
+        self._text = text
+        self._usage = usage or SimpleNamespace(input_tokens=10, output_tokens=5)
+
+    def parse(self):
+        return SimpleNamespace(content=[SimpleNamespace(text=self._text)], usage=self._usage)
+
+
+class _FakeClient:
+    """Mimics client.messages.with_raw_response.create with a fixed latency."""
+
+    def __init__(self, latency: float = 0.0, headers: dict | None = None):
+        self.latency = latency
+        self.headers = headers or {}
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self.messages = self
+        self.with_raw_response = self
+
+    def create(self, model, max_tokens, messages, system=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.latency)
+        with self._lock:
+            self.active -= 1
+        title = messages[0]["content"].split("Title: ")[1].split("\n")[0]
+        return _FakeRaw(f"Summary of {title}", self.headers)
+
+
+def test_summarize_papers_runs_concurrently():
+    """Test that summaries come back for every paper from overlapping requests."""
+    client = _FakeClient(latency=0.05)
+    papers = [_paper(n) for n in range(8)]
+
+    start = time.monotonic()
+    results = {
+        paper.id: summary
+        for paper, summary in summarize_papers(
+            papers, "Prompt", max_workers=4, client=client, tracker=RateLimitTracker()
+        )
+    }
+    elapsed = time.monotonic() - start
+
+    assert results == {p.id: f"Summary of {p.title}" for p in papers}
+    assert client.peak == 4
+    assert elapsed < 8 * 0.05
+
+
+def test_summarize_papers_reports_failures():
+    """Test that a failing paper is passed to on_error and the rest complete."""
+
+    class _Failing(_FakeClient):
+        def create(self, model, max_tokens, messages, system=None):
+            if "Paper 1" in messages[0]["content"]:
+                raise RuntimeError("boom")
+            return super().create(model, max_tokens, messages, system)
+
+    errors = []
+    results = list(
+        summarize_papers(
+            [_paper(n) for n in range(3)],
+            "Prompt",
+            client=_Failing(),
+            tracker=RateLimitTracker(),
+            on_error=lambda paper, e: errors.append((paper.id, str(e))),
+        )
+    )
+
+    assert sorted(p.id for p, _ in results) == ["p0", "p2"]
+    assert errors == [("p1", "boom")]
+
+
+def test_template_is_a_cached_system_block(monkeypatch):
+    """Test that the template is sent once as a cached prefix and cache hits are counted."""
+    sent = []
+
+    class _Caching(_FakeClient):
+        def create(self, model, max_tokens, messages, system=None):
+            sent.append((system, messages))
+            usage = SimpleNamespace(
+                input_tokens=50,
+                cache_creation_input_tokens=0 if len(sent) > 1 else 1200,
+                cache_read_input_tokens=1200 if len(sent) > 1 else 0,
+                output_tokens=100,
+            )
+            return _FakeRaw("Summary", {}, usage)
+
+    client = _Caching()
+    for n in range(3):
+        summarize.summarize_paper(_paper(n), "Template", client=client, tracker=RateLimitTracker())
+
+    assert {s[0]["text"] for s, _ in sent} == {"Template"}
+    assert all(s[0]["cache_control"] == {"type": "ephemeral"} for s, _ in sent)
+    assert all("Template" not in m[0]["content"] for _, m in sent)
+    usage = summarize.get_usage()
+    assert (usage.requests, usage.cache_read_input_tokens, usage.cache_creation_input_tokens) == (3, 2400, 1200)
+    assert "2400 tokens read (64% of input)" in summarize.format_usage()[1]
+
+
+def test_identical_request_is_served_from_cache():
+    """Test that the same content under a new paper ID is not paid for twice."""
+    client = _FakeClient()
+    calls = []
+    original = client.create
+    client.create = lambda **kw: (calls.append(kw), original(**kw))[1]
+
+    first = summarize.summarize_paper(_paper(1), "Template", client=client)
+    renamed = replace(_paper(1), id="doi:10.1/renamed", topic="Other")
+    second = summarize.summarize_paper(renamed, "Template", client=client)
+    changed = summarize.summarize_paper(_paper(1), "Another template", client=client)
+
+    assert first == second == changed == "Summary of Paper 1"
+    assert len(calls) == 2
+    assert summarize.get_usage().cached_summaries == 1
+
+
+def test_failed_request_is_not_cached():
+    """Test that API errors are not stored as cached summaries."""
+
+    class _Unreachable(_FakeClient):
+        def create(self, model, max_tokens, messages, system=None):
+            raise anthropic.APIConnectionError(request=None)
+
+    with pytest.raises(anthropic.APIConnectionError):
+        summarize.summarize_paper(_paper(1), "Template", client=_Unreachable())
+    retried = summarize.summarize_paper(_paper(1), "Template", client=_FakeClient())
+
+    assert retried == "Summary of Paper 1"
+
+
+def test_tracker_waits_for_reset_when_budget_exhausted(monkeypatch):
+    """Test that an exhausted request budget blocks until its reset time."""
+    tracker = RateLimitTracker()
+    reset = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+    tracker.update(
+        {
+            "anthropic-ratelimit-requests-remaining": "1",
+            "anthropic-ratelimit-requests-reset": reset,
+        }
+    )
+    sleeps = []
+    clock = [time.monotonic()]
+    monkeypatch.setattr(summarize.time, "sleep", lambda s: (sleeps.append(s), clock.__setitem__(0, clock[0] + s)))
+    monkeypatch.setattr(summarize.time, "monotonic", lambda: clock[0])
+
+    tracker.acquire(100, 100)  # uses the last request
+    assert sleeps == []
+    tracker.acquire(100, 100)  # must wait for the window to reset
+    assert len(sleeps) == 1 and 29 < sleeps[0] <= 30
+
+
+def test_tracker_waits_for_token_budget(monkeypatch):
+    """Test that a request larger than the remaining token budget waits."""
+    tracker = RateLimitTracker()
+    reset = (datetime.now(timezone.utc) + timedelta(seconds=10)).isoformat()
+    tracker.update(
+        {
+            "anthropic-ratelimit-input-tokens-remaining": "500",
+            "anthropic-ratelimit-input-tokens-reset": reset,
+            "anthropic-ratelimit-requests-remaining": "50",
+        }
+    )
+    sleeps = []
+    clock = [time.monotonic()]
+    monkeypatch.setattr(summarize.time, "sleep", lambda s: (sleeps.append(s), clock.__setitem__(0, clock[0] + s)))
+    monkeypatch.setattr(summarize.time, "monotonic", lambda: clock[0])
+
+    tracker.acquire(400, 100)
+    tracker.acquire(400, 100)
+
+    assert len(sleeps) == 1 and 9 < sleeps[0] <= 10
+
+
+def test_tracker_honours_retry_after(monkeypatch):
+    """Test that a retry-after header pauses new requests."""
+    tracker = RateLimitTracker()
+    tracker.update({"retry-after": "5"})
+    sleeps = []
+    clock = [time.monotonic()]
+    monkeypatch.setattr(summarize.time, "sleep", lambda s: (sleeps.append(s), clock.__setitem__(0, clock[0] + s)))
+    monkeypatch.setattr(summarize.time, "monotonic", lambda: clock[0])
+
+    tracker.acquire(1, 1)
+
+    assert len(sleeps) == 1 and 4.9 < sleeps[0] <= 5
+
+
+class _FakeBatches:
+    """Mock Message Batches endpoint: batches end after a set number of polls."""
+
+    def __init__(self, polls_until_ended: int = 1, fail: set[str] | None = None):
+        self.polls_until_ended = polls_until_ended
+        self.fail = fail or set()
+        self.batches: dict[str, list[dict]] = {}
+        self.polls: dict[str, int] = {}
+
+    def create(self, requests):
+        batch_id = f"msgbatch_{len(self.batches) + 1}"
+        self.batches[batch_id] = requests
+        self.polls[batch_id] = 0
+        return SimpleNamespace(id=batch_id, processing_status="in_progress")
+
+    def retrieve(self, batch_id):
+        self.polls[batch_id] += 1
+        ended = self.polls[batch_id] >= self.polls_until_ended
+        return SimpleNamespace(id=batch_id, processing_status="ended" if ended else "in_progress")
+
+    def results(self, batch_id):
+        for request in self.batches[batch_id]:
+            content = request["params"]["messages"][0]["content"]
+            if any(marker in content for marker in self.fail):
+                result = SimpleNamespace(type="errored")
+            else:
+                title = content.split("Title: ")[1].split("\n")[0]
+                message = SimpleNamespace(
+                    content=[SimpleNamespace(text=f"Batch summary of {title}")],
+                    usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+                )
+                result = SimpleNamespace(type="succeeded", message=message)
+            yield SimpleNamespace(custom_id=request["custom_id"], result=result)
+
+
+def _batch_client(**kwargs) -> SimpleNamespace:
+    return SimpleNamespace(messages=SimpleNamespace(batches=_FakeBatches(**kwargs)))
+
+
+def _trial(nct_id: str) -> ClinicalTrial:
+    return ClinicalTrial(
+        id=nct_id,
+        nct_id=nct_id,
+        title=f"Trial {nct_id}",
+        phase="PHASE2",
+        status="RECRUITING",
+        conditions=[],
+        interventions=[],
+        sponsor="Sponsor",
+        collaborators=[],
+        enrollment=None,
+        study_start_date="2024-01",
+        primary_completion_date=None,
+        brief_summary="",
+        url="",
+        last_update_posted="2024-06-01",
+    )
+
+
+def test_batch_summarize_writes_results_back(tmp_path):
+    """Test that papers and trials are summarized in one batch and stored once it ends."""
+    db = Database(tmp_path / "litscout.db")
+    papers = [_paper(n) for n in range(3)]
+    db.add_papers(papers)
+    trials = [_trial("NCT001")]
+    client = _batch_client(fail={"Paper 2"})
+    log = cli.Logger(cli.QUIET)
+
+    cli.batch_summarize_all(
+        db, papers + [replace(papers[0], topic="B")], trials, "Prompt", log, client=client
+    )
+
+    (requests,) = client.messages.batches.batches.values()
+    assert len(requests) == 4
+    assert requests[0]["params"]["system"][0]["cache_control"] == {"type": "ephemeral"}
+    # Submitting does not wait for the batch
+    assert client.messages.batches.polls == {"msgbatch_1": 0}
+    assert db.pending_summary_batches() == ["msgbatch_1"]
+
+    cli.collect_summary_batches(db, log, client=client)
+
+    assert db.get_paper("p0").summary == "Batch summary of Paper 0"
+    assert db.get_paper("p1").summary == "Batch summary of Paper 1"
+    assert db.get_paper("p2").summary is None
+    assert [p.id for p in db.pending_summary_papers(due_only=False)] == ["p2"]
+    assert db.trial_summaries(["NCT001"]) == {"NCT001": "Batch summary of Trial NCT001"}
+    assert db.pending_summary_batches() == []
+
+    # A later batch run with the same content is answered from the cache
+    again = [replace(papers[0], id="p0-renamed")]
+    cli.batch_summarize_all(db, again, [], "Prompt", log, client=client)
+    assert again[0].summary == "Batch summary of Paper 0"
+    assert len(client.messages.batches.batches) == 1
+
+
+def test_batch_summarize_resumes_unfinished_batch(tmp_path):
+    """Test that a batch still processing is collected later, not resubmitted."""
+    db = Database(tmp_path / "litscout.db")
+    papers = [_paper(n) for n in range(2)]
+    db.add_papers(papers)
+    client = _batch_client(polls_until_ended=2)
+    log = cli.Logger(cli.QUIET)
+
+    cli.batch_summarize_all(db, papers, [], "Prompt", log, client=client)
+    cli.collect_summary_batches(db, log, client=client)
+    assert db.pending_summary_batches() == ["msgbatch_1"]
+    assert db.get_paper("p0").summary is None
+
+    # Next run selects the same papers again: nothing new is submitted
+    again = [_paper(n) for n in range(2)]
+    cli.batch_summarize_all(db, again, [], "Prompt", log, client=client)
+    cli.collect_summary_batches(db, log, {p.id: [p] for p in again}, client=client)
+
+    assert list(client.messages.batches.batches) == ["msgbatch_1"]
+    assert [p.summary for p in again] == ["Batch summary of Paper 0", "Batch summary of Paper 1"]
+    assert db.pending_summary_batches() == []
+
+
+def test_run_collects_batches_without_batch_mode(tmp_path, monkeypatch):
+    """Test that a plain run writes back a batch submitted by an earlier run."""
+    from litscout import summarize
+
+    config_path = tmp_path / "config" / "config.yaml"
+    config_path.parent.mkdir()
+    config_path.write_text(
+        'output_dir: reports\ntopics:\n  - name: "T"\n    query: "tau"\n'
+        "    media:\n      podcasts: {enabled: false}\n      youtube: {enabled: false}\n"
+    )
+    db = Database(config_path.parent / "litscout.db")
+    db.add_papers([_paper(0)])
+    client = _batch_client()
+    cli.batch_summarize_all(db, [_paper(0)], [], "Prompt", cli.Logger(cli.QUIET), client=client)
+    db.close()
+    monkeypatch.setattr(summarize, "get_client", lambda: client)
+    monkeypatch.setattr(cli, "run_fetch_jobs", lambda *args, **kwargs: [])
+
+    assert cli.cmd_run(str(config_path), dry_run=True, no_summarize=True, verbosity=cli.QUIET) == 0
+
+    db = Database(config_path.parent / "litscout.db")
+    assert db.get_paper("p0").summary == "Batch summary of Paper 0"
+    assert db.pending_summary_batches() == []